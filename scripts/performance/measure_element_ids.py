@@ -0,0 +1,73 @@
+"""Micro-benchmark of deterministic element-ID hashing and parent-id assignment.
+
+Times `assign_and_map_hash_ids()` followed by `set_element_hierarchy()`, two passes over the
+elements, against the fused `assign_hash_ids_and_hierarchy()` on the same elements, and checks
+that both give the same IDs and parent-ids.
+
+Usage: `python -m scripts.performance.measure_element_ids [count]`
+"""
+
+import copy
+import gc
+import sys
+import time
+
+from unstructured.documents.elements import (
+    Element,
+    ElementMetadata,
+    ListItem,
+    NarrativeText,
+    Title,
+    assign_and_map_hash_ids,
+)
+from unstructured.partition.common.metadata import (
+    assign_hash_ids_and_hierarchy,
+    set_element_hierarchy,
+)
+
+ELEMENTS_PER_PAGE = 40
+
+
+def make_elements(count: int) -> list[Element]:
+    elements: list[Element] = []
+    for i in range(count):
+        metadata = ElementMetadata(filename="report.pdf", page_number=i // ELEMENTS_PER_PAGE + 1)
+        seq_on_page = i % ELEMENTS_PER_PAGE
+        if seq_on_page % 10 == 0:
+            element: Element = Title(f"Section {i}", metadata=metadata)
+        elif seq_on_page % 10 < 4:
+            element = ListItem(f"Item {i}", metadata=metadata)
+        else:
+            element = NarrativeText(f"Paragraph {i} of the report.", metadata=metadata)
+        elements.append(element)
+    return elements
+
+
+def measure(label: str, func, elements: list[Element]) -> list[Element]:
+    # -- collections of the million live elements would otherwise dominate the timings --
+    gc.collect()
+    gc.disable()
+    try:
+        start_time = time.perf_counter()
+        result = func(elements)
+        elapsed = time.perf_counter() - start_time
+    finally:
+        gc.enable()
+    print(f"{label:<50} {elapsed:8.3f} s  {elapsed / len(elements) * 1e6:8.3f} us/element")
+    return result
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    elements = make_elements(count)
+    two_pass = measure(
+        "assign_and_map_hash_ids + set_element_hierarchy",
+        lambda elements: set_element_hierarchy(assign_and_map_hash_ids(elements)),
+        copy.deepcopy(elements),
+    )
+    fused = measure("assign_hash_ids_and_hierarchy", assign_hash_ids_and_hierarchy, elements)
+
+    assert [(e.id, e.metadata.parent_id) for e in fused] == [
+        (e.id, e.metadata.parent_id) for e in two_pass
+    ], "fused IDs differ from two-pass IDs"
@@ -0,0 +1,69 @@
+"""Micro-benchmark of `ElementMetadata` memory footprint and field-access cost.
+
+Builds many metadata objects populated like those of a typical partitioned document and reports
+the memory each one takes (values shared between instances are not counted) along with the
+average time of common operations on them.
+
+Usage: `python -m scripts.performance.measure_element_metadata [count]`
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from unstructured.documents.elements import ElementMetadata
+
+LANGUAGES = ["eng"]
+
+
+def make_metadata(page_number: int) -> ElementMetadata:
+    metadata = ElementMetadata(
+        file_directory="documents",
+        filename="report.pdf",
+        filetype="application/pdf",
+        languages=LANGUAGES,
+        last_modified="2024-01-01T00:00:00",
+        page_number=page_number,
+    )
+    metadata.parent_id = "0a9be5b2a3b2f0e7c6d5e4f3a2b1c0d9"
+    metadata.category_depth = 1
+    return metadata
+
+
+def measure(label: str, func, iterations: int) -> None:
+    func()
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    average_time = (time.perf_counter() - start_time) / iterations
+    print(f"{label:<40} {average_time * 1e6:10.3f} us")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    gc.collect()
+    tracemalloc.start()
+    metadatas = [make_metadata(i % 50 + 1) for i in range(count)]
+    allocated_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # -- exclude the list holding the instances --
+    print(
+        f"{'bytes per instance':<40} {(allocated_bytes - sys.getsizeof(metadatas)) / count:10.1f}"
+    )
+
+    metadata, other = metadatas[0], metadatas[1]
+    metadata_dict = metadata.to_dict()
+    iterations = max(count // 10, 1)
+
+    measure("construct", lambda: make_metadata(1), iterations)
+    measure("read populated field", lambda: metadata.page_number, iterations)
+    measure("read unpopulated known field", lambda: metadata.coordinates, iterations)
+    measure("assign field", lambda: setattr(metadata, "page_number", 2), iterations)
+    measure(".fields", lambda: metadata.fields, iterations)
+    measure("==", lambda: metadata == other, iterations)
+    measure(".to_dict()", metadata.to_dict, iterations)
+    measure(
+        "ElementMetadata.from_dict()", lambda: ElementMetadata.from_dict(metadata_dict), iterations
+    )
@@ -114,6 +114,7 @@ setup(
         "md": markdown_reqs,
         "odt": odt_reqs,
         "org": org_reqs,
+        "parquet": load_requirements("requirements/extra-parquet.in"),
         "pdf": pdf_reqs,
         "ppt": ppt_reqs,
         "pptx": pptx_reqs,
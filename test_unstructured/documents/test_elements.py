@@ -8,7 +8,9 @@ import copy
 import io
 import json
 import pathlib
+import pickle
 from functools import partial
+from typing import Callable
 
 import pytest
 
@@ -30,6 +32,7 @@ from unstructured.documents.elements import (
     Text,
     Title,
     assign_and_map_hash_ids,
+    process_metadata,
 )
 from unstructured.partition.json import partition_json
 
@@ -301,34 +304,34 @@ class DescribeElementMetadata:
 
     def it_returns_the_value_of_an_attribute_it_has(self):
         meta = ElementMetadata(url="https://google.com")
-        assert "url" in meta.__dict__
+        assert "url" in meta.fields
         assert meta.url == "https://google.com"
 
     def and_it_returns_None_for_a_known_attribute_it_does_not_have(self):
         meta = ElementMetadata()
-        assert "url" not in meta.__dict__
+        assert "url" not in meta.fields
         assert meta.url is None
 
     def but_it_raises_AttributeError_for_an_unknown_attribute_it_does_not_have(self):
         meta = ElementMetadata()
-        assert "coefficient" not in meta.__dict__
+        assert "coefficient" not in meta.fields
         with pytest.raises(AttributeError, match="object has no attribute 'coefficient'"):
             meta.coefficient
 
     def it_stores_a_non_None_field_value_when_assigned(self):
         meta = ElementMetadata()
-        assert "file_directory" not in meta.__dict__
+        assert "file_directory" not in meta.fields
         meta.file_directory = "tmp/"
-        assert "file_directory" in meta.__dict__
+        assert "file_directory" in meta.fields
         assert meta.file_directory == "tmp/"
 
     def it_removes_a_field_when_None_is_assigned_to_it(self):
         meta = ElementMetadata(file_directory="tmp/")
-        assert "file_directory" in meta.__dict__
+        assert "file_directory" in meta.fields
         assert meta.file_directory == "tmp/"
 
         meta.file_directory = None
-        assert "file_directory" not in meta.__dict__
+        assert "file_directory" not in meta.fields
         assert meta.file_directory is None
 
     # -- It can serialize itself to a dict -------------------------------------------------------
@@ -465,7 +468,7 @@ class DescribeElementMetadata:
 
         # -- known fields absent from dict report None but are not present in meta --
         assert meta.file_directory is None
-        assert "file_directory" not in meta.__dict__
+        assert "file_directory" not in meta.fields
 
         # -- non-known fields present in dict are present in meta (we have no way to tell whether
         # -- they are "ad-hoc" or not because we lack indication of user-intent)
@@ -490,7 +493,7 @@ class DescribeElementMetadata:
     def it_allows_an_end_user_to_add_an_arbitrary_field(self):
         meta = ElementMetadata()
         meta.foobar = 7
-        assert "foobar" in meta.__dict__
+        assert "foobar" in meta.fields
         assert meta.foobar == 7
 
     def and_fields_so_added_appear_in_the_metadata_JSON(self):
@@ -501,14 +504,64 @@ class DescribeElementMetadata:
     def and_it_removes_an_end_user_field_when_it_is_assigned_None(self):
         meta = ElementMetadata()
         meta.foobar = 7
-        assert "foobar" in meta.__dict__
+        assert "foobar" in meta.fields
         meta.foobar = None
-        assert "foobar" not in meta.__dict__
+        assert "foobar" not in meta.fields
         with pytest.raises(
             AttributeError, match="'ElementMetadata' object has no attribute 'foobar'"
         ):
             meta.foobar
 
+    # -- It keeps a compact representation ------------------------------------------------------
+
+    def it_does_not_have_a_per_instance_dict(self):
+        meta = ElementMetadata(filename="memo.docx", page_number=1, url="https://google.com")
+        meta.foobar = 7
+
+        assert not hasattr(meta, "__dict__")
+        assert meta.fields == {
+            "filename": "memo.docx",
+            "page_number": 1,
+            "url": "https://google.com",
+            "foobar": 7,
+        }
+
+    @pytest.mark.parametrize("copy_fn", [copy.copy, copy.deepcopy])
+    def and_its_copies_do_not_share_field_storage_with_the_original(
+        self, copy_fn: Callable[[ElementMetadata], ElementMetadata]
+    ):
+        meta = ElementMetadata(filename="memo.docx", url="https://google.com")
+        meta.foobar = 7
+
+        meta_copy = copy_fn(meta)
+        meta_copy.page_number = 2
+        meta_copy.url = None
+        meta_copy.quotient = 1.4
+
+        assert meta_copy.fields == {
+            "filename": "memo.docx",
+            "page_number": 2,
+            "foobar": 7,
+            "quotient": 1.4,
+        }
+        assert meta.fields == {"filename": "memo.docx", "url": "https://google.com", "foobar": 7}
+
+    def and_it_survives_a_pickle_round_trip(self):
+        meta = ElementMetadata(category_depth=1, languages=["eng"], subject="Re: memo")
+        meta.foobar = 7
+
+        assert pickle.loads(pickle.dumps(meta)) == meta
+
+    def and_it_reports_None_for_known_fields_a_subclass_initializer_did_not_assign(self):
+        class PartialMetadata(ElementMetadata):
+            def __init__(self, url: str):
+                self.url = url
+
+        meta = PartialMetadata(url="https://google.com")
+
+        assert meta.page_number is None
+        assert meta.fields == {"url": "https://google.com"}
+
     # -- It can update itself from another instance ----------------------------------------------
 
     def it_can_update_itself_from_another_instance(self):
@@ -593,7 +646,7 @@ class DescribeElementMetadata:
         other = NotElementMetadata()
 
         # -- all the "fields" are the same --
-        assert meta.__dict__ == other.__dict__
+        assert meta.fields == other.__dict__
         # -- but it is rejected solely because its type is different --
         assert meta != other
 
@@ -724,6 +777,20 @@ def test_hash_ids_are_deterministic():
     ]
 
 
+@pytest.mark.parametrize("unique_element_ids", [False, True])
+def test_process_metadata_assigns_parent_ids_whether_or_not_ids_are_hashed(
+    unique_element_ids: bool,
+):
+    @process_metadata()
+    def partition(unique_element_ids: bool = False) -> list[Element]:
+        return [Title("Title"), Text("Body")]
+
+    title, body = partition(unique_element_ids=unique_element_ids)
+
+    assert len(title.id) == (36 if unique_element_ids else 32)
+    assert body.metadata.parent_id == title.id
+
+
 @pytest.mark.parametrize(
     ("text", "sequence_number", "filename", "page_number", "expected_hash"),
     [
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
 from unstructured.chunking.basic import chunk_elements
 from unstructured.chunking.title import chunk_by_title
@@ -13,12 +14,16 @@ from unstructured.documents.ontology import (
     Paragraph,
     Section,
     Table,
+    TableBody,
+    TableCell,
+    TableRow,
 )
 from unstructured.embed.openai import OpenAIEmbeddingConfig, OpenAIEmbeddingEncoder
-from unstructured.partition.html import partition_html
+from unstructured.partition.html import partition_html, transformations
 from unstructured.partition.html.transformations import (
     ontology_to_unstructured_elements,
     parse_html_to_ontology,
+    unstructured_elements_to_ontology,
 )
 from unstructured.partition.json import partition_json
 from unstructured.staging.base import elements_from_json
@@ -336,3 +341,74 @@ def test_inline_elements_are_on_many_depths():
     assert text1.text == "Hyperlink1 Paragraph1"
     assert text2.text == "Hyperlink2 Hyperlink3"
     assert text3.text == "Paragraph2 Hyperlink4"
+
+
+def test_to_html_memoized_matches_to_html_and_fills_cache_for_every_node():
+    cell = TableCell(text="Cell")
+    row = TableRow(children=[cell])
+    table = Table(children=[TableBody(children=[row])])
+    paragraph = Paragraph(text="Paragraph", children=[Hyperlink(text="Link")])
+    section = Section(children=[paragraph, table])
+
+    html_cache: dict[int, str] = {}
+    html = section.to_html_memoized(html_cache)
+
+    assert html == section.to_html()
+    assert html_cache[id(table)] == table.to_html()
+    assert html_cache[id(row)] == row.to_html()
+    assert html_cache[id(cell)] == cell.to_html()
+    assert section.to_text(html_cache=html_cache) == section.to_text()
+
+
+def test_html_pruned_in_single_parse_keeps_sibling_text_together():
+    # language=HTML
+    html_code = """
+    <div class="Page">
+        <p class="Paragraph">Before<div><span></span></div> after</p>
+    </div>
+    """
+    ontology = parse_html_to_ontology(html_code)
+
+    paragraph = ontology.children[0]
+    assert paragraph.children == []
+    assert paragraph.text == "Before after"
+
+
+def test_inline_merging_and_reverse_conversion_reuse_the_ontology_without_parsing_html(
+    mocker: MockerFixture,
+):
+    ontology = Document(
+        children=[
+            Page(
+                children=[
+                    Hyperlink(text="Hyperlink1"),
+                    Paragraph(text="Paragraph1"),
+                    Table(
+                        children=[TableBody(children=[TableRow(children=[TableCell(text="1")])])]
+                    ),
+                ],
+            )
+        ]
+    )
+    expected_html = unstructured_elements_to_ontology(
+        ontology_to_unstructured_elements(ontology)
+    ).to_html()
+    beautiful_soup_ = mocker.spy(transformations, "BeautifulSoup")
+
+    unstructured_elements = ontology_to_unstructured_elements(ontology)
+    round_tripped = unstructured_elements_to_ontology(unstructured_elements)
+
+    beautiful_soup_.assert_not_called()
+    page, text, table = unstructured_elements
+    assert text.text == "Hyperlink1 Paragraph1"
+    assert round_tripped.to_html() == expected_html
+
+
+def test_reverse_conversion_parses_text_as_html_changed_after_conversion():
+    ontology = Document(children=[Page(children=[Paragraph(text="Paragraph1")])])
+    page, paragraph = ontology_to_unstructured_elements(ontology)
+    paragraph.metadata.text_as_html = '<p class="Paragraph">Edited</p>'
+
+    round_tripped = unstructured_elements_to_ontology([page, paragraph])
+
+    assert round_tripped.children[0].children[0].text == "Edited"
@@ -1,3 +1,5 @@
+import numpy as np
+
 from unstructured.documents.elements import Text
 from unstructured.embed.openai import OpenAIEmbeddingConfig, OpenAIEmbeddingEncoder
 
@@ -17,3 +19,36 @@ def test_embed_documents_does_not_break_element_to_dict(mocker):
     assert len(elements) == 2
     assert elements[0].to_dict()["text"] == "This is sentence 1"
     assert elements[1].to_dict()["text"] == "This is sentence 2"
+
+
+def test_embed_documents_stores_embeddings_as_float32_views_of_one_batch_matrix(mocker):
+    mock_client = mocker.MagicMock()
+    mock_client.embed_documents.return_value = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+    mocker.patch.object(OpenAIEmbeddingConfig, "get_client", return_value=mock_client)
+
+    encoder = OpenAIEmbeddingEncoder(config=OpenAIEmbeddingConfig(api_key="api_key"))
+    elements = encoder.embed_documents(
+        elements=[Text("This is sentence 1"), Text("This is sentence 2")],
+    )
+
+    e1, e2 = (e.embeddings for e in elements)
+    assert e1.dtype == np.float32
+    assert e1.base is e2.base
+    assert elements[1].to_dict()["embeddings"] == np.float32([0.4, 0.5, 0.6]).tolist()
+
+
+def test_embed_documents_gives_each_element_its_own_array_when_batch_is_ragged(mocker):
+    mock_client = mocker.MagicMock()
+    mock_client.embed_documents.return_value = [[0.1, 0.2, 0.3], [0.4, 0.5]]
+    mocker.patch.object(OpenAIEmbeddingConfig, "get_client", return_value=mock_client)
+
+    encoder = OpenAIEmbeddingEncoder(config=OpenAIEmbeddingConfig(api_key="api_key"))
+    elements = encoder.embed_documents(
+        elements=[Text("This is sentence 1"), Text("This is sentence 2")],
+    )
+
+    assert [e.embeddings.dtype for e in elements] == [np.float32, np.float32]
+    assert [e.to_dict()["embeddings"] for e in elements] == [
+        np.float32([0.1, 0.2, 0.3]).tolist(),
+        np.float32([0.4, 0.5]).tolist(),
+    ]
@@ -0,0 +1,63 @@
+"""Test suite for `unstructured.file_utils.encoding`."""
+
+from __future__ import annotations
+
+import codecs
+import io
+
+import pytest
+from chardet.universaldetector import UniversalDetector
+from pytest_mock import MockerFixture
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.file_utils import encoding
+from unstructured.file_utils.encoding import detect_file_encoding
+
+
+@pytest.mark.parametrize(
+    ("byte_data", "expected_encoding", "expected_text"),
+    [
+        (codecs.BOM_UTF8 + "Über".encode(), "utf-8-sig", "Über"),
+        (codecs.BOM_UTF16_LE + "Über".encode("utf-16-le"), "utf-16", "Über"),
+        (codecs.BOM_UTF32_LE + "Über".encode("utf-32-le"), "utf-32", "Über"),
+        (b"plain ascii", "ascii", "plain ascii"),
+        ("Über".encode(), "utf-8", "Über"),
+    ],
+)
+def test_detect_file_encoding_recognizes_boms_and_utf_8_without_chardet(
+    byte_data: bytes, expected_encoding: str, expected_text: str, mocker: MockerFixture
+):
+    feed_ = mocker.spy(UniversalDetector, "feed")
+
+    assert detect_file_encoding(file=byte_data) == (expected_encoding, expected_text)
+    assert feed_.call_count == 0
+
+
+def test_detect_file_encoding_feeds_chardet_no_more_than_the_byte_budget(mocker: MockerFixture):
+    mocker.patch.object(encoding, "ENCODING_DETECTION_MAX_BYTES", 8 * 1024)
+    byte_data = "Größenänderung über Straße. ".encode("iso-8859-1") * 10_000
+    feed_ = mocker.spy(UniversalDetector, "feed")
+
+    _, text = detect_file_encoding(file=io.BytesIO(byte_data))
+
+    assert sum(len(call.args[1]) for call in feed_.call_args_list) <= 8 * 1024
+    assert text == byte_data.decode("iso-8859-1")
+
+
+def test_detect_file_encoding_detects_utf_16_without_a_bom():
+    with open(example_doc_path("fake-text-utf-16-le.txt"), "rb") as f:
+        byte_data = f.read()
+
+    formatted_encoding, text = detect_file_encoding(file=byte_data)
+
+    assert formatted_encoding == "utf-16le"
+    assert text == byte_data.decode("utf-16-le")
+
+
+def test_detect_file_encoding_falls_back_when_bytes_past_the_budget_are_not_in_detected_encoding():
+    byte_data = b"hello world\n" * 6000 + "café résumé\n".encode("iso-8859-1")
+
+    formatted_encoding, text = detect_file_encoding(file=byte_data)
+
+    assert formatted_encoding == "iso-8859-1"
+    assert text == byte_data.decode("iso-8859-1")
@@ -7,6 +7,7 @@ from __future__ import annotations
 import io
 import json
 import os
+import tempfile
 
 import pytest
 
@@ -470,6 +471,17 @@ def test_it_detect_CSV_from_path_and_file_when_content_contains_escaped_commas()
         assert detect_filetype(file=f) == FileType.CSV
 
 
+@pytest.mark.parametrize("max_size", [0, 10 * 1024 * 1024])
+def test_it_detects_file_type_of_a_SpooledTemporaryFile_in_place(max_size: int):
+    # -- max_size=0 rolls the spooled file over to disk on first write --
+    with tempfile.SpooledTemporaryFile(max_size=max_size) as file:
+        with open(example_doc_path("simple.docx"), "rb") as f:
+            file.write(f.read())
+        file.seek(0)
+
+        assert detect_filetype(file=file) == FileType.DOCX  # pyright: ignore[reportArgumentType]
+
+
 def test_it_detects_correct_file_type_for_custom_types(tmp_path):
     file_type = create_file_type("FOO", canonical_mime_type="application/foo", extensions=[".foo"])
     dumb_file = tmp_path / "dumb.foo"
@@ -631,6 +643,15 @@ class Describe_FileTypeDetectionContext:
 
         assert _FileTypeDetectionContext(file=file).extension == ""
 
+    def but_not_from_the_file_descriptor_name_of_a_rolled_over_SpooledTemporaryFile(self):
+        with tempfile.SpooledTemporaryFile(max_size=0) as file:
+            file.write(b"abc")
+            file.rollover()
+
+            ctx = _FileTypeDetectionContext(file=file)  # pyright: ignore[reportArgumentType]
+
+            assert ctx.extension == ""
+
     # -- .file_head ---------------------------------------------
 
     def it_grabs_the_first_8k_bytes_of_the_file_for_use_by_magic(self):
@@ -732,6 +753,23 @@ class Describe_FileTypeDetectionContext:
         with ctx.open() as file:
             assert file.read(38) == b"Iwan Roberts\nRoberts celebrating after"
 
+    def and_it_opens_a_file_path_only_once_and_rewinds_it_on_each_use(self):
+        with _FileTypeDetectionContext(file_path=example_doc_path("norwich-city.txt")) as ctx:
+            with ctx.open() as file:
+                file.read(38)
+            with ctx.open() as file_2:
+                assert file_2 is file
+                assert file_2.read(12) == b"Iwan Roberts"
+
+        assert file.closed
+
+    def but_it_does_not_close_a_file_like_object_provided_by_the_caller(self):
+        with open(example_doc_path("norwich-city.txt"), "rb") as f:
+            with _FileTypeDetectionContext(file=f) as ctx:
+                ctx.text_head
+
+            assert not f.closed
+
     # -- .text_head ---------------------------------------------
 
     def it_grabs_the_first_4k_chars_from_file_path_for_textual_type_differentiation(self):
@@ -926,6 +964,28 @@ class Describe_TextFileDifferentiator:
 
         assert differentiator._is_json is expected_value
 
+    @pytest.mark.parametrize(
+        ("content", "expected_value"),
+        [
+            # -- the head is a well-formed prefix; what follows it is never read --
+            (b'[{"key": "value"}, {"key": 1.5e+3}, {"k', True),
+            (b'{"a": [true, false, null], "b": "\xe2\x80\x9cx\xe2\x80\x9d"', True),
+            (b'[{"key": "value"}, {"key": 12.', True),
+            # -- the head itself is malformed --
+            (b'[{"key": "value"} {"key": "value"}, {"k', False),
+            (b'[{"key": "value"}], [{"key": "value"}, {', False),
+            (b'[{"key": tru, "value"}, {"key": "val', False),
+        ],
+    )
+    def and_it_validates_only_a_bounded_head_of_a_large_file(
+        self, content: bytes, expected_value: bool
+    ):
+        ctx = _FileTypeDetectionContext(file=io.BytesIO(content + b"<<this tail is not JSON>>"))
+        differentiator = _TextFileDifferentiator(ctx)
+
+        with patch("unstructured.file_utils.filetype._JSON_HEAD_MAX_BYTES", len(content)):
+            assert differentiator._is_json is expected_value
+
 
 class Describe_ZipFileDetector:
     """Unit-test suite for `unstructured.file_utils.filetype._ZipFileDetector`."""
@@ -1,3 +1,4 @@
+import concurrent.futures
 import os
 import pathlib
 import shutil
@@ -357,6 +358,45 @@ def test_table_structure_evaluation():
     )
 
 
+def test_text_extraction_evaluation_rescores_only_changed_documents_with_cache_dir(tmp_path: Path):
+    output_dir = tmp_path / "output"
+    source_dir = tmp_path / "source"
+    shutil.copytree(os.path.join(TESTING_FILE_DIR, UNSTRUCTURED_CCT_DIRNAME), output_dir)
+    shutil.copytree(os.path.join(TESTING_FILE_DIR, GOLD_CCT_DIRNAME), source_dir)
+
+    def calculate() -> tuple[pd.DataFrame, int]:
+        from unstructured.metrics import evaluate
+
+        with patch.object(
+            evaluate, "calculate_accuracy", wraps=evaluate.calculate_accuracy
+        ) as calculate_accuracy:
+            df = TextExtractionMetricsCalculator(
+                documents_dir=output_dir,
+                ground_truths_dir=source_dir,
+                document_type="txt",
+                cache_dir=tmp_path / "cache",
+            ).calculate(
+                executor=concurrent.futures.ThreadPoolExecutor(max_workers=1),
+                visualize_progress=False,
+                display_agg_df=False,
+            )
+        return df, calculate_accuracy.call_count
+
+    df, first_run_scored_count = calculate()
+    # -- "IRS-form-1987.pdf.txt" has no ground truth and so fails in both runs --
+    assert len(df) == 3
+    assert first_run_scored_count == 3
+
+    cached_df, second_run_scored_count = calculate()
+    assert second_run_scored_count == 0
+    pd.testing.assert_frame_equal(cached_df, df)
+
+    with open(output_dir / "currency.csv.txt", "a") as f:
+        f.write("\nan extra line")
+    _, third_run_scored_count = calculate()
+    assert third_run_scored_count == 1
+
+
 @pytest.mark.skipif(is_in_docker, reason="Skipping this test in Docker container")
 @pytest.mark.usefixtures("_cleanup_after_test")
 def test_text_extraction_takes_list():
@@ -1,4 +1,8 @@
-from unstructured.metrics.table.table_alignment import TableAlignment
+import difflib
+
+import pytest
+
+from unstructured.metrics.table.table_alignment import TableAlignment, get_best_close_matches
 
 
 def test_get_element_level_alignment_when_no_match():
@@ -12,3 +16,52 @@ def test_get_element_level_alignment_when_no_match():
     assert metrics["row_index_acc"] == 0
     assert metrics["row_content_acc"] == 0
     assert metrics["col_content_acc"] == 0
+
+
+@pytest.mark.parametrize("cutoff", [0.0, 0.1, 0.5, 0.8, 1.0])
+def test_get_best_close_matches_agrees_with_difflib(cutoff):
+    possibilities = ["1,234", "1,243", "total", "totals", "", "b" * 250, "ab" * 130, "1,234"]
+    words = ["1,243", "1,234", "Total", "tota", "", "b" * 249, "ab" * 129 + "a", "zzz", "1,243"]
+
+    assert get_best_close_matches(words, possibilities, cutoff=cutoff) == [
+        (difflib.get_close_matches(word, possibilities, n=1, cutoff=cutoff) or [None])[0]
+        for word in words
+    ]
+
+
+def test_get_best_close_matches_with_no_possibilities():
+    assert get_best_close_matches(["a", "b"], [], cutoff=0.8) == [None, None]
+
+
+def test_get_table_level_alignment_matches_first_of_duplicate_tables():
+    table = [{"row_index": 0, "col_index": 0, "content": "revenue"}]
+    other = [{"row_index": 0, "col_index": 0, "content": "nothing alike"}]
+
+    assert TableAlignment.get_table_level_alignment(
+        [table, [{"content": "@@@"}]], [other, table, table]
+    ) == [1, -1]
+
+
+def test_get_element_level_alignment_cycles_through_duplicate_ground_truth_cells():
+    ground_truth = [
+        {"row_index": 0, "col_index": 0, "content": "x"},
+        {"row_index": 1, "col_index": 0, "content": "x"},
+        {"row_index": 2, "col_index": 0, "content": "y"},
+    ]
+    # -- the third "x" finds both "x" cells used, so all cells are released and it matches the
+    # -- first "x" again; the "y" after that is matched as usual.
+    predicted = [
+        {"row_index": 0, "col_index": 0, "content": "x"},
+        {"row_index": 1, "col_index": 0, "content": "x"},
+        {"row_index": 0, "col_index": 0, "content": "x"},
+        {"row_index": 2, "col_index": 1, "content": "y"},
+    ]
+
+    metrics = TableAlignment.get_element_level_alignment(
+        predicted_table_data=[predicted],
+        ground_truth_table_data=[ground_truth],
+        matched_indices=[0],
+    )
+
+    assert metrics["row_index_acc"] == 1.0
+    assert metrics["col_index_acc"] == 0.75
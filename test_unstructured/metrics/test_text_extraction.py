@@ -294,6 +294,10 @@ def test_calculate_edit_distance_with_various_whitespace_2():
                 "easy-peasy": 1,
             },
         ),
+        (
+            "▪ Größe — «Café» costs 5 € ; s p a c e d ¿ok?",
+            {"größe": 1, "café": 1, "costs": 1, "ok": 1},
+        ),
     ],
 )
 def test_bag_of_words(text, expected):
@@ -0,0 +1,145 @@
+"""Test-suite for `unstructured.partition.common.attachments` module."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Hashable
+
+import pytest
+
+from unstructured.documents.elements import Element, ElementMetadata, Text, Title
+from unstructured.partition.common.attachments import (
+    attachment_content_hash,
+    iter_attachment_elements,
+)
+from unstructured.partition.utils.config import env_config
+
+
+class FakeAttachmentPartitioner:
+    """Partitions "attachments" whose bytes are their text, recording each call."""
+
+    def __init__(self, file_bytes: bytes, file_name: str, calls: list[str], delay: float = 0.0):
+        self._file_bytes = file_bytes
+        self._file_name = file_name
+        self._calls = calls
+        self._delay = delay
+
+    @property
+    def cache_key(self) -> Hashable:
+        return (attachment_content_hash(self._file_bytes), self._file_name)
+
+    def partition(self) -> list[Element]:
+        self._calls.append(self._file_name)
+        time.sleep(self._delay)
+        title = Title(
+            self._file_bytes.decode(),
+            element_id=f"{self._file_name}-title",
+            metadata=ElementMetadata(filename=self._file_name),
+        )
+        text = Text(
+            "body",
+            element_id=f"{self._file_name}-body",
+            metadata=ElementMetadata(filename=self._file_name, parent_id=title.id),
+        )
+        return [title, text]
+
+
+class Describe_iter_attachment_elements:
+    def it_generates_the_elements_of_each_attachment_in_attachment_order(self):
+        calls: list[str] = []
+        partitioners = [
+            FakeAttachmentPartitioner(b"slow", "a.txt", calls, delay=0.05),
+            FakeAttachmentPartitioner(b"fast", "b.txt", calls),
+        ]
+
+        elements = list(iter_attachment_elements(partitioners, max_workers=4))
+
+        assert [(e.text, e.metadata.filename) for e in elements] == [
+            ("slow", "a.txt"),
+            ("body", "a.txt"),
+            ("fast", "b.txt"),
+            ("body", "b.txt"),
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def it_partitions_identical_attachments_only_once(self, max_workers: int):
+        calls: list[str] = []
+        partitioners = [
+            FakeAttachmentPartitioner(b"logo", "logo.png", calls),
+            FakeAttachmentPartitioner(b"report", "report.pdf", calls),
+            FakeAttachmentPartitioner(b"logo", "logo.png", calls),
+        ]
+
+        elements = list(iter_attachment_elements(partitioners, max_workers=max_workers))
+
+        assert sorted(calls) == ["logo.png", "report.pdf"]
+        assert [e.text for e in elements] == ["logo", "body", "report", "body", "logo", "body"]
+        # -- the repeated attachment gets copies, not the same element objects --
+        assert all(copy is not original for copy, original in zip(elements[4:], elements[:2]))
+
+    def but_it_partitions_same_bytes_with_a_different_file_name_separately(self):
+        calls: list[str] = []
+        partitioners = [
+            FakeAttachmentPartitioner(b"logo", "logo.png", calls),
+            FakeAttachmentPartitioner(b"logo", "image001.png", calls),
+        ]
+
+        elements = list(iter_attachment_elements(partitioners))
+
+        assert calls == ["logo.png", "image001.png"]
+        assert [e.metadata.filename for e in elements] == [
+            "logo.png",
+            "logo.png",
+            "image001.png",
+            "image001.png",
+        ]
+
+    def it_gives_copies_fresh_ids_when_unique_element_ids_is_requested(self):
+        calls: list[str] = []
+        partitioners = [
+            FakeAttachmentPartitioner(b"logo", "logo.png", calls),
+            FakeAttachmentPartitioner(b"logo", "logo.png", calls),
+        ]
+
+        title, text, title_copy, text_copy = iter_attachment_elements(
+            partitioners, unique_element_ids=True
+        )
+
+        assert len({title.id, text.id, title_copy.id, text_copy.id}) == 4
+        assert text.metadata.parent_id == title.id
+        assert text_copy.metadata.parent_id == title_copy.id
+
+    def and_it_keeps_ids_of_copies_when_unique_element_ids_is_not_requested(self):
+        calls: list[str] = []
+        partitioners = [
+            FakeAttachmentPartitioner(b"logo", "logo.png", calls),
+            FakeAttachmentPartitioner(b"logo", "logo.png", calls),
+        ]
+
+        title, text, title_copy, text_copy = iter_attachment_elements(partitioners)
+
+        assert (title_copy.id, text_copy.id) == (title.id, text.id)
+        assert text_copy.metadata.parent_id == title.id
+
+    def it_partitions_on_worker_threads_with_the_callers_pinned_settings(self):
+        thread_names: list[str] = []
+        pad_values: list[int] = []
+
+        class RecordingPartitioner(FakeAttachmentPartitioner):
+            def partition(self) -> list[Element]:
+                thread_names.append(threading.current_thread().name)
+                pad_values.append(env_config.snapshot().IMAGE_CROP_PAD)
+                return super().partition()
+
+        calls: list[str] = []
+        partitioners = [
+            RecordingPartitioner(b"a", "a.txt", calls),
+            RecordingPartitioner(b"b", "b.txt", calls),
+        ]
+
+        with env_config.pinned(IMAGE_CROP_PAD=7):
+            list(iter_attachment_elements(partitioners, max_workers=2))
+
+        assert threading.current_thread().name not in thread_names
+        assert pad_values == [7, 7]
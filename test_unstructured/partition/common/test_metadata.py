@@ -22,11 +22,12 @@ from unstructured.documents.elements import (
     NarrativeText,
     Text,
     Title,
+    assign_and_map_hash_ids,
 )
 from unstructured.file_utils.model import FileType
 from unstructured.partition.common.metadata import (
-    _assign_hash_ids,
     apply_metadata,
+    assign_hash_ids_and_hierarchy,
     get_last_modified_date,
     set_element_hierarchy,
 )
@@ -203,6 +204,53 @@ class Describe_set_element_hierarchy:
         ), "FigureCaption should be child of Title 2"
 
 
+class Describe_assign_hash_ids_and_hierarchy:
+    def it_gives_the_same_ids_as_hashing_ids_and_then_setting_the_hierarchy(self):
+        def make_elements() -> list[Element]:
+            elements: list[Element] = [
+                Title("Title", element_id="first", metadata=ElementMetadata(page_number=1)),
+                NarrativeText("Text", metadata=ElementMetadata(page_number=1)),
+                ListItem("Item", metadata=ElementMetadata(page_number=2)),
+                Title("Title", metadata=ElementMetadata(page_number=2, category_depth=1)),
+                # -- a parent-id already set, even to an element further on, is mapped too --
+                NarrativeText("Text", metadata=ElementMetadata(page_number=2, parent_id="last")),
+                NarrativeText("Text", metadata=ElementMetadata(page_number=2, parent_id="foo")),
+                Text("Last", element_id="last", metadata=ElementMetadata(page_number=3)),
+            ]
+            elements[2].metadata.parent_id = "first"
+            return elements
+
+        expected = set_element_hierarchy(assign_and_map_hash_ids(make_elements()))
+
+        elements = assign_hash_ids_and_hierarchy(make_elements())
+
+        assert [(e.id, e.metadata.parent_id) for e in elements] == [
+            (e.id, e.metadata.parent_id) for e in expected
+        ]
+        assert elements[1].metadata.parent_id == elements[0].id
+        assert elements[2].metadata.parent_id == elements[0].id
+        assert elements[4].metadata.parent_id == elements[6].id
+        assert elements[5].metadata.parent_id == "foo"
+
+    def and_it_maps_a_duplicated_id_to_the_hash_of_the_last_element_having_it(self):
+        def make_elements() -> list[Element]:
+            elements: list[Element] = [
+                Title("A", element_id="dup"),
+                NarrativeText("B", metadata=ElementMetadata(parent_id="dup")),
+                Title("C", element_id="dup"),
+            ]
+            return elements
+
+        expected = set_element_hierarchy(assign_and_map_hash_ids(make_elements()))
+
+        elements = assign_hash_ids_and_hierarchy(make_elements())
+
+        assert elements[1].metadata.parent_id == elements[2].id
+        assert [(e.id, e.metadata.parent_id) for e in elements] == [
+            (e.id, e.metadata.parent_id) for e in expected
+        ]
+
+
 # ================================================================================================
 # APPLY METADATA DECORATOR
 # ================================================================================================
@@ -303,6 +351,40 @@ class Describe_apply_metadata:
         narr_text = elements[1]
         assert narr_text.metadata.parent_id == title.id
 
+    def it_assigns_the_same_ids_and_parent_ids_as_the_separate_passes(self):
+        def fake_partitioner(**kwargs: Any) -> list[Element]:
+            return [
+                Title("Intro", metadata=ElementMetadata(page_number=1, category_depth=0)),
+                NarrativeText("Body 1", metadata=ElementMetadata(page_number=1)),
+                Title("Sub", metadata=ElementMetadata(page_number=1, category_depth=1)),
+                ListItem("Item", metadata=ElementMetadata(page_number=2)),
+                NarrativeText("Body 1", metadata=ElementMetadata(page_number=2)),
+                Title("Next", metadata=ElementMetadata(page_number=1, category_depth=0)),
+                CheckBox(metadata=ElementMetadata(page_number=1)),
+            ]
+
+        expected = fake_partitioner()
+        for e in expected:
+            e.metadata.filename = "c.xyz"
+        expected = set_element_hierarchy(assign_and_map_hash_ids(expected))
+
+        elements = apply_metadata()(fake_partitioner)(filename="c.xyz", languages=[""])
+
+        assert [e.id for e in elements] == [e.id for e in expected]
+        assert [e.metadata.parent_id for e in elements] == [e.metadata.parent_id for e in expected]
+
+    def it_maps_a_parent_id_set_by_the_partitioner_to_the_hash_id_of_that_parent(self):
+        def fake_partitioner(**kwargs: Any) -> list[Element]:
+            return [
+                Text("Section", element_id="section"),
+                Text("Body", metadata=ElementMetadata(parent_id="section")),
+            ]
+
+        section, body = apply_metadata()(fake_partitioner)(languages=[""])
+
+        assert len(section.id) == 32
+        assert body.metadata.parent_id == section.id
+
     # -- languages --------------------------------------------------------
 
     def it_applies_language_metadata(self, fake_partitioner: Callable[..., list[Element]]):
@@ -473,8 +555,8 @@ def test_assign_hash_ids_produces_unique_and_deterministic_SHA1_ids_even_for_dup
     # -- default ids are UUIDs --
     assert all(len(e.id) == 36 for e in elements)
 
-    elements = _assign_hash_ids(copy.deepcopy(elements))
-    elements_2 = _assign_hash_ids(copy.deepcopy(elements))
+    elements = assign_hash_ids_and_hierarchy(copy.deepcopy(elements))
+    elements_2 = assign_hash_ids_and_hierarchy(copy.deepcopy(elements))
 
     ids = [e.id for e in elements]
     # -- ids are now SHA1 --
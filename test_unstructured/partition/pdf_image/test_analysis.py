@@ -1,11 +1,15 @@
 import numpy as np
 import pytest
 from PIL import Image
+from pytest_mock import MockerFixture
 from unstructured_inference.inference.elements import Rectangle
 from unstructured_inference.inference.layout import DocumentLayout, PageLayout
 from unstructured_inference.inference.layoutelement import LayoutElement
 
+from unstructured.partition.pdf_image.analysis import bbox_visualisation
 from unstructured.partition.pdf_image.analysis.bbox_visualisation import (
+    AnalysisDrawer,
+    ODModelLayoutDrawer,
     TextAlignment,
     get_bbox_text_size,
     get_bbox_thickness,
@@ -152,3 +156,92 @@ def test_od_document_layout_dump():
     # check OD model classes are attached but do not depend on a specific model instance
     assert "object_detection_classes" in od_layout_dump
     assert len(od_layout_dump["object_detection_classes"]) > 0
+
+
+@pytest.fixture()
+def page_image_paths(tmp_path) -> list[str]:
+    paths = []
+    for page_num in (1, 2):
+        path = tmp_path / f"page-{page_num}.png"
+        Image.new("RGB", (200, 200), "white").save(path)
+        paths.append(str(path))
+    return paths
+
+
+def _od_layout_dump() -> dict:
+    return {
+        "pages": [
+            {"number": number, "elements": [{"bbox": [10, 10, 100, 100], "type": "Title"}]}
+            for number in (1, 2)
+        ]
+    }
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_analysis_drawer_draws_on_the_page_images_it_is_given(
+    page_image_paths, tmp_path, mocker: MockerFixture, max_workers: int
+):
+    convert_pdf_to_image = mocker.patch.object(bbox_visualisation, "convert_pdf_to_image")
+    analysis_drawer = AnalysisDrawer(
+        filename="doc.pdf",
+        is_image=False,
+        save_dir=tmp_path / "out",
+        page_images=page_image_paths,
+        max_workers=max_workers,
+    )
+    analysis_drawer.add_drawer(ODModelLayoutDrawer(layout_dump=_od_layout_dump()))
+
+    report = analysis_drawer.process()
+
+    convert_pdf_to_image.assert_not_called()
+    assert (report.pages_drawn, report.pages_skipped) == (2, 0)
+    assert sorted(p.name for p in (tmp_path / "out" / "analysis" / "doc" / "bboxes").iterdir()) == [
+        "page1_layout_od_model.png",
+        "page2_layout_od_model.png",
+    ]
+
+
+def test_analysis_drawer_skips_the_pages_left_when_over_its_time_budget(
+    page_image_paths, tmp_path, mocker: MockerFixture
+):
+    perf_counter = mocker.patch.object(bbox_visualisation.time, "perf_counter")
+    # -- started at 0s, page 1 starts at 1s, page 2 would start at 3s --
+    perf_counter.side_effect = [0.0, 1.0, 3.0, 3.5]
+    analysis_drawer = AnalysisDrawer(
+        filename="doc.pdf",
+        is_image=False,
+        save_dir=tmp_path,
+        page_images=page_image_paths,
+        time_budget=2.0,
+    )
+    analysis_drawer.add_drawer(ODModelLayoutDrawer(layout_dump=_od_layout_dump()))
+
+    report = analysis_drawer.process()
+
+    assert (report.pages_drawn, report.pages_skipped, report.seconds) == (1, 1, 3.5)
+
+
+def test_analysis_drawer_workers_are_done_drawing_when_over_its_time_budget(
+    page_image_paths, tmp_path
+):
+    analysis_drawer = AnalysisDrawer(
+        filename="doc.pdf",
+        is_image=False,
+        save_dir=tmp_path,
+        page_images=page_image_paths,
+        max_workers=2,
+        time_budget=0.0,
+    )
+    analysis_drawer.add_drawer(ODModelLayoutDrawer(layout_dump=_od_layout_dump()))
+
+    report = analysis_drawer.process()
+
+    # -- the pages reported drawn are exactly those whose images are saved when `process()` returns
+    saved_pages = list((tmp_path / "analysis" / "doc" / "bboxes").iterdir())
+    assert report.pages_drawn == len(saved_pages)
+    assert report.pages_drawn + report.pages_skipped == 2
+
+
+def test_get_truetype_font_loads_each_size_once():
+    assert bbox_visualisation.get_truetype_font(20) is bbox_visualisation.get_truetype_font(20)
+    assert bbox_visualisation.get_truetype_font(20) is not bbox_visualisation.get_truetype_font(24)
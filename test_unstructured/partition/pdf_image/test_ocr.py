@@ -27,6 +27,7 @@ from unstructured.partition.utils.config import env_config
 from unstructured.partition.utils.constants import (
     OCR_AGENT_PADDLE,
     OCR_AGENT_TESSERACT,
+    OCRMode,
     Source,
 )
 from unstructured.partition.utils.ocr_models.google_vision_ocr import OCRAgentGoogleVision
@@ -663,3 +664,317 @@ def test_pass_down_agents(mocker, mock_page):
 
     assert spy.call_args_list[0][1] == {"language": "en", "ocr_agent_module": OCR_AGENT_PADDLE}
     assert spy.call_args_list[1][1] == {"language": "eng", "ocr_agent_module": OCR_AGENT_TESSERACT}
+
+
+@pytest.mark.parametrize(
+    ("ocr_mode", "page_count", "ocr_max_workers", "expected_value"),
+    [
+        (OCRMode.FULL_PAGE.value, 3, 4, 4),
+        (OCRMode.FULL_PAGE.value, 2, 4, 4),
+        (OCRMode.FULL_PAGE.value, 1, 4, 1),
+        (OCRMode.FULL_PAGE.value, 3, 1, 1),
+        (OCRMode.INDIVIDUAL_BLOCKS.value, 3, 4, 1),
+    ],
+)
+def test_ocr_max_workers(ocr_mode: str, page_count: int, ocr_max_workers: int, expected_value: int):
+    with env_config.pinned(OCR_MAX_WORKERS=ocr_max_workers):
+        assert ocr._ocr_max_workers(ocr_mode, page_count) == expected_value
+
+
+def test_process_file_with_ocr_merges_page_layouts_OCRed_on_the_worker_pool(mocker):
+    page_ocr_layouts = [MagicMock(TextRegions), MagicMock(TextRegions)]
+    iter_pooled_page_ocr_layouts = mocker.patch.object(
+        ocr, "_iter_pooled_page_ocr_layouts", return_value=iter(page_ocr_layouts)
+    )
+    supplement_page_layout_with_ocr = mocker.patch.object(ocr, "supplement_page_layout_with_ocr")
+    doc = MagicMock(DocumentLayout)
+    doc.pages = [MagicMock(PageLayout), MagicMock(PageLayout)]
+
+    with env_config.pinned(OCR_MAX_WORKERS=3):
+        ocr.process_file_with_ocr(
+            example_doc_path("pdf/layout-parser-paper-fast.pdf"), doc, [], ocr_languages="eng"
+        )
+
+    image_paths, ocr_max_workers, ocr_agent, ocr_languages = (
+        iter_pooled_page_ocr_layouts.call_args.args
+    )
+    assert len(image_paths) == 2
+    assert (ocr_max_workers, ocr_agent, ocr_languages) == (3, OCR_AGENT_TESSERACT, "eng")
+    assert [
+        call.kwargs["ocr_layout"] for call in supplement_page_layout_with_ocr.call_args_list
+    ] == page_ocr_layouts
+
+
+def test_supplement_page_layout_with_ocr_uses_a_provided_ocr_layout(mocker, mock_page):
+    get_layout_from_image = mocker.patch.object(OCRAgentTesseract, "get_layout_from_image")
+    ocr_layout = TextRegions.from_list(
+        [TextRegion.from_coords(x1=15, y1=25, x2=35, y2=45, text="Token1")]
+    )
+    merge_out_layout_with_ocr_layout = mocker.spy(ocr, "merge_out_layout_with_ocr_layout")
+
+    ocr.supplement_page_layout_with_ocr(
+        mock_page, Image.new("RGB", (100, 100)), ocr_layout=ocr_layout
+    )
+
+    get_layout_from_image.assert_not_called()
+    assert merge_out_layout_with_ocr_layout.call_args.kwargs["ocr_layout"] is ocr_layout
+
+
+class _OCRAgentFakeShades(OCRAgent):
+    """Reads each dark shade of gray in an image as one word naming the shade."""
+
+    def get_layout_from_image(self, image):
+        pixels = np.asarray(image.convert("L"))
+        regions = []
+        for shade in np.unique(pixels[pixels < 255]):
+            ys, xs = np.nonzero(pixels == shade)
+            regions.append(
+                TextRegion.from_coords(
+                    xs.min(), ys.min(), xs.max() + 1, ys.max() + 1, text=f"shade{shade}"
+                )
+            )
+        return TextRegions.from_list(regions)
+
+    def get_text_from_image(self, image):
+        return " ".join(self.get_layout_from_image(image).texts)
+
+    def get_layout_elements_from_image(self, image):
+        raise NotImplementedError
+
+    def is_text_sorted(self):
+        return False
+
+
+@pytest.mark.parametrize("batch_size", [2, 3, 10])
+def test_individual_blocks_ocr_assigns_the_same_text_when_batched(mocker, batch_size: int):
+    image = Image.new("L", (440, 340), 255)
+    coords = [(10, 10, 100, 40), (150, 10, 390, 40), (10, 100, 200, 130), (10, 200, 390, 290)]
+    for shade, (x1, y1, x2, y2) in enumerate(coords):
+        image.paste(shade * 10, (x1 + 5, y1 + 5, x2 - 5, y2 - 5))
+    mocker.patch.object(OCRAgent, "get_instance", return_value=_OCRAgentFakeShades())
+
+    def ocr_block_texts() -> list[str]:
+        page = MagicMock(PageLayout)
+        page.elements_array = LayoutElements.from_list(
+            [
+                LayoutElement.from_coords(*coords[0], text="", source=None),
+                LayoutElement.from_coords(*coords[1], text="embedded", source=None),
+                LayoutElement.from_coords(*coords[2], text="", source=None),
+                LayoutElement.from_coords(*coords[3], text="", source=None),
+            ]
+        )
+        ocr.supplement_page_layout_with_ocr(page, image, ocr_mode=OCRMode.INDIVIDUAL_BLOCKS.value)
+        return page.elements_array.texts.tolist()
+
+    with env_config.pinned(OCR_INDIVIDUAL_BLOCKS_BATCH_SIZE=1):
+        expected_texts = ocr_block_texts()
+    with env_config.pinned(OCR_INDIVIDUAL_BLOCKS_BATCH_SIZE=batch_size):
+        texts = ocr_block_texts()
+
+    assert expected_texts == ["shade0", "embedded", "shade20", "shade30"]
+    assert texts == expected_texts
+
+
+def test_get_texts_from_images_batched_joins_each_images_words_into_lines():
+    class OCRAgentFakeWords(_OCRAgentFakeShades):
+        def get_layout_from_image(self, image):
+            # -- two lines of words, out of reading order, in each of the two images stacked --
+            return TextRegions.from_list(
+                [
+                    TextRegion.from_coords(*coords, text=text)
+                    for coords, text in [
+                        ((60, 40, 90, 50), "world"),
+                        ((32, 42, 55, 52), "hello"),
+                        ((32, 56, 60, 66), "again"),
+                        ((32, 170, 60, 180), "second"),
+                    ]
+                ]
+            )
+
+    images = [Image.new("RGB", (80, 40)), Image.new("RGB", (80, 40))]
+
+    texts = ocr.get_texts_from_images_batched(images, OCRAgentFakeWords(), batch_size=2)
+
+    assert texts == ["hello world\nagain", "second"]
+
+
+def test_iter_composite_batches_keeps_composites_within_the_tesseract_size_limit(monkeypatch):
+    monkeypatch.setattr(ocr, "TESSERACT_MAX_SIZE", 164 * 300 * ocr.IMAGE_COLOR_DEPTH)
+    images = [Image.new("RGB", (100, 100)) for _ in range(5)]
+
+    batches = list(ocr._iter_composite_batches(images, batch_size=4))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+@pytest.mark.parametrize(
+    ("infer_table_structure", "table_structure_batch_size", "expected_value"),
+    [(True, 4, []), (True, 1, None), (False, 4, None)],
+)
+def test_new_document_table_crops(
+    infer_table_structure: bool, table_structure_batch_size: int, expected_value
+):
+    with env_config.pinned(TABLE_STRUCTURE_BATCH_SIZE=table_structure_batch_size):
+        assert ocr._new_document_table_crops(infer_table_structure) == expected_value
+
+
+def test_batched_table_extraction_sets_the_same_structure_on_the_tables_of_every_page(mocker):
+    def fake_predict(image, ocr_tokens, result_format):
+        # -- one cell holding the size of the table and its first OCR token --
+        text = f"{image.width}x{image.height} {ocr_tokens[0]['text']}"
+        return [{"row_nums": [0], "column_nums": [0], "cell text": text, "column header": False}]
+
+    tables_agent = MagicMock(predict=fake_predict)
+    mocker.patch.object(ocr, "_load_tables_agent", return_value=tables_agent)
+    predict_table_cells_batch = mocker.patch.object(
+        ocr,
+        "_predict_table_cells_batch",
+        side_effect=lambda agent, crops: [
+            agent.predict(c.image, ocr_tokens=c.ocr_tokens, result_format="cells") for c in crops
+        ],
+    )
+    ocr_agent = MagicMock(
+        get_layout_from_image=MagicMock(
+            return_value=TextRegions.from_list([TextRegion.from_coords(0, 0, 5, 5, text="Token")])
+        )
+    )
+    image = Image.new("RGB", (200, 200))
+
+    def page_elements() -> list[LayoutElements]:
+        return [
+            LayoutElements.from_list(
+                [
+                    LayoutElement.from_coords(10, 10, 60, 40, text="", type="Table"),
+                    LayoutElement.from_coords(10, 50, 60, 60, text="Title", type="Title"),
+                    LayoutElement.from_coords(10, 100, 90, 190, text="", type="Table"),
+                ]
+            ),
+            LayoutElements.from_list(
+                [LayoutElement.from_coords(20, 20, 40, 70, text="", type="Table")]
+            ),
+        ]
+
+    expected_pages = page_elements()
+    for elements in expected_pages:
+        ocr.supplement_element_with_table_extraction(elements, image, tables_agent, ocr_agent)
+    pages = page_elements()
+    with env_config.pinned(EXTRACT_TABLE_AS_CELLS=True):
+        table_crops = [
+            crop for elements in pages for crop in ocr.get_table_crops(elements, image, ocr_agent)
+        ]
+        ocr.supplement_table_crops_with_batched_table_extraction(table_crops, batch_size=2)
+
+    assert [len(call.args[1]) for call in predict_table_cells_batch.call_args_list] == [2, 1]
+    assert [elements.text_as_html.tolist() for elements in pages] == [
+        elements.text_as_html.tolist() for elements in expected_pages
+    ]
+    assert "50x30 Token" in pages[0].text_as_html[0]
+    assert pages[0].text_as_html[1] is None
+    assert pages[1].table_as_cells[0] == [
+        {"x": 0, "y": 0, "w": 1, "h": 1, "content": "20x50 Token"}
+    ]
+
+
+def test_predict_table_cells_batch_gives_the_cells_predict_gives_each_table(mocker):
+    import torch
+    from unstructured_inference.models import tables
+
+    class FakeEncoding(dict):
+        def to(self, device):
+            return self
+
+    def feature_extractor(image, return_tensors):
+        # -- every 10th pixel, like a resize, of each channel --
+        pixels = torch.tensor(np.asarray(image, dtype=np.float32)).permute(2, 0, 1)[:, ::10, ::10]
+        return FakeEncoding(
+            pixel_values=pixels[None],
+            pixel_mask=torch.ones(pixels.shape[1:], dtype=torch.long)[None],
+        )
+
+    def fake_model(pixel_values, pixel_mask):
+        # -- outputs depend on every input pixel, so would change if an input were padded --
+        features = pixel_values.flatten(1).mean(dim=1)
+        return {
+            "logits": features[:, None, None] * torch.arange(3.0),
+            "pred_boxes": features[:, None, None] / torch.arange(1.0, 5.0),
+        }
+
+    def fake_recognize(outputs, image, tokens):
+        return [[{"logits": outputs["logits"].tolist(), "size": image.size, "tokens": tokens}]]
+
+    mocker.patch.object(tables, "recognize", side_effect=fake_recognize)
+    model = MagicMock(side_effect=fake_model)
+    tables_agent = tables.UnstructuredTableTransformerModel()
+    tables_agent.model = model
+    tables_agent.feature_extractor = feature_extractor
+    tables_agent.device = "cpu"
+    table_crops = [
+        ocr.TableCrop(
+            elements=LayoutElements.from_list([]),
+            index=i,
+            image=Image.new("RGB", size, color),
+            ocr_tokens=[{"text": f"Token{i}"}],
+        )
+        for i, (size, color) in enumerate(
+            [((200, 100), "white"), ((300, 150), "gray"), ((200, 100), "black")]
+        )
+    ]
+
+    expected = [
+        tables_agent.predict(c.image, ocr_tokens=c.ocr_tokens, result_format="cells")
+        for c in table_crops
+    ]
+    model.reset_mock()
+    tables_cells = ocr._predict_table_cells_batch(tables_agent, table_crops)
+
+    assert tables_cells == expected
+    assert [len(call.kwargs["pixel_values"]) for call in model.call_args_list] == [2, 1]
+
+
+def test_get_table_tokens_from_regions(mock_ocr_layout):
+    regions = TextRegions.from_list(
+        [
+            *mock_ocr_layout.as_list(),
+            TextRegion.from_coords(x1=200, y1=200, x2=210, y2=210, text="Outside"),
+            TextRegion.from_coords(x1=20, y1=20, x2=30, y2=30, text=""),
+            TextRegion.from_coords(x1=20, y1=20, x2=30, y2=30, text=" \n"),
+            TextRegion.from_coords(x1=12, y1=50, x2=20, y2=60, text="Token3\n"),
+        ]
+    )
+
+    table_tokens = ocr.get_table_tokens_from_regions(regions, crop_box=(10, 20, 43, 70))
+
+    assert table_tokens == [
+        {"bbox": [5, 5, 25, 25], "text": "Token1", "span_num": 0, "line_num": 0, "block_num": 0},
+        {"bbox": [30, 10, 33, 30], "text": "Token2", "span_num": 1, "line_num": 0, "block_num": 0},
+        {"bbox": [2, 30, 10, 40], "text": "Token3", "span_num": 2, "line_num": 0, "block_num": 0},
+    ]
+
+
+def test_get_table_crops_takes_tokens_from_the_page_instead_of_OCRing_tables(mock_ocr_layout):
+    ocr_agent = MagicMock(OCRAgent)
+    elements = LayoutElements.from_list(
+        [LayoutElement.from_coords(x1=10, y1=20, x2=50, y2=70, text="", type="Table")]
+    )
+
+    (table_crop,) = ocr.get_table_crops(
+        elements, Image.new("RGB", (100, 100)), ocr_agent, page_tokens=mock_ocr_layout
+    )
+
+    ocr_agent.get_layout_from_image.assert_not_called()
+    assert [token["text"] for token in table_crop.ocr_tokens] == ["Token1", "Token2"]
+
+
+@pytest.mark.parametrize(
+    ("from_page", "has_ocr_layout", "expected_tokens_from_page"),
+    [(True, True, True), (True, False, False), (False, True, False)],
+)
+def test_get_table_page_tokens(
+    mock_ocr_layout, from_page, has_ocr_layout, expected_tokens_from_page
+):
+    ocr_layout = mock_ocr_layout if has_ocr_layout else None
+
+    with env_config.pinned(TABLE_OCR_TOKENS_FROM_PAGE=from_page):
+        page_tokens = ocr._get_table_page_tokens(ocr_layout)
+
+    assert page_tokens is (ocr_layout if expected_tokens_from_page else None)
@@ -0,0 +1,90 @@
+"""Test-suite for `unstructured.partition.pdf_image.ocr_pool` module."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+from PIL import Image
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.partition.pdf_image.ocr_pool import (
+    OCRWorkerPool,
+    get_ocr_worker_pool,
+    iter_page_layouts_on_pool,
+    shutdown_ocr_worker_pools,
+)
+from unstructured.partition.utils.config import env_config
+from unstructured.partition.utils.constants import OCR_AGENT_TESSERACT
+from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+
+PAGE_IMAGE_PATHS = [
+    example_doc_path("img/DA-1p.png"),
+    example_doc_path("img/layout-parser-paper-fast.jpg"),
+    example_doc_path("img/example.jpg"),
+]
+
+
+class DescribeOCRWorkerPool:
+    def it_OCRs_pages_on_its_workers_giving_the_layouts_in_page_order(self, pool: OCRWorkerPool):
+        ocr_agent = OCRAgent.get_instance(ocr_agent_module=OCR_AGENT_TESSERACT, language="eng")
+        expected_texts = []
+        for image_path in PAGE_IMAGE_PATHS:
+            with Image.open(image_path) as image:
+                expected_texts.append(ocr_agent.get_layout_from_image(image).texts.tolist())
+
+        layouts = list(pool.iter_page_layouts(PAGE_IMAGE_PATHS, OCR_AGENT_TESSERACT, "eng"))
+
+        assert [layout.texts.tolist() for layout in layouts] == expected_texts
+
+    def and_it_accepts_page_images_as_well_as_image_paths(self, pool: OCRWorkerPool):
+        with Image.open(PAGE_IMAGE_PATHS[0]) as image:
+            page_image = image.convert("RGB")
+
+        (from_image,) = pool.iter_page_layouts([page_image], OCR_AGENT_TESSERACT, "eng")
+        (from_path,) = pool.iter_page_layouts(PAGE_IMAGE_PATHS[:1], OCR_AGENT_TESSERACT, "eng")
+
+        assert from_image.texts.tolist() == from_path.texts.tolist()
+
+    def it_OCRs_with_the_settings_pinned_by_the_caller(self, pool: OCRWorkerPool):
+        # -- no character can reach a confidence above 1 so every word is filtered out --
+        with env_config.pinned(TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD=1.1):
+            (layout,) = pool.iter_page_layouts(PAGE_IMAGE_PATHS[:1], OCR_AGENT_TESSERACT, "eng")
+
+        assert layout.texts.tolist() == []
+
+    def it_rejects_fewer_than_one_worker(self):
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            OCRWorkerPool(max_workers=0)
+
+    @pytest.fixture(scope="class")
+    def pool(self) -> Iterator[OCRWorkerPool]:
+        pool = OCRWorkerPool(max_workers=2)
+        yield pool
+        pool.shutdown()
+
+
+class Describe_shared_pools:
+    def it_shares_one_pool_per_worker_count_until_shut_down(self):
+        try:
+            pool = get_ocr_worker_pool(2)
+
+            assert get_ocr_worker_pool(2) is pool
+            assert get_ocr_worker_pool(3) is not pool
+            assert get_ocr_worker_pool(2).max_workers == 2
+        finally:
+            shutdown_ocr_worker_pools()
+
+        assert get_ocr_worker_pool(2) is not pool
+        shutdown_ocr_worker_pools()
+
+    def it_can_OCR_pages_on_the_shared_pool(self):
+        try:
+            layouts = list(
+                iter_page_layouts_on_pool(2, PAGE_IMAGE_PATHS[:2], OCR_AGENT_TESSERACT, "eng")
+            )
+        finally:
+            shutdown_ocr_worker_pools()
+
+        assert len(layouts) == 2
+        assert all(len(layout.texts) > 0 for layout in layouts)
@@ -1,9 +1,18 @@
+from __future__ import annotations
+
 import base64
 import contextlib
+import email.parser
+import email.policy
+import hashlib
+import io
 import json
 import os
 import pathlib
-from typing import Any
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional
 from unittest.mock import Mock
 
 import pytest
@@ -18,6 +27,7 @@ from unstructured.documents.elements import ElementType, NarrativeText
 from unstructured.partition.api import (
     DEFAULT_RETRIES_MAX_ELAPSED_TIME_SEC,
     DEFAULT_RETRIES_MAX_INTERVAL_SEC,
+    PartitionApiClient,
     get_retries_config,
     partition_multiple_via_api,
     partition_via_api,
@@ -515,6 +525,119 @@ def test_partition_multiple_via_api_invalid_request_data_kwargs():
         )
 
 
+# -- PartitionApiClient ---------------------------------------------------------------------------
+
+
+def test_partition_api_client_reuses_one_pooled_session_for_many_documents(
+    stub_api: StubPartitionApi,
+):
+    with PartitionApiClient(api_url=stub_api.url, api_key="key", max_concurrency=2) as client:
+        documents = client.partition_multiple(
+            files=[io.BytesIO(b"first"), io.BytesIO(b"second"), io.BytesIO(b"third")],
+            metadata_filenames=["a.txt", "b.txt", "c.txt"],
+            strategy="fast",
+        )
+
+    assert [[e.text for e in elements] for elements in documents] == [
+        ["first"],
+        ["second"],
+        ["third"],
+    ]
+    assert all(r.headers["unstructured-api-key"] == "key" for r in stub_api.requests)
+    assert all(r.fields["strategy"] == "fast" for r in stub_api.requests)
+    assert len(stub_api.client_ports) == len(stub_api.requests) == 3
+    # -- connections are kept alive, so three requests need no more than two connections --
+    assert len(set(stub_api.client_ports)) <= 2
+
+
+def test_partition_api_client_bounds_the_number_of_concurrent_requests(
+    stub_api: StubPartitionApi,
+):
+    stub_api.delay = 0.05
+
+    with PartitionApiClient(api_url=stub_api.url, max_concurrency=2) as client:
+        client.partition_multiple(
+            files=[io.BytesIO(b"%d" % i) for i in range(6)],
+            metadata_filenames=[f"{i}.txt" for i in range(6)],
+        )
+
+    assert stub_api.max_in_flight == 2
+
+
+def test_partition_api_client_splits_a_pdf_into_page_ranges_and_merges_in_page_order(
+    stub_api: StubPartitionApi, tmp_path: pathlib.Path
+):
+    pdf_path = tmp_path / "seven-pages.pdf"
+    _write_blank_pdf(pdf_path, page_count=7)
+    # -- answer the first page range last, to show merge order doesn't follow completion order --
+    stub_api.delay_for_first_request = 0.1
+
+    with PartitionApiClient(
+        api_url=stub_api.url, max_concurrency=4, split_pdf_page_range_size=3
+    ) as client:
+        elements = client.partition(str(pdf_path))
+
+    assert sorted(r.page_count for r in stub_api.requests) == [1, 3, 3]
+    assert [e.metadata.page_number for e in elements] == [1, 2, 3, 4, 5, 6, 7]
+    assert all(e.metadata.filename == str(pdf_path) for e in elements)
+
+
+def test_partition_api_client_gets_document_unique_ids_for_repeated_headers_of_page_ranges(
+    stub_api: StubPartitionApi, tmp_path: pathlib.Path
+):
+    pdf_path = tmp_path / "four-pages.pdf"
+    _write_blank_pdf(pdf_path, page_count=4)
+    stub_api.page_header = "Annual Report"
+
+    with PartitionApiClient(api_url=stub_api.url, split_pdf_page_range_size=2) as client:
+        split_elements = client.partition(str(pdf_path))
+    with PartitionApiClient(api_url=stub_api.url) as client:
+        whole_elements = client.partition(str(pdf_path))
+
+    assert sorted(r.fields.get("starting_page_number", "1") for r in stub_api.requests) == [
+        "1",
+        "1",
+        "3",
+    ]
+    assert [e.metadata.page_number for e in split_elements] == [1, 1, 2, 2, 3, 3, 4, 4]
+    assert len({e.id for e in split_elements}) == 8
+    assert [e.id for e in split_elements] == [e.id for e in whole_elements]
+
+
+def test_partition_api_client_does_not_split_non_pdf_documents(stub_api: StubPartitionApi):
+    with PartitionApiClient(api_url=stub_api.url, split_pdf_page_range_size=1) as client:
+        elements = client.partition(file=io.BytesIO(b"plain text"), metadata_filename="a.txt")
+
+    assert [e.text for e in elements] == ["plain text"]
+    assert len(stub_api.requests) == 1
+
+
+def test_partition_api_client_retries_failed_requests_with_backoff(stub_api: StubPartitionApi):
+    stub_api.failures_before_success = 2
+
+    with PartitionApiClient(api_url=stub_api.url, retries=2, retries_backoff_factor=0.01) as client:
+        elements = client.partition(file=io.BytesIO(b"eventually"), metadata_filename="a.txt")
+
+    assert [e.text for e in elements] == ["eventually"]
+    assert stub_api.status_codes == [503, 503, 200]
+
+
+def test_partition_api_client_raises_when_retries_are_exhausted(stub_api: StubPartitionApi):
+    stub_api.failures_before_success = 3
+
+    with PartitionApiClient(
+        api_url=stub_api.url, retries=1, retries_backoff_factor=0.01
+    ) as client, pytest.raises(ValueError, match="Receive unexpected status code 503"):
+        client.partition(file=io.BytesIO(b"never"), metadata_filename="a.txt")
+
+
+def test_partition_api_client_raises_without_metadata_filename_for_file():
+    with PartitionApiClient() as client, pytest.raises(
+        ValueError, match="metadata_filename must be specified"
+    ):
+        client.partition(file=io.BytesIO(b"abc"))
+
+
 MOCK_TEXT = """[
     {
         "element_id": "f49fbd614ddf5b72e06f59e554e6ae2b",
@@ -648,3 +771,157 @@ def expected_call_():
         ),
         None,  # retries kwarg
     ]
+
+
+class StubRequest:
+    """A request received by `StubPartitionApi`."""
+
+    def __init__(
+        self, headers: dict[str, str], fields: dict[str, str], file_name: str, content: bytes
+    ):
+        self.headers = headers
+        self.fields = fields
+        self.file_name = file_name
+        self.content = content
+
+    @property
+    def page_count(self) -> int:
+        import pypdf
+
+        return len(pypdf.PdfReader(io.BytesIO(self.content)).pages)
+
+
+class StubPartitionApi:
+    """Local HTTP server standing in for the partition API.
+
+    A PDF is answered with one element per page, preceded by a `page_header` element when one is
+    set, numbered from the `starting_page_number` field and with hash element ids computed like
+    the API does. Any other file is answered with one element holding its text. The first
+    `failures_before_success` requests are answered with a 503.
+    """
+
+    def __init__(self):
+        self.requests: list[StubRequest] = []
+        self.status_codes: list[int] = []
+        self.client_ports: list[int] = []
+        self.delay = 0.0
+        self.delay_for_first_request = 0.0
+        self.failures_before_success = 0
+        self.page_header: Optional[str] = None
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/general/v0/general"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                with stub._lock:
+                    stub._in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub._in_flight)
+                    is_first_request = not stub.status_codes
+                    status_code = 503 if stub.failures_before_success > 0 else 200
+                    stub.failures_before_success -= 1
+                    stub.status_codes.append(status_code)
+                    stub.client_ports.append(self.client_address[1])
+
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                time.sleep(stub.delay_for_first_request if is_first_request else stub.delay)
+
+                payload = b"[]"
+                if status_code == 200:
+                    request = stub._parse_request(dict(self.headers), body)
+                    with stub._lock:
+                        stub.requests.append(request)
+                    payload = json.dumps(stub._elements_for(request)).encode()
+
+                with stub._lock:
+                    stub._in_flight -= 1
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+    @staticmethod
+    def _parse_request(headers: dict[str, str], body: bytes) -> StubRequest:
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {headers['Content-Type']}\r\n\r\n".encode() + body
+        )
+        fields: dict[str, str] = {}
+        file_name, content = "", b""
+        for part in message.iter_parts():
+            if part.get_filename():
+                file_name, content = part.get_filename(), part.get_payload(decode=True)
+            else:
+                fields[part.get_param("name", header="content-disposition")] = part.get_content()
+        return StubRequest({k.lower(): v for k, v in headers.items()}, fields, file_name, content)
+
+    def _elements_for(self, request: StubRequest) -> list[dict[str, Any]]:
+        if not request.content.startswith(b"%PDF"):
+            return [
+                {
+                    "type": "NarrativeText",
+                    "element_id": request.file_name,
+                    "text": request.content.decode(),
+                    "metadata": {"filename": request.file_name},
+                }
+            ]
+        starting_page_number = int(request.fields.get("starting_page_number", 1))
+        elements: list[dict[str, Any]] = []
+        for page_number in range(starting_page_number, starting_page_number + request.page_count):
+            page_texts = [("Header", self.page_header)] if self.page_header else []
+            page_texts.append(("NarrativeText", f"Page {page_number}"))
+            for sequence_number, (element_type, text) in enumerate(page_texts):
+                id_data = f"{request.file_name}{text}{page_number}{sequence_number}"
+                elements.append(
+                    {
+                        "type": element_type,
+                        "element_id": hashlib.sha256(id_data.encode()).hexdigest()[:32],
+                        "text": text,
+                        "metadata": {"filename": request.file_name, "page_number": page_number},
+                    }
+                )
+        return elements
+
+
+def _write_blank_pdf(path: pathlib.Path, page_count: int) -> None:
+    import pypdf
+
+    writer = pypdf.PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(width=72, height=72)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+@pytest.fixture()
+def stub_api() -> Iterator[StubPartitionApi]:
+    stub = StubPartitionApi()
+    stub.start()
+    yield stub
+    stub.stop()
@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import os
 import pathlib
+import subprocess
+import sys
 import tempfile
 import warnings
 from importlib import import_module
@@ -1278,15 +1280,16 @@ def test_auto_partition_applies_the_correct_filetype_for_all_filetypes(
     )
 
 
-def test_detect_filetype_maps_file_to_bytes_io_when_spooled_temp_file_used(mocker):
+def test_detect_filetype_reads_a_spooled_temp_file_in_place(mocker):
     detect_filetype_mock = MagicMock(return_value=FileType.JSON)
     mocker.patch("unstructured.file_utils.filetype._FileTypeDetector", detect_filetype_mock)
     with tempfile.SpooledTemporaryFile() as f:
         f.write(b'{"text": Hello, world!}')
         f.seek(0)
         detect_filetype(file=f)
-    file_detection_context = detect_filetype_mock.file_type.call_args[0][0]
-    assert file_detection_context.text_head == '{"text": Hello, world!}'
+
+        file_detection_context = detect_filetype_mock.file_type.call_args[0][0]
+        assert file_detection_context.text_head == '{"text": Hello, world!}'
 
 
 # -- .languages -----------------------------------------------------------
@@ -1350,6 +1353,45 @@ def test_auto_partition_that_requires_extras_raises_when_dependencies_are_not_in
     dependency_exists_.assert_called_once_with("pdf2image")
 
 
+# -- generous enough for a slow CI runner, well under the ~0.8s it took before heavy dependencies
+# -- were deferred to first use.
+IMPORT_TIME_BUDGET_US = 500_000
+
+
+def _import_in_subprocess(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "SCARF_NO_ANALYTICS": "true", "AUTO_DOWNLOAD_NLTK": "false"},
+    )
+
+
+def test_auto_partition_module_imports_within_its_time_budget():
+    def cumulative_import_time_us() -> int:
+        result = _import_in_subprocess("import unstructured.partition.auto")
+        (line,) = (
+            line
+            for line in result.stderr.splitlines()
+            if line.endswith("| unstructured.partition.auto")
+        )
+        return int(line.split("|")[1])
+
+    # -- best of three, to keep a noisy runner from failing the test --
+    assert min(cumulative_import_time_us() for _ in range(3)) < IMPORT_TIME_BUDGET_US
+
+
+def test_auto_and_text_partitioner_modules_do_not_import_heavy_dependencies():
+    heavy_modules = ("iso639", "nltk", "numpy", "pandas", "requests", "scipy")
+    result = _import_in_subprocess(
+        "import sys, unstructured.partition.auto, unstructured.partition.text; "
+        f"print(sorted(m for m in {heavy_modules!r} if m in sys.modules))"
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
 # ================================================================================================
 # MODULE-LEVEL FIXTURES
 # ================================================================================================
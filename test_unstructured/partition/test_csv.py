@@ -204,6 +204,45 @@ def test_partition_csv_header():
     assert table.metadata.text_as_html is not None
 
 
+def test_partition_csv_emits_a_table_per_row_window_when_rows_per_table_is_specified():
+    csv_bytes = b"name,qty\n" + b"".join(b"item-%d,%d\n" % (i, i) for i in range(5))
+
+    elements = partition_csv(file=io.BytesIO(csv_bytes), include_header=True, rows_per_table=2)
+
+    assert [e.text for e in elements] == [
+        "name qty item-0 0 item-1 1",
+        "name qty item-2 2 item-3 3",
+        "name qty item-4 4",
+    ]
+    assert all(isinstance(e, Table) for e in elements)
+    assert elements[2].metadata.text_as_html == (
+        "<table><tr><td>name</td><td>qty</td></tr><tr><td>item-4</td><td>4</td></tr></table>"
+    )
+    assert [(e.metadata.table_row_start, e.metadata.table_row_end) for e in elements] == [
+        (0, 2),
+        (2, 4),
+        (4, 5),
+    ]
+    assert all(e.metadata.filetype == EXPECTED_FILETYPE for e in elements)
+
+
+def test_partition_csv_row_windows_cover_the_same_rows_as_a_single_table():
+    file_path = example_doc_path("stanley-cups.csv")
+    table = partition_csv(file_path)[0]
+
+    elements = partition_csv(file_path, rows_per_table=3)
+
+    assert len(elements) > 1
+    assert " ".join(e.text for e in elements) == table.text
+    assert table.metadata.table_row_start is None
+    assert elements[-1].metadata.table_row_end == table.metadata.text_as_html.count("<tr>")
+
+
+def test_partition_csv_raises_on_a_rows_per_table_less_than_one():
+    with pytest.raises(ValueError, match="rows_per_table must be a positive integer, got 0"):
+        partition_csv(example_doc_path("stanley-cups.csv"), rows_per_table=0)
+
+
 # ================================================================================================
 # UNIT-TESTS
 # ================================================================================================
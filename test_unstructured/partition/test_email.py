@@ -384,6 +384,35 @@ def test_partition_email_silently_skips_attachments_it_cannot_partition():
     ]
 
 
+def test_partition_email_can_partition_attachments_concurrently_and_in_order():
+    msg = EmailMessage()
+    msg["From"] = "sender@example.com"
+    msg["Subject"] = "Attachments"
+    msg.set_content("See attached.")
+    for file_name, content in (
+        ("logo.txt", "The company logo."),
+        ("report.txt", "The quarterly report."),
+        ("logo.txt", "The company logo."),
+    ):
+        msg.add_attachment(content, filename=file_name)
+
+    elements = partition_email(
+        file=io.BytesIO(msg.as_bytes()),
+        metadata_filename="attachments.eml",
+        attachments_max_workers=3,
+        unique_element_ids=True,
+    )
+
+    assert [(e.text, e.metadata.filename) for e in elements] == [
+        ("See attached.", "attachments.eml"),
+        ("The company logo.", "logo.txt"),
+        ("The quarterly report.", "report.txt"),
+        ("The company logo.", "logo.txt"),
+    ]
+    assert all(e.metadata.attached_to_filename == "attachments.eml" for e in elements[1:])
+    assert len({e.id for e in elements}) == len(elements)
+
+
 # ================================================================================================
 # ISOLATED UNIT TESTS
 # ================================================================================================
@@ -417,6 +446,13 @@ class DescribeEmailPartitionerOptions:
         with pytest.raises(ValueError, match="'application/json' is not a valid value for conte"):
             EmailPartitioningContext.load(**ctx_args)
 
+    def and_it_raises_when_attachments_max_workers_is_less_than_one(self, ctx_args: dict[str, Any]):
+        ctx_args["file_path"] = example_doc_path("eml/fake-email.eml")
+        ctx_args["attachments_max_workers"] = 0
+
+        with pytest.raises(ValueError, match="attachments_max_workers must be at least 1, got 0"):
+            EmailPartitioningContext.load(**ctx_args)
+
     # -- .bcc_addresses --------------------------
 
     def it_provides_access_to_the_Bcc_addresses_when_present(self):
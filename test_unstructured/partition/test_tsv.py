@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 import pytest
 from pytest_mock import MockFixture
 
@@ -145,6 +147,30 @@ def test_partition_tsv_header():
     assert "<table>" in table.metadata.text_as_html
 
 
+def test_partition_tsv_emits_a_table_per_row_window_when_rows_per_table_is_specified():
+    tsv_bytes = b"name\tqty\n" + b"".join(b"item-%d\t%d\n" % (i, i) for i in range(3))
+
+    elements = partition_tsv(file=io.BytesIO(tsv_bytes), include_header=True, rows_per_table=2)
+
+    assert [e.text for e in elements] == ["name qty item-0 0 item-1 1", "name qty item-2 2"]
+    assert all(isinstance(e, Table) for e in elements)
+    assert [(e.metadata.table_row_start, e.metadata.table_row_end) for e in elements] == [
+        (0, 2),
+        (2, 3),
+    ]
+
+
+def test_partition_tsv_row_windows_cover_the_same_rows_as_a_single_table():
+    file_path = example_doc_path("stanley-cups.tsv")
+    table = partition_tsv(file_path)[0]
+
+    elements = partition_tsv(file_path, rows_per_table=3)
+
+    assert len(elements) > 1
+    assert " ".join(e.text for e in elements) == table.text
+    assert all(e.metadata.filename == "stanley-cups.tsv" for e in elements)
+
+
 def test_partition_tsv_supports_chunking_strategy_while_partitioning():
     elements = partition_tsv(filename=example_doc_path("stanley-cups.tsv"))
     chunks = chunk_by_title(elements, max_characters=9, combine_text_under_n_chars=0)
@@ -0,0 +1,169 @@
+"""Test-suite for `unstructured.partition.utils.cache` module."""
+
+from __future__ import annotations
+
+import io
+import os
+import pathlib
+import shutil
+
+import pytest
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.documents.elements import ElementMetadata, NarrativeText, Title
+from unstructured.partition.auto import _PartitionerLoader, partition
+from unstructured.partition.utils.cache import PartitionCache, hash_document_content
+from unstructured.partition.utils.config import env_config
+
+
+class DescribePartitionCache:
+    def it_round_trips_elements_through_the_cache_directory(self, tmp_path: pathlib.Path):
+        cache = PartitionCache(str(tmp_path / "cache"))
+        elements = [
+            Title("Title", metadata=ElementMetadata(page_number=1)),
+            NarrativeText("Some narrative text.", metadata=ElementMetadata(page_number=2)),
+        ]
+        key = cache.make_key("content-hash", "TXT", {"strategy": "fast"})
+
+        assert cache.get(key) is None
+        cache.put(key, elements)
+        cached_elements = cache.get(key)
+
+        assert cached_elements == elements
+        assert cached_elements is not None
+        assert [e.id for e in cached_elements] == [e.id for e in elements]
+        assert [e.metadata.page_number for e in cached_elements] == [1, 2]
+
+    def it_keys_on_content_file_type_arguments_and_environment_settings(self):
+        key = PartitionCache.make_key("abc", "PDF", {"strategy": "hi_res"})
+
+        assert PartitionCache.make_key("abc", "PDF", {"strategy": "hi_res"}) == key
+        assert PartitionCache.make_key("abd", "PDF", {"strategy": "hi_res"}) != key
+        assert PartitionCache.make_key("abc", "PNG", {"strategy": "hi_res"}) != key
+        assert PartitionCache.make_key("abc", "PDF", {"strategy": "fast"}) != key
+        with env_config.pinned(OCR_AGENT="unstructured.partition.utils.ocr_models.paddle_ocr"):
+            assert PartitionCache.make_key("abc", "PDF", {"strategy": "hi_res"}) != key
+
+    def it_evicts_least_recently_used_entries_beyond_its_size_bound(self, tmp_path: pathlib.Path):
+        cache = PartitionCache(str(tmp_path))
+        elements = [NarrativeText("x" * 2000)]
+        cache.put("first", elements)
+        cache.put("second", elements)
+        entry_size = os.path.getsize(tmp_path / "first.json.gz")
+        os.utime(tmp_path / "first.json.gz", (1, 1))
+        os.utime(tmp_path / "second.json.gz", (2, 2))
+        # -- reading "first" makes "second" the least-recently-used entry --
+        cache.get("first")
+        cache._max_size_bytes = 2 * entry_size  # pyright: ignore[reportPrivateUsage]
+
+        cache.put("third", elements)
+
+        assert sorted(os.listdir(tmp_path)) == ["first.json.gz", "third.json.gz"]
+
+    def it_treats_an_unreadable_entry_as_a_miss(self, tmp_path: pathlib.Path):
+        cache = PartitionCache(str(tmp_path))
+        (tmp_path / "broken.json.gz").write_bytes(b"not gzip")
+
+        assert cache.get("broken") is None
+
+    def it_can_clear_all_entries(self, tmp_path: pathlib.Path):
+        cache = PartitionCache(str(tmp_path))
+        cache.put("key", [NarrativeText("text")])
+
+        cache.clear()
+
+        assert cache.get("key") is None
+        assert os.listdir(tmp_path) == []
+
+    def it_rejects_a_size_bound_below_one_byte(self, tmp_path: pathlib.Path):
+        with pytest.raises(ValueError, match="max_size_bytes must be at least 1"):
+            PartitionCache(str(tmp_path), max_size_bytes=0)
+
+
+def test_hash_document_content_is_the_same_for_a_path_or_a_file_like_object():
+    file_path = example_doc_path("simple.json")
+    with open(file_path, "rb") as f:
+        file = io.BytesIO(f.read())
+    file.seek(10)
+
+    assert hash_document_content(filename=file_path) == hash_document_content(file=file)
+    assert file.tell() == 0
+
+
+class Describe_partition_with_a_cache:
+    def it_partitions_the_same_bytes_with_the_same_arguments_only_once(
+        self, tmp_path: pathlib.Path, loader_calls: list[str]
+    ):
+        cache = PartitionCache(str(tmp_path / "cache"))
+        file_path = str(tmp_path / "weather.json")
+        shutil.copy(example_doc_path("spring-weather.html.json"), file_path)
+
+        elements = partition(file_path, partition_cache=cache)
+        cached_elements = partition(file_path, partition_cache=cache)
+
+        assert loader_calls == ["JSON"]
+        assert cached_elements == elements
+        assert [e.metadata.to_dict() for e in cached_elements] == [
+            e.metadata.to_dict() for e in elements
+        ]
+
+    def and_it_gives_cached_elements_new_ids_when_unique_element_ids_are_requested(
+        self, tmp_path: pathlib.Path, loader_calls: list[str]
+    ):
+        cache = PartitionCache(str(tmp_path))
+        file_path = example_doc_path("spring-weather.html.json")
+
+        elements = partition(file_path, partition_cache=cache, unique_element_ids=True)
+        cached_elements = partition(file_path, partition_cache=cache, unique_element_ids=True)
+
+        assert loader_calls == ["JSON"]
+        assert not {e.id for e in elements} & {e.id for e in cached_elements}
+        assert [e.text for e in cached_elements] == [e.text for e in elements]
+        parent_indices = [
+            [e.id for e in es].index(e.metadata.parent_id) if e.metadata.parent_id else None
+            for es in (elements, cached_elements)
+            for e in es
+        ]
+        assert parent_indices[: len(elements)] == parent_indices[len(elements) :]
+        assert any(i is not None for i in parent_indices)
+
+    def but_it_partitions_again_when_the_arguments_differ(
+        self, tmp_path: pathlib.Path, loader_calls: list[str]
+    ):
+        cache = PartitionCache(str(tmp_path))
+        file_path = example_doc_path("spring-weather.html.json")
+
+        partition(file_path, partition_cache=cache)
+        partition(file_path, partition_cache=cache, metadata_filename="other.json")
+        with open(file_path, "rb") as f:
+            partition(file=f, partition_cache=cache, metadata_filename="other.json")
+
+        assert loader_calls == ["JSON", "JSON", "JSON"]
+
+    def and_it_does_not_cache_calls_that_write_image_files(
+        self, tmp_path: pathlib.Path, loader_calls: list[str]
+    ):
+        cache = PartitionCache(str(tmp_path / "cache"))
+        file_path = example_doc_path("spring-weather.html.json")
+
+        for _ in range(2):
+            partition(
+                file_path,
+                partition_cache=cache,
+                extract_image_block_output_dir=str(tmp_path / "images"),
+            )
+
+        assert loader_calls == ["JSON", "JSON"]
+        assert os.listdir(tmp_path / "cache") == []
+
+    @pytest.fixture()
+    def loader_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        calls: list[str] = []
+        get = _PartitionerLoader.get
+
+        def recording_get(self: _PartitionerLoader, file_type):  # type: ignore[no-untyped-def]
+            calls.append(file_type.name)
+            return get(self, file_type)
+
+        monkeypatch.setattr(_PartitionerLoader, "get", recording_get)
+        return calls
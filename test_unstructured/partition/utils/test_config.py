@@ -1,5 +1,7 @@
+import dataclasses
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -56,3 +58,61 @@ def test_env_storage_enabled(monkeypatch):
     assert str(Path.home() / ".cache/unstructured") == env_config.GLOBAL_WORKING_DIR
     assert Path(env_config.GLOBAL_WORKING_PROCESS_DIR).is_dir()
     assert tempfile.gettempdir() == env_config.GLOBAL_WORKING_PROCESS_DIR
+
+
+def test_snapshot_resolves_typed_values_from_the_environment(monkeypatch):
+    monkeypatch.setenv("IMAGE_CROP_PAD", "3")
+    monkeypatch.setenv("UNSTRUCTURED_LANGUAGE_CHECKS", "True")
+    from unstructured.partition.utils.config import env_config
+
+    snapshot = env_config.snapshot()
+
+    assert snapshot.IMAGE_CROP_PAD == 3
+    assert snapshot.UNSTRUCTURED_LANGUAGE_CHECKS is True
+    assert snapshot.UNSTRUCTURED_TITLE_MAX_WORD_LENGTH is None
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.IMAGE_CROP_PAD = 4  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_snapshot_resolves_only_the_settings_read_from_it(monkeypatch):
+    monkeypatch.setenv("IMAGE_CROP_PAD", "not-a-number")
+    monkeypatch.setenv("OCR_MAX_WORKERS", "2")
+    from unstructured.partition.utils.config import env_config
+
+    snapshot = env_config.snapshot()
+
+    assert snapshot.OCR_MAX_WORKERS == 2
+    monkeypatch.setenv("OCR_MAX_WORKERS", "3")
+    assert snapshot.OCR_MAX_WORKERS == 2
+    with pytest.raises(ValueError):
+        snapshot.IMAGE_CROP_PAD
+
+
+def test_pinned_resolves_the_settings_once_for_the_block(monkeypatch):
+    from unstructured.partition.utils.config import env_config
+
+    monkeypatch.setenv("IMAGE_CROP_PAD", "1")
+    with env_config.pinned():
+        snapshot = env_config.snapshot()
+        monkeypatch.setenv("IMAGE_CROP_PAD", "2")
+        with env_config.pinned():
+            assert env_config.snapshot() is snapshot
+        assert env_config.snapshot().IMAGE_CROP_PAD == 1
+
+    assert env_config.snapshot().IMAGE_CROP_PAD == 2
+
+
+def test_pinned_overrides_apply_only_to_the_current_thread():
+    from unstructured.partition.utils.config import env_config
+
+    pads_in_other_thread: list[int] = []
+    with env_config.pinned(IMAGE_CROP_PAD=7):
+        thread = threading.Thread(
+            target=lambda: pads_in_other_thread.append(env_config.snapshot().IMAGE_CROP_PAD)
+        )
+        thread.start()
+        thread.join()
+        assert env_config.snapshot().IMAGE_CROP_PAD == 7
+
+    assert pads_in_other_thread == [0]
+    assert env_config.snapshot().IMAGE_CROP_PAD == 0
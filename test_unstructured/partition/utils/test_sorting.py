@@ -4,11 +4,14 @@ from unstructured_inference.inference.elements import TextRegions
 
 from unstructured.documents.coordinates import PixelSpace
 from unstructured.documents.elements import CoordinatesMetadata, Element, Text
+from unstructured.partition.utils.config import env_config
 from unstructured.partition.utils.constants import SORT_MODE_BASIC, SORT_MODE_XY_CUT
 from unstructured.partition.utils.sorting import (
     coord_has_valid_points,
     coordinates_to_bbox,
     shrink_bbox,
+    sort_bboxes_by_xy_cut,
+    sort_document_elements,
     sort_page_elements,
     sort_text_regions,
 )
@@ -80,6 +83,66 @@ def test_sort_xycut_pos_coordinates():
     assert sort_page_elements(elements, sort_mode=SORT_MODE_XY_CUT) is not elements
 
 
+def _two_column_page() -> list[Element]:
+    """Elements of a two-column page, listed in row order rather than reading order."""
+    elements: list[Element] = []
+    for row in range(3):
+        for column in range(2):
+            elem = Text(f"c{column}r{row}")
+            left, top = 10 + column * 100, 10 + row * 20
+            elem.metadata.coordinates = CoordinatesMetadata(
+                [(left, top), (left, top + 10), (left + 80, top + 10), (left + 80, top)],
+                PixelSpace,
+            )
+            elements.append(elem)
+    return elements
+
+
+def test_sort_xycut_reads_columns_in_order():
+    sorted_page_elements = sort_page_elements(_two_column_page(), sort_mode=SORT_MODE_XY_CUT)
+
+    assert [e.text for e in sorted_page_elements] == [
+        "c0r0",
+        "c0r1",
+        "c0r2",
+        "c1r0",
+        "c1r1",
+        "c1r2",
+    ]
+
+
+def test_sort_xycut_reads_the_primary_direction_from_the_pinned_env_config():
+    with env_config.pinned(UNSTRUCTURED_XY_CUT_PRIMARY_DIRECTION="y"):
+        sorted_page_elements = sort_page_elements(_two_column_page(), sort_mode=SORT_MODE_XY_CUT)
+
+    assert [e.text for e in sorted_page_elements] == [
+        "c0r0",
+        "c1r0",
+        "c0r1",
+        "c1r1",
+        "c0r2",
+        "c1r2",
+    ]
+
+
+def test_sort_document_elements_sorts_each_page_like_sort_page_elements():
+    pages = [_two_column_page(), [], list(reversed(_two_column_page()))]
+
+    sorted_pages = sort_document_elements(pages, sort_mode=SORT_MODE_XY_CUT)
+
+    assert sorted_pages == [sort_page_elements(page, SORT_MODE_XY_CUT) for page in pages]
+
+
+def test_sort_bboxes_by_xy_cut_shrinks_bboxes_like_shrink_bbox(mocker):
+    bboxes = np.array([[0.5, 0.5, 200.7, 100.2], [20.2, 120.9, 320.4, 219.9]])
+    xy_cut_ = mocker.patch("unstructured.partition.utils.sorting.recursive_xy_cut_swapped")
+
+    sort_bboxes_by_xy_cut(bboxes, shrink_factor=0.9)
+
+    shrunken_bboxes = xy_cut_.call_args.args[0]
+    assert shrunken_bboxes.tolist() == [list(shrink_bbox(bbox, 0.9)) for bbox in bboxes]
+
+
 def test_sort_basic_neg_coordinates():
     elements = []
     for idx in range(3):
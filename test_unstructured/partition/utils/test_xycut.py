@@ -25,6 +25,20 @@ def test_projection_by_bboxes():
     assert np.array_equal(result_vertical[:30], expected_result_vertical)
 
 
+def test_projection_by_bboxes_counts_the_boxes_covering_each_position():
+    rng = np.random.default_rng(42)
+    starts = rng.integers(-5, 100, 200)
+    boxes = np.stack([starts, starts, starts + rng.integers(-3, 30, 200), starts + 2], axis=1)
+
+    result = xycut.projection_by_bboxes(boxes, 0)
+
+    # -- the straightforward per-box accumulation, including slice semantics of negative values --
+    expected = np.zeros(np.max(boxes[:, 0::2]), dtype=int)
+    for start, end in boxes[:, 0::2]:
+        expected[start:end] += 1
+    assert np.array_equal(result, expected)
+
+
 def test_split_projection_profile():
     # Test case 1: Sample projection profile with given min_value and min_gap
     arr_values = np.array([0, 0, 3, 4, 0, 0, 2, 0, 0, 0, 5, 6, 7, 0, 0, 0])
@@ -58,6 +72,40 @@ def test_recursive_xy_cut(recursive_func, expected):
     assert res == expected
 
 
+@pytest.mark.parametrize("recursive_func", [xycut.recursive_xy_cut, xycut.recursive_xy_cut_swapped])
+def test_recursive_xy_cut_cuts_nested_regions_in_reading_order(recursive_func):
+    boxes = np.array(
+        [
+            # -- two columns of two rows --
+            [0, 0, 20, 20],
+            [200, 0, 230, 30],
+            [0, 40, 50, 50],
+            [200, 40, 230, 50],
+            # -- full-width row beneath them, so the page cannot be cut into columns first --
+            [0, 100, 230, 110],
+            [0, 120, 50, 130],
+            [100, 120, 230, 130],
+        ]
+    )
+    res = []
+
+    recursive_func(boxes, np.arange(len(boxes)), res)
+
+    assert res == [0, 1, 2, 3, 4, 5, 6]
+
+
+@pytest.mark.parametrize("recursive_func", [xycut.recursive_xy_cut, xycut.recursive_xy_cut_swapped])
+def test_recursive_xy_cut_cuts_deeply_nested_regions_without_recursing(recursive_func):
+    # -- a staircase of boxes, each cut separates off one more box along the other axis --
+    n = 300
+    boxes = np.array([[i * 10, i * 10, i * 10 + 5, i * 10 + 5] for i in range(n)])
+    res = []
+
+    recursive_func(boxes, np.arange(n), res)
+
+    assert res == list(range(n))
+
+
 def test_points_to_bbox():
     # Test a valid case
     points = [10, 20, 30, 40, 50, 60, 70, 80]
@@ -0,0 +1,112 @@
+import os
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from unstructured.documents.coordinates import PixelSpace
+from unstructured.documents.elements import (
+    CheckBox,
+    CoordinatesMetadata,
+    DataSourceMetadata,
+    ElementMetadata,
+    Link,
+    NarrativeText,
+    Table,
+    Text,
+    Title,
+)
+from unstructured.staging import arrow, base
+
+
+def _example_elements() -> list:
+    metadata = ElementMetadata(
+        coordinates=CoordinatesMetadata(
+            points=((1.0, 2.0), (1.0, 4.0), (3.0, 4.0), (3.0, 2.0)),
+            system=PixelSpace(width=10, height=20),
+        ),
+        data_source=DataSourceMetadata(url="http://mysite.com", record_locator={"value": 3}),
+        filename="fake-file.pdf",
+        languages=["eng"],
+        links=[Link(text="text", url="url", start_index=1)],
+        page_number=2,
+        detection_class_prob=0.5,
+        is_continuation=True,
+        link_start_indexes=[1, 7],
+    )
+    metadata.ad_hoc_field = {"some": ["user", "data"]}
+    return [
+        Title(text="Title 1", element_id="1", metadata=ElementMetadata(page_number=1)),
+        NarrativeText(
+            text="Narrative 1",
+            element_id="2",
+            metadata=metadata,
+            embeddings=np.array([0.1, 0.2, 0.3], dtype=np.float32),
+        ),
+        Table(
+            text="a b",
+            element_id="3",
+            metadata=ElementMetadata(
+                text_as_html="<table><tr><td>a</td><td>b</td></tr></table>",
+                table_as_cells={"x": 0, "y": 0, "w": 1, "h": 1, "content": "a"},
+            ),
+        ),
+        CheckBox(checked=True, element_id="4"),
+        Text(text="text", element_id="5"),
+    ]
+
+
+def test_elements_round_trip_losslessly_through_parquet(tmp_path: str):
+    elements = _example_elements()
+    filename = os.path.join(tmp_path, "elements.parquet")
+
+    arrow.elements_to_parquet(elements, filename)
+    new_elements = arrow.elements_from_parquet(filename)
+
+    assert new_elements == elements
+    assert base.elements_to_dicts(new_elements) == base.elements_to_dicts(elements)
+    assert new_elements[1].metadata.ad_hoc_field == {"some": ["user", "data"]}
+
+
+def test_elements_to_parquet_writes_one_row_group_per_batch(tmp_path: str):
+    elements = [Text(text=f"text {i}", element_id=str(i)) for i in range(7)]
+    filename = os.path.join(tmp_path, "elements.parquet")
+
+    arrow.elements_to_parquet(iter(elements), filename, batch_size=3)
+
+    assert pq.ParquetFile(filename).num_row_groups == 3
+    assert list(arrow.iter_elements_from_parquet(filename)) == elements
+
+
+def test_elements_to_arrow_batches_gives_typed_metadata_columns():
+    (batch,) = arrow.elements_to_arrow_batches(_example_elements())
+
+    assert batch.num_rows == 5
+    assert batch.column("type").to_pylist() == [
+        "Title",
+        "NarrativeText",
+        "Table",
+        "CheckBox",
+        "UncategorizedText",
+    ]
+    assert batch.column("page_number").to_pylist() == [1, 2, None, None, None]
+    assert batch.column("languages").to_pylist() == [None, ["eng"], None, None, None]
+    assert batch.column("coordinates_system").to_pylist()[1] == "PixelSpace"
+
+
+def test_list_embeddings_are_restored_as_float32_arrays(tmp_path: str):
+    elements = [Text(text="text", element_id="1", embeddings=[0.1, 0.2])]
+    filename = os.path.join(tmp_path, "elements.parquet")
+
+    arrow.elements_to_parquet(elements, filename)
+    (new_element,) = arrow.elements_from_parquet(filename)
+
+    assert new_element.embeddings.dtype == np.float32
+    assert new_element.to_dict()["embeddings"] == np.float32([0.1, 0.2]).tolist()
+
+
+def test_elements_from_arrow_batch_reads_a_sliced_batch():
+    (batch,) = arrow.elements_to_arrow_batches(_example_elements())
+
+    new_elements = arrow.elements_from_arrow_batch(batch.slice(1, 2))
+
+    assert new_elements == _example_elements()[1:3]
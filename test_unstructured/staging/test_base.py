@@ -5,6 +5,7 @@ import pathlib
 import platform
 import tempfile
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -240,6 +241,36 @@ def test_serialized_deserialize_elements_to_json(tmpdir: str):
     assert elements == new_elements_text
 
 
+def test_elements_from_dicts_restores_list_embeddings():
+    elements = [Text(text="text", element_id="1", embeddings=[1.1, 2.2, 3.3])]
+
+    assert base.elements_from_dicts(base.elements_to_dicts(elements)) == elements
+
+
+def test_elements_to_json_can_serialize_embeddings_as_base64_float32():
+    matrix = np.array([[0.1, -2.5, 3.25], [1e-8, 4.0, -0.3]], dtype=np.float32)
+    elements = [
+        Text(text="text", element_id="1", embeddings=matrix[0]),
+        Title(text="title", element_id="2", embeddings=matrix[1]),
+        CheckBox(checked=True, element_id="3"),
+    ]
+
+    json_str = base.elements_to_json(elements, embeddings_format="base64")
+
+    element_dicts = json.loads(json_str)
+    assert all(isinstance(d["embeddings"], str) for d in element_dicts[:2])
+    new_elements = base.elements_from_json(text=json_str)
+    assert new_elements == elements
+    for element, row in zip(new_elements, matrix):
+        assert element.embeddings.dtype == np.float32
+        assert element.embeddings.tobytes() == row.tobytes()
+
+
+def test_elements_to_dicts_raises_on_unknown_embeddings_format():
+    with pytest.raises(ValueError, match="embeddings_format must be 'list' or 'base64'"):
+        base.elements_to_dicts([Text("text")], embeddings_format="npy")  # pyright: ignore
+
+
 def test_read_and_write_json_with_encoding():
     elements = partition_text("example-docs/fake-text-utf-16-be.txt")
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import inspect
+import itertools
 import json
 import os
 
@@ -88,6 +90,33 @@ def test_requires_dependencies_decorator_in_class():
     TestClass()
 
 
+def test_get_call_args_applying_defaults_maps_positional_keyword_and_default_args():
+    def fake_partitioner(filename, file=None, *, languages=("eng",), strategy="auto"):
+        return []
+
+    call_args = utils.get_call_args_applying_defaults(fake_partitioner, "a.txt", strategy="fast")
+
+    assert call_args == {
+        "filename": "a.txt",
+        "file": None,
+        "languages": ("eng",),
+        "strategy": "fast",
+    }
+
+
+def test_get_call_args_applying_defaults_computes_signature_only_once_per_function(mocker):
+    def fake_partitioner(filename, file=None, strategy="auto"):
+        return []
+
+    signature_ = mocker.spy(inspect, "signature")
+
+    for _ in range(3):
+        call_args = utils.get_call_args_applying_defaults(fake_partitioner, "a.txt")
+
+    assert call_args == {"filename": "a.txt", "file": None, "strategy": "auto"}
+    assert [c.args for c in signature_.call_args_list].count((fake_partitioner,)) == 1
+
+
 @pytest.mark.parametrize("iterator", [[0, 1], (0, 1), range(10), [0], (0,), range(1)])
 def test_first_gives_first(iterator):
     assert utils.first(iterator) == 0
@@ -312,6 +341,73 @@ def test_catch_overlapping_and_nested_bboxes_non_overlapping_case():
     assert overlapping_cases == []
 
 
+def test_catch_overlapping_and_nested_bboxes_reports_the_same_cases_as_checking_every_pair():
+    elements = [
+        NarrativeText(
+            text=f"line {row} word {col}",
+            coordinates=(
+                (col * 30, row * 12),
+                (col * 30, row * 12 + 14),
+                (col * 30 + 34, row * 12 + 14),
+                (col * 30 + 34, row * 12),
+            ),
+            coordinate_system=PixelSpace(width=400, height=400),
+            metadata=ElementMetadata(page_number=1),
+        )
+        for row in range(8)
+        for col in range(6)
+    ]
+    labels = [f"{ix}. {e.category}" for ix, e in enumerate(elements)]
+    expected_cases = [
+        case[:3]
+        for case in (
+            utils.identify_overlapping_or_nesting_case(
+                (
+                    elements[i].metadata.coordinates.to_dict()["points"],
+                    elements[j].metadata.coordinates.to_dict()["points"],
+                ),
+                (labels[i], labels[j]),
+                (elements[i].text, elements[j].text),
+            )
+            for i, j in itertools.combinations(range(len(elements)), 2)
+        )
+        if case[2]
+    ]
+
+    overlapping_flag, overlapping_cases = utils.catch_overlapping_and_nested_bboxes(elements)
+
+    assert overlapping_flag is True
+    assert [
+        (case["overlapping_elements"], case["parent_element"], case["overlapping_case"])
+        for case in overlapping_cases
+    ] == [tuple(case) for case in expected_cases]
+
+
+def test_catch_overlapping_and_nested_bboxes_only_examines_intersecting_pairs(mocker):
+    # -- a diagonal of boxes where each box only touches the next one --
+    elements = [
+        Title(
+            text=f"Title {i}",
+            coordinates=(
+                (i * 10, i * 10),
+                (i * 10, i * 10 + 12),
+                (i * 10 + 12, i * 10 + 12),
+                (i * 10 + 12, i * 10),
+            ),
+            coordinate_system=PixelSpace(width=2000, height=2000),
+            metadata=ElementMetadata(page_number=1),
+        )
+        for i in range(100)
+    ]
+    identify_ = mocker.spy(utils, "identify_overlapping_or_nesting_case")
+
+    overlapping_flag, overlapping_cases = utils.catch_overlapping_and_nested_bboxes(elements)
+
+    assert overlapping_flag is True
+    assert len(overlapping_cases) == 99
+    assert identify_.call_count == 99
+
+
 def test_only_returns_singleton_iterable():
     singleton_iterable = [42]
     result = utils.only(singleton_iterable)
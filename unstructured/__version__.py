@@ -1 +1 @@
-__version__ = "0.17.11-dev2"  # pragma: no cover
+__version__ = "0.17.11-dev27"  # pragma: no cover
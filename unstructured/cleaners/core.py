@@ -1,12 +1,11 @@
 from __future__ import annotations
 
+import functools
 import quopri
 import re
 import sys
 import unicodedata
-from typing import Optional, Tuple
-
-import numpy as np
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 from unstructured.file_utils.encoding import (
     format_encoding_str,
@@ -21,6 +20,9 @@ from unstructured.nlp.patterns import (
     UNICODE_BULLETS_RE_0W,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def clean_non_ascii_chars(text) -> str:
     """Cleans non-ascii characters from unicode string.
@@ -293,23 +295,45 @@ def replace_unicode_quotes(text: str) -> str:
     return text
 
 
-tbl = dict.fromkeys(
-    i for i in range(sys.maxunicode) if unicodedata.category(chr(i)).startswith("P")
-)
+@functools.lru_cache(maxsize=1)
+def _punctuation_translation_table() -> dict[int, None]:
+    """`str.translate()` table deleting every unicode punctuation character.
+
+    Scanning all of unicode takes a few hundred milliseconds so this is built on first use rather
+    than at import time.
+    """
+    return dict.fromkeys(
+        i for i in range(sys.maxunicode) if unicodedata.category(chr(i)).startswith("P")
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily provide the `tbl` punctuation translation-table for existing importers."""
+    if name == "tbl":
+        return _punctuation_translation_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def remove_punctuation(s: str) -> str:
     """Removes punctuation from a given string."""
-    s = s.translate(tbl)
+    s = s.translate(_punctuation_translation_table())
     return s
 
 
-def remove_sentence_punctuation(s: str, exclude_punctuation: Optional[list]) -> str:
-    tbl_new = tbl.copy()
+def sentence_punctuation_translation_table(
+    exclude_punctuation: Optional[list] = None,
+) -> dict[int, None]:
+    """New `str.translate()` table deleting every unicode punctuation character except those in
+    `exclude_punctuation`."""
+    tbl_new = _punctuation_translation_table().copy()
     if exclude_punctuation:
         for punct in exclude_punctuation:
             del tbl_new[ord(punct)]
-    s = s.translate(tbl_new)
+    return tbl_new
+
+
+def remove_sentence_punctuation(s: str, exclude_punctuation: Optional[list]) -> str:
+    s = s.translate(sentence_punctuation_translation_table(exclude_punctuation))
     return s
 
 
@@ -445,6 +469,8 @@ def clean_extra_whitespace_with_index_run(text: str) -> Tuple[str, np.ndarray]:
 
     cleaned_text = cleaned_text.strip()
 
+    import numpy as np
+
     moved_indices = np.zeros(len(text))
 
     distance, original_index, cleaned_index = 0, 0, 0
@@ -6,12 +6,13 @@ import dataclasses as dc
 import enum
 import functools
 import hashlib
+import operator
 import os
 import pathlib
 import uuid
 from itertools import groupby
 from types import MappingProxyType
-from typing import Any, Callable, FrozenSet, Optional, Sequence, cast
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, cast
 
 from typing_extensions import ParamSpec, TypeAlias, TypedDict
 
@@ -21,10 +22,17 @@ from unstructured.documents.coordinates import (
     RelativeCoordinateSystem,
 )
 from unstructured.partition.utils.constants import UNSTRUCTURED_INCLUDE_DEBUG_METADATA
-from unstructured.utils import get_call_args_applying_defaults, lazyproperty
+from unstructured.utils import get_call_args_applying_defaults
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
 Point: TypeAlias = "tuple[float, float]"
 Points: TypeAlias = "tuple[Point, ...]"
+# -- an embedding vector is either a list of floats or a 1D float32 NumPy array, often a row-view
+# -- into a matrix holding the embeddings for a whole batch of elements.
+Embeddings: TypeAlias = "list[float] | npt.NDArray[np.float32]"
 
 
 @dc.dataclass
@@ -147,12 +155,21 @@ class FormKeyValuePair(TypedDict):
 
 
 class ElementMetadata:
-    """Fully-dynamic replacement for dataclass-based ElementMetadata."""
+    """Fully-dynamic replacement for dataclass-based ElementMetadata.
+
+    Instances are kept small because a large document can produce hundreds of thousands of them.
+    The most commonly populated known fields are stored in slots, where `None` means the field is
+    not populated. All other populated fields, known or ad-hoc, are stored in a single dict that is
+    only created when the first such field is assigned.
+    """
 
     # NOTE(scanny): To add a field:
     # - Add the field declaration with type here at the top. This makes it a "known" field and
     #   enables type-checking and completion.
-    # - Add a parameter with default for field in __init__() and assign it in __init__() body.
+    # - Add a parameter with default for field in __init__() and assign it in __init__() body,
+    #   either to its slot when it is listed in `__slots__` or otherwise in `extra_fields`. Only
+    #   list a field in `__slots__` when it is commonly populated, each slot adds 8 bytes to every
+    #   instance. Debug fields are never listed there.
     # - Add a consolidation strategy for the new field in
     #   `ConsolidationStrategy.field_consolidation_strategies()` below. This strategy will be used
     #   to consolidate this new metadata field from each pre-chunk element during chunking.
@@ -207,6 +224,9 @@ class ElementMetadata:
     # -- used for Table elements to capture rows/col structure --
     text_as_html: Optional[str]
     table_as_cells: Optional[dict[str, str | int]]
+    # -- row range `[start, end)` of source-table data rows, when a table is split by rows --
+    table_row_start: Optional[int]
+    table_row_end: Optional[int]
     url: Optional[str]
 
     # -- debug fields can be assigned and referenced using dotted-notation but are not serialized
@@ -214,6 +234,26 @@ class ElementMetadata:
     # -- `.fields` dict used by other parts of the library like chunking and weaviate.
     DEBUG_FIELD_NAMES = frozenset(["detection_origin"])
 
+    __slots__ = (
+        "category_depth",
+        "coordinates",
+        "data_source",
+        "detection_class_prob",
+        "file_directory",
+        "filename",
+        "filetype",
+        "languages",
+        "last_modified",
+        "page_number",
+        "parent_id",
+        "text_as_html",
+        # -- populated fields not stored in a slot, None when there are none --
+        "_extra_fields",
+    )
+
+    # -- field-names for non-user-defined fields, available on all ElementMetadata instances --
+    _known_field_names = frozenset(__annotations__)
+
     def __init__(
         self,
         attached_to_filename: Optional[str] = None,
@@ -250,53 +290,67 @@ class ElementMetadata:
         signature: Optional[str] = None,
         subject: Optional[str] = None,
         table_as_cells: Optional[dict[str, str | int]] = None,
+        table_row_end: Optional[int] = None,
+        table_row_start: Optional[int] = None,
         text_as_html: Optional[str] = None,
         url: Optional[str] = None,
     ) -> None:
-        self.attached_to_filename = attached_to_filename
-        self.bcc_recipient = bcc_recipient
-        self.category_depth = category_depth
-        self.cc_recipient = cc_recipient
-        self.coordinates = coordinates
-        self.data_source = data_source
-        self.detection_class_prob = detection_class_prob
-        self.emphasized_text_contents = emphasized_text_contents
-        self.emphasized_text_tags = emphasized_text_tags
-
         # -- accommodate pathlib.Path for filename --
         filename = str(filename) if isinstance(filename, pathlib.Path) else filename
         # -- produces "", "" when filename arg is None --
         directory_path, file_name = os.path.split(filename or "")
+
+        # -- assign slots directly; none of these are debug fields so `__setattr__()` would only
+        # -- add overhead to each construction.
+        set_slot = object.__setattr__
+        set_slot(self, "category_depth", category_depth)
+        set_slot(self, "coordinates", coordinates)
+        set_slot(self, "data_source", data_source)
+        set_slot(self, "detection_class_prob", detection_class_prob)
         # -- prefer `file_directory` arg if specified, otherwise split of file-path passed as
         # -- `filename` arg, or None if `filename` is the empty string.
-        self.file_directory = file_directory or directory_path or None
-        self.filename = file_name or None
-
-        self.filetype = filetype
-        self.header_footer_type = header_footer_type
-        self.image_base64 = image_base64
-        self.image_mime_type = image_mime_type
-        self.image_url = image_url
-        self.image_path = image_path
-        self.is_continuation = is_continuation
-        self.languages = languages
-        self.last_modified = last_modified
-        self.link_texts = link_texts
-        self.link_urls = link_urls
-        self.link_start_indexes = link_start_indexes
-        self.links = links
-        self.email_message_id = email_message_id
-        self.orig_elements = orig_elements
-        self.page_name = page_name
-        self.page_number = page_number
-        self.parent_id = parent_id
-        self.sent_from = sent_from
-        self.sent_to = sent_to
-        self.signature = signature
-        self.subject = subject
-        self.text_as_html = text_as_html
-        self.table_as_cells = table_as_cells
-        self.url = url
+        set_slot(self, "file_directory", file_directory or directory_path or None)
+        set_slot(self, "filename", file_name or None)
+        set_slot(self, "filetype", filetype)
+        set_slot(self, "languages", languages)
+        set_slot(self, "last_modified", last_modified)
+        set_slot(self, "page_number", page_number)
+        set_slot(self, "parent_id", parent_id)
+        set_slot(self, "text_as_html", text_as_html)
+
+        extra_fields = {
+            "attached_to_filename": attached_to_filename,
+            "bcc_recipient": bcc_recipient,
+            "cc_recipient": cc_recipient,
+            "email_message_id": email_message_id,
+            "emphasized_text_contents": emphasized_text_contents,
+            "emphasized_text_tags": emphasized_text_tags,
+            "header_footer_type": header_footer_type,
+            "image_base64": image_base64,
+            "image_mime_type": image_mime_type,
+            "image_path": image_path,
+            "image_url": image_url,
+            "is_continuation": is_continuation,
+            "link_start_indexes": link_start_indexes,
+            "link_texts": link_texts,
+            "link_urls": link_urls,
+            "links": links,
+            "orig_elements": orig_elements,
+            "page_name": page_name,
+            "sent_from": sent_from,
+            "sent_to": sent_to,
+            "signature": signature,
+            "subject": subject,
+            "table_as_cells": table_as_cells,
+            "table_row_end": table_row_end,
+            "table_row_start": table_row_start,
+            "url": url,
+        }
+        set_slot(
+            self,
+            "_extra_fields",
+            {name: value for name, value in extra_fields.items() if value is not None} or None,
+        )
 
     def __eq__(self, other: object) -> bool:
         """Implments equivalence, like meta == other_meta.
@@ -306,23 +360,60 @@ class ElementMetadata:
         """
         if not isinstance(other, ElementMetadata):
             return False
-        return self.fields == other.fields
+        if _get_slot_field_values(self) != _get_slot_field_values(other):
+            return False
+        # -- extra-fields dicts can only differ in debug fields and still be equal --
+        return self._extra_fields == other._extra_fields or self.fields == other.fields
 
-    def __getattr__(self, attr_name: str) -> None:
-        """Only called when attribute doesn't exist."""
+    def __getattr__(self, attr_name: str) -> Any:
+        """Only called when attribute doesn't exist as a class attribute or populated slot."""
+        # -- a slot is only unassigned when a subclass `__init__()` does not call this one --
+        if attr_name == "_extra_fields":
+            return None
+        extra_fields = self._extra_fields
+        if extra_fields is not None and attr_name in extra_fields:
+            return extra_fields[attr_name]
         if attr_name in self._known_field_names:
             return None
         raise AttributeError(f"'ElementMetadata' object has no attribute '{attr_name}'")
 
     def __setattr__(self, __name: str, __value: Any) -> None:
+        if __name in _ELEMENT_METADATA_SLOT_NAMES:
+            object.__setattr__(self, __name, __value)
+            return
+
+        extra_fields = self._extra_fields
         if __value is None:
-            # -- can't use `hasattr()` for this because it calls `__getattr__()` to find out --
-            if __name in self.__dict__:
-                delattr(self, __name)
+            if extra_fields is not None:
+                extra_fields.pop(__name, None)
             return
         if not UNSTRUCTURED_INCLUDE_DEBUG_METADATA and __name in self.DEBUG_FIELD_NAMES:
             return
-        super().__setattr__(__name, __value)
+        if extra_fields is None:
+            object.__setattr__(self, "_extra_fields", {__name: __value})
+        else:
+            extra_fields[__name] = __value
+
+    def __delattr__(self, __name: str) -> None:
+        if __name in _ELEMENT_METADATA_SLOT_NAMES:
+            object.__setattr__(self, __name, None)
+            return
+        extra_fields = self._extra_fields
+        if extra_fields is None or __name not in extra_fields:
+            raise AttributeError(__name)
+        del extra_fields[__name]
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Populated fields, including debug fields, used by `copy` and `pickle`.
+
+        This is a new dict so a copy never shares its extra-fields dict with the original.
+        """
+        return {**self._populated_slot_fields(), **(self._extra_fields or {})}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        ElementMetadata.__init__(self)
+        for field_name, field_value in state.items():
+            setattr(self, field_name, field_value)
 
     @classmethod
     def from_dict(cls, meta_dict: dict[str, Any]) -> ElementMetadata:
@@ -333,10 +424,10 @@ class ElementMetadata:
         """
         from unstructured.staging.base import elements_from_base64_gzipped_json
 
-        # -- avoid unexpected mutation by working on a copy of provided dict --
-        meta_dict = copy.deepcopy(meta_dict)
         self = ElementMetadata()
         for field_name, field_value in meta_dict.items():
+            # -- avoid unexpected mutation by working on a copy of provided value --
+            field_value = _copy_field_value(field_value)
             if field_name == "coordinates":
                 self.coordinates = CoordinatesMetadata.from_dict(field_value)
             elif field_name == "data_source":
@@ -354,16 +445,17 @@ class ElementMetadata:
     def fields(self) -> MappingProxyType[str, Any]:
         """Populated metadata fields in this object as a read-only dict.
 
-        Basically `self.__dict__` but it needs a little filtering to remove entries like
-        "_known_field_names". Note this is a *snapshot* and will not reflect later changes.
+        Both known and ad-hoc fields are included but debug fields are not. Note this is a
+        *snapshot* and will not reflect later changes.
         """
-        return MappingProxyType(
-            {
-                field_name: field_value
-                for field_name, field_value in self.__dict__.items()
-                if not field_name.startswith("_") and field_name not in self.DEBUG_FIELD_NAMES
-            }
-        )
+        fields = self._populated_slot_fields()
+        if (extra_fields := self._extra_fields) is not None:
+            fields.update(
+                (field_name, field_value)
+                for field_name, field_value in extra_fields.items()
+                if field_name not in self.DEBUG_FIELD_NAMES
+            )
+        return MappingProxyType(fields)
 
     @property
     def known_fields(self) -> MappingProxyType[str, Any]:
@@ -373,14 +465,15 @@ class ElementMetadata:
         instance by assignment are not. Note this is a *snapshot* and will not reflect changes that
         occur after this call.
         """
-        known_field_names = self._known_field_names
-        return MappingProxyType(
-            {
-                field_name: field_value
-                for field_name, field_value in self.__dict__.items()
-                if (field_name in known_field_names and field_name not in self.DEBUG_FIELD_NAMES)
-            }
-        )
+        fields = self._populated_slot_fields()
+        if (extra_fields := self._extra_fields) is not None:
+            known_field_names = self._known_field_names
+            fields.update(
+                (field_name, field_value)
+                for field_name, field_value in extra_fields.items()
+                if field_name in known_field_names and field_name not in self.DEBUG_FIELD_NAMES
+            )
+        return MappingProxyType(fields)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert this metadata to dict form, suitable for JSON serialization.
@@ -390,17 +483,12 @@ class ElementMetadata:
         """
         from unstructured.staging.base import elements_to_base64_gzipped_json
 
-        meta_dict = copy.deepcopy(dict(self.fields))
-
-        # -- remove fields that should not be serialized --
-        for field_name in self.DEBUG_FIELD_NAMES:
-            meta_dict.pop(field_name, None)
-
-        # -- don't serialize empty lists --
         meta_dict: dict[str, Any] = {
-            field_name: value
-            for field_name, value in meta_dict.items()
-            if value != [] and value != {}
+            # -- copy values so changes to the dict can't reach this metadata --
+            field_name: _copy_field_value(value)
+            for field_name, value in self.fields.items()
+            # -- sub-objects are serialized below, don't serialize empty lists --
+            if field_name not in _SUB_OBJECT_FIELD_NAMES and value != [] and value != {}
         }
 
         # -- serialize sub-object types when present --
@@ -435,17 +523,34 @@ class ElementMetadata:
         for field_name, field_value in other.fields.items():
             setattr(self, field_name, field_value)
 
-    @lazyproperty
-    def _known_field_names(self) -> FrozenSet[str]:
-        """field-names for non-user-defined fields, available on all ElementMetadata instances.
+    def _populated_slot_fields(self) -> dict[str, Any]:
+        """New dict of the populated fields stored in slots."""
+        return {
+            field_name: field_value
+            for field_name, field_value in zip(
+                _ELEMENT_METADATA_SLOT_FIELD_NAMES, _get_slot_field_values(self)
+            )
+            if field_value is not None
+        }
 
-        Note that the first call to this lazyproperty adds a `"_known_field_names"` item to the
-        `__dict__` of this instance, so this be called *before* iterating through `self.__dict__`
-        to avoid a mid-iteration mutation.
-        """
-        # -- self.__annotations__ is a dict and iterating it produces its keys, which are the
-        # -- field-names we want here.
-        return frozenset(self.__annotations__)
+
+# -- names of the `ElementMetadata` fields stored in slots, in `__slots__` order --
+_ELEMENT_METADATA_SLOT_FIELD_NAMES = tuple(
+    name for name in ElementMetadata.__slots__ if name != "_extra_fields"
+)
+_ELEMENT_METADATA_SLOT_NAMES = frozenset(ElementMetadata.__slots__)
+_get_slot_field_values = operator.attrgetter(*_ELEMENT_METADATA_SLOT_FIELD_NAMES)
+# -- `ElementMetadata` fields holding objects that `.to_dict()` serializes on their own --
+_SUB_OBJECT_FIELD_NAMES = frozenset(
+    ["coordinates", "data_source", "key_value_pairs", "orig_elements"]
+)
+
+
+def _copy_field_value(value: Any) -> Any:
+    """Deep-copy of metadata field `value`, skipping the copy for common immutable values."""
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    return copy.deepcopy(value)
 
 
 class ConsolidationStrategy(enum.Enum):
@@ -516,6 +621,8 @@ class ConsolidationStrategy(enum.Enum):
             "subject": cls.FIRST,
             "text_as_html": cls.STRING_CONCATENATE,
             "table_as_cells": cls.FIRST,  # -- only occurs in Table --
+            "table_row_end": cls.FIRST,  # -- only occurs in Table --
+            "table_row_start": cls.FIRST,  # -- only occurs in Table --
             "url": cls.FIRST,
             "key_value_pairs": cls.DROP,  # -- only occurs in FormKeysValues --
         }
@@ -543,11 +650,14 @@ def assign_and_map_hash_ids(elements: list[Element]) -> list[Element]:
         seq_on_page for _, group in groupby(page_numbers) for seq_on_page, _ in enumerate(group)
     ]
 
-    # -- assign hash IDs to elements --
-    old_to_new_mapping = {
-        element.id: element.id_to_hash(seq_on_page_counter)
-        for element, seq_on_page_counter in zip(elements, page_seq_pairs)
-    }
+    # -- assign hash IDs to elements. An element without an ID yet cannot be referenced as a parent,
+    # -- so it is hashed without first being given a UUID to map from.
+    old_to_new_mapping: dict[str, str] = {}
+    for element, seq_on_page_counter in zip(elements, page_seq_pairs):
+        old_id = element._element_id
+        new_id = element.id_to_hash(seq_on_page_counter)
+        if old_id is not None:
+            old_to_new_mapping[old_id] = new_id
 
     # -- map old parent IDs to new ones --
     for e in elements:
@@ -559,13 +669,34 @@ def assign_and_map_hash_ids(elements: list[Element]) -> list[Element]:
     return elements
 
 
+def assign_and_map_new_uuids(elements: list[Element]) -> list[Element]:
+    """Gives each element a new UUID `id`, updating `parent_id`s to the new IDs of their parents.
+
+    For elements that must not share IDs with earlier copies of them, e.g. elements read from a
+    cache or copied from another attachment, when UUIDs were requested.
+    """
+    new_id_by_old_id: dict[str, str] = {}
+    for element in elements:
+        new_id = str(uuid.uuid4())
+        new_id_by_old_id[element.id] = new_id
+        element._element_id = new_id
+
+    for element in elements:
+        parent_id = element.metadata.parent_id
+        if parent_id is not None and parent_id in new_id_by_old_id:
+            element.metadata.parent_id = new_id_by_old_id[parent_id]
+
+    return elements
+
+
 def process_metadata() -> Callable[[Callable[_P, list[Element]]], Callable[_P, list[Element]]]:
     """Post-process element-metadata for this document.
 
     This decorator adds a post-processing step to a document partitioner.
 
     - Adds `metadata_filename` parameter to docstring if not present.
-    - Updates element.id to a UUID when `unique_element_ids` argument is provided and True.
+    - Updates element.id to a hash unless `unique_element_ids` argument is provided and True.
+    - Computes and applies `parent_id` metadata, in the same pass as the hashing.
 
     """
 
@@ -582,12 +713,26 @@ def process_metadata() -> Callable[[Callable[_P, list[Element]]], Callable[_P, l
 
         @functools.wraps(func)
         def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> list[Element]:
+            from unstructured.partition.common.metadata import (
+                assign_hash_ids_and_hierarchy,
+                set_element_hierarchy,
+            )
+
             elements = func(*args, **kwargs)
             call_args = get_call_args_applying_defaults(func, *args, **kwargs)
 
+            # NOTE (yao): do not use cast here as cast(None) still is None
+            # NOTE(alan): Skip hierarchy if using chipper, as it should take care of that
+            assign_hierarchy = not str(kwargs.get("model_name", "")).startswith("chipper")
             unique_element_ids: bool = call_args.get("unique_element_ids", False)
             if unique_element_ids is False:
-                elements = assign_and_map_hash_ids(elements)
+                elements = (
+                    assign_hash_ids_and_hierarchy(elements)
+                    if assign_hierarchy
+                    else assign_and_map_hash_ids(elements)
+                )
+            elif assign_hierarchy:
+                elements = set_element_hierarchy(elements)
 
             return elements
 
@@ -812,11 +957,11 @@ class Text(Element):
         coordinate_system: Optional[CoordinateSystem] = None,
         metadata: Optional[ElementMetadata] = None,
         detection_origin: Optional[str] = None,
-        embeddings: Optional[list[float]] = None,
+        embeddings: Optional[Embeddings] = None,
     ):
         metadata = metadata if metadata else ElementMetadata()
         self.text: str = text
-        self.embeddings: Optional[list[float]] = embeddings
+        self.embeddings: Optional[Embeddings] = embeddings
 
         super().__init__(
             element_id=element_id,
@@ -834,7 +979,7 @@ class Text(Element):
                 self.text == other.text,
                 self.metadata.coordinates == other.metadata.coordinates,
                 self.category == other.category,
-                self.embeddings == other.embeddings,
+                _embeddings_are_equal(self.embeddings, other.embeddings),
             ),
         )
 
@@ -862,8 +1007,12 @@ class Text(Element):
         out["element_id"] = self.id
         out["type"] = self.category
         out["text"] = self.text
-        if self.embeddings:
-            out["embeddings"] = self.embeddings
+        embeddings = self.embeddings
+        # -- a float32 array (or row-view of a batch matrix) is rendered as a JSON list --
+        if embeddings is not None and not isinstance(embeddings, list):
+            embeddings = embeddings.tolist()
+        if embeddings:
+            out["embeddings"] = embeddings
         return out
 
 
@@ -975,6 +1124,18 @@ class FormKeysValues(Text):
     category = "FormKeysValues"
 
 
+def _embeddings_are_equal(a: Optional[Embeddings], b: Optional[Embeddings]) -> bool:
+    """True when `a` and `b` hold the same embedding vector, whether as a list or an array."""
+    if a is None or b is None:
+        return a is b
+    if isinstance(a, list) and isinstance(b, list):
+        return a == b
+
+    import numpy as np
+
+    return bool(np.array_equal(a, b))
+
+
 TYPE_TO_TEXT_ELEMENT_MAP: dict[str, type[Text]] = {
     ElementType.TITLE: Title,
     ElementType.SECTION_HEADER: Title,
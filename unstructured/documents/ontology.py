@@ -75,6 +75,32 @@ class OntologyElement(BaseModel):
         return str(uuid.uuid4()).replace("-", "")
 
     def to_html(self, add_children: bool = True) -> str:
+        children_html = self._generate_children_html(add_children)
+        return self.wrap_children_html(children_html)
+
+    def to_html_memoized(self, html_cache: dict[int, str]) -> str:
+        """
+        Returns the HTML of the element with its children, rendering each subtree only once.
+
+        The tree is walked bottom-up without recursion and the HTML of every node is stored in
+        `html_cache` under `id(node)`, so callers that need the HTML of several nodes of the
+        same tree (e.g. for `to_text`) can reuse it instead of re-rendering those subtrees.
+        """
+        stack: list[tuple[OntologyElement, bool]] = [(self, False)]
+        while stack:
+            element, children_rendered = stack.pop()
+            if id(element) in html_cache:
+                continue
+            if children_rendered:
+                children_html = "".join(html_cache[id(child)] for child in element.children)
+                html_cache[id(element)] = element.wrap_children_html(children_html)
+                continue
+            stack.append((element, True))
+            stack.extend((child, False) for child in reversed(element.children))
+        return html_cache[id(self)]
+
+    def wrap_children_html(self, children_html: str) -> str:
+        """Returns the HTML of the element wrapped around already rendered `children_html`."""
         additional_attrs = copy(self.additional_attributes)
         additional_attrs.pop("class", None)
         additional_attrs.pop("id", None)
@@ -84,13 +110,16 @@ class OntologyElement(BaseModel):
 
         combined_attr_str = f"{class_attr} {attr_str}".strip()
 
-        children_html = self._generate_children_html(add_children)
-
         result_html = self._generate_final_html(combined_attr_str, children_html)
 
         return result_html
 
-    def to_text(self, add_children: bool = True, add_img_alt_text: bool = True) -> str:
+    def to_text(
+        self,
+        add_children: bool = True,
+        add_img_alt_text: bool = True,
+        html_cache: dict[int, str] | None = None,
+    ) -> str:
         """
         Returns the text representation of the element.
 
@@ -98,14 +127,20 @@ class OntologyElement(BaseModel):
             add_children: If True, the text of the children will be included.
                             Otherwise, element is represented as single self-closing tag.
             add_img_alt_text: If True, the alt text of the image will be included.
+            html_cache: Optional HTML already rendered by `to_html_memoized`, keyed by
+                            `id(element)`, used instead of rendering the element again.
         """
         if self.children and add_children:
             children_text = " ".join(
-                child.to_text(add_children, add_img_alt_text).strip() for child in self.children
+                child.to_text(add_children, add_img_alt_text, html_cache).strip()
+                for child in self.children
             )
             return children_text
 
-        text = BeautifulSoup(self.to_html(), "html.parser").get_text().strip()
+        html_code = html_cache.get(id(self)) if html_cache is not None else None
+        if html_code is None:
+            html_code = self.to_html()
+        text = BeautifulSoup(html_code, "html.parser").get_text().strip()
 
         if add_img_alt_text and self.html_tag_name == "img" and "alt" in self.additional_attributes:
             text += f" {self.additional_attributes.get('alt', '')}"
@@ -294,8 +329,8 @@ class Table(OntologyElement):
     elementType: ElementTypeEnum = Field(ElementTypeEnum.table, frozen=True)
     allowed_tags: List[str] = Field(["table"], frozen=True)
 
-    def to_html(self, add_children: bool = True) -> str:
-        soup = BeautifulSoup(super().to_html(add_children), "html.parser")
+    def wrap_children_html(self, children_html: str) -> str:
+        soup = BeautifulSoup(super().wrap_children_html(children_html), "html.parser")
         soup = remove_ids_and_class_from_table(soup)
         return str(soup)
 
@@ -463,8 +498,8 @@ class TableOfContents(OntologyElement):
     elementType: ElementTypeEnum = Field(ElementTypeEnum.table, frozen=True)
     allowed_tags: List[str] = Field(["table"], frozen=True)
 
-    def to_html(self, add_children: bool = True) -> str:
-        soup = BeautifulSoup(super().to_html(add_children), "html.parser")
+    def wrap_children_html(self, children_html: str) -> str:
+        soup = BeautifulSoup(super().wrap_children_html(children_html), "html.parser")
         soup = remove_ids_and_class_from_table(soup)
         return str(soup)
 
@@ -492,8 +527,13 @@ class FormFieldValue(OntologyElement):
     elementType: ElementTypeEnum = Field(ElementTypeEnum.form, frozen=True)
     allowed_tags: List[str] = Field(["input"], frozen=True)
 
-    def to_text(self, add_children: bool = True, add_img_alt_text: bool = True) -> str:
-        text = super().to_text(add_children, add_img_alt_text)
+    def to_text(
+        self,
+        add_children: bool = True,
+        add_img_alt_text: bool = True,
+        html_cache: dict[int, str] | None = None,
+    ) -> str:
+        text = super().to_text(add_children, add_img_alt_text, html_cache)
         value = self.additional_attributes.get("value", "")
         if not value:
             return text
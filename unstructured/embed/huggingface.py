@@ -56,12 +56,3 @@ class HuggingFaceEmbeddingEncoder(BaseEmbeddingEncoder):
         embeddings = client.embed_documents([str(e) for e in elements])
         elements_with_embeddings = self._add_embeddings_to_elements(elements, embeddings)
         return elements_with_embeddings
-
-    def _add_embeddings_to_elements(self, elements, embeddings) -> List[Element]:
-        assert len(elements) == len(embeddings)
-        elements_w_embedding = []
-
-        for i, element in enumerate(elements):
-            element.embeddings = embeddings[i]
-            elements_w_embedding.append(element)
-        return elements
@@ -131,27 +131,6 @@ class MixedbreadAIEmbeddingEncoder(BaseEmbeddingEncoder):
             responses.append(response)
         return [item.embedding for response in responses for item in response.data]
 
-    @staticmethod
-    def _add_embeddings_to_elements(
-        elements: List[Element], embeddings: List[List[float]]
-    ) -> List[Element]:
-        """
-        Add embeddings to elements.
-
-        Args:
-            elements (List[Element]): List of elements.
-            embeddings (List[List[float]]): List of embeddings.
-
-        Returns:
-            List[Element]: Elements with embeddings added.
-        """
-        assert len(elements) == len(embeddings)
-        elements_w_embedding = []
-        for i, element in enumerate(elements):
-            element.embeddings = embeddings[i]
-            elements_w_embedding.append(element)
-        return elements
-
     def embed_documents(self, elements: List[Element]) -> List[Element]:
         """
         Embed a list of document elements.
@@ -25,7 +25,7 @@ class OpenAIEmbeddingConfig(EmbeddingConfig):
 
         openai_client = OpenAIEmbeddings(
             openai_api_key=self.api_key.get_secret_value(),
-            model=self.model_name,  # type:ignore
+            model=self.model_name,  # type: ignore
         )
         return openai_client
 
@@ -57,11 +57,3 @@ class OpenAIEmbeddingEncoder(BaseEmbeddingEncoder):
         embeddings = client.embed_documents([str(e) for e in elements])
         elements_with_embeddings = self._add_embeddings_to_elements(elements, embeddings)
         return elements_with_embeddings
-
-    def _add_embeddings_to_elements(self, elements, embeddings) -> List[Element]:
-        assert len(elements) == len(embeddings)
-        elements_w_embedding = []
-        for i, element in enumerate(elements):
-            element.embeddings = embeddings[i]
-            elements_w_embedding.append(element)
-        return elements
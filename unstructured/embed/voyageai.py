@@ -96,15 +96,6 @@ class VoyageAIEmbeddingEncoder(BaseEmbeddingEncoder):
             output_dimension=self.config.output_dimension,
         ).embeddings[0]
 
-    @staticmethod
-    def _add_embeddings_to_elements(elements, embeddings) -> List[Element]:
-        assert len(elements) == len(embeddings)
-        elements_w_embedding = []
-        for i, element in enumerate(elements):
-            element.embeddings = embeddings[i]
-            elements_w_embedding.append(element)
-        return elements
-
     def _get_batch_iterator(self, elements: List[Element]) -> Iterable:
         if self.config.show_progress_bar:
             try:
@@ -1,10 +1,23 @@
+import codecs
 from typing import IO, Optional, Tuple, Union
 
-import chardet
+from chardet.universaldetector import UniversalDetector
 
 from unstructured.partition.common.common import convert_to_bytes
 
 ENCODE_REC_THRESHOLD = 0.8
+# -- statistical detection only looks at this many leading bytes; chardet is slow on large inputs --
+ENCODING_DETECTION_MAX_BYTES = 64 * 1024
+ENCODING_DETECTION_CHUNK_SIZE = 4 * 1024
+
+# -- byte-order marks, longest first because the UTF-32-LE BOM starts with the UTF-16-LE one --
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
 
 # popular encodings from https://en.wikipedia.org/wiki/Popularity_of_text_encodings
 COMMON_ENCODINGS = [
@@ -62,6 +75,13 @@ def detect_file_encoding(
     filename: str = "",
     file: Optional[Union[bytes, IO[bytes]]] = None,
 ) -> Tuple[str, str]:
+    """Detect the encoding of the file and decode it, returning `(encoding, text)`.
+
+    The bytes are read once. Input with a byte-order mark or that is valid UTF-8 (including plain
+    ASCII) is recognized without statistical detection. Otherwise chardet is fed the leading bytes
+    in chunks until it is confident, up to `ENCODING_DETECTION_MAX_BYTES`. When it is not
+    confident, each of `COMMON_ENCODINGS` is tried in turn on the bytes already read.
+    """
     if filename:
         with open(filename, "rb") as f:
             byte_data = f.read()
@@ -70,41 +90,78 @@ def detect_file_encoding(
     else:
         raise FileNotFoundError("No filename nor file were specified")
 
-    result = chardet.detect(byte_data)
-    encoding = result["encoding"]
-    confidence = result["confidence"]
-
-    if encoding is None or confidence < ENCODE_REC_THRESHOLD:
-        # Encoding detection failed, fallback to predefined encodings
-        for enc in COMMON_ENCODINGS:
-            try:
-                if filename:
-                    with open(filename, encoding=enc) as f:
-                        file_text = f.read()
-                else:
-                    file_text = byte_data.decode(enc)
-                encoding = enc
-                break
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-        else:
-            raise UnicodeDecodeError(
-                "Unable to determine the encoding of the file or match it with any "
-                "of the specified encodings.",
-                byte_data,
-                0,
-                len(byte_data),
-                "Invalid encoding",
-            )
+    encoding = _detect_encoding_from_bom_or_utf_8(byte_data)
+    if encoding is None:
+        encoding, confidence = _detect_encoding_incrementally(byte_data)
+        if encoding is None or confidence < ENCODE_REC_THRESHOLD:
+            # Encoding detection failed, fallback to predefined encodings
+            encoding, file_text = _decode_with_common_encodings(byte_data)
+            return format_encoding_str(encoding), file_text
 
-    else:
+    try:
         file_text = byte_data.decode(encoding)
-
+    except UnicodeDecodeError:
+        # -- chardet only saw the leading bytes; what follows them may not be in that encoding --
+        encoding, file_text = _decode_with_common_encodings(byte_data)
+        return format_encoding_str(encoding), file_text
     formatted_encoding = format_encoding_str(encoding)
 
     return formatted_encoding, file_text
 
 
+def _detect_encoding_from_bom_or_utf_8(byte_data: bytes) -> Optional[str]:
+    """Encoding named by a byte-order mark, or "ascii" / "utf-8" when `byte_data` is valid for it.
+
+    Returns None when neither applies and statistical detection is needed.
+    """
+    for bom, encoding in BOM_ENCODINGS:
+        if byte_data.startswith(bom):
+            return encoding
+
+    # -- NUL bytes suggest UTF-16/32 without a BOM and an escape byte can start an ISO-2022
+    # -- sequence; both are 7-bit but not ASCII text.
+    if b"\x00" in byte_data or b"\x1b" in byte_data:
+        return None
+    if byte_data and byte_data.isascii():
+        return "ascii"
+    try:
+        byte_data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    return "utf-8"
+
+
+def _detect_encoding_incrementally(byte_data: bytes) -> Tuple[Optional[str], float]:
+    """Feed chardet a chunk at a time until it is confident or the byte budget is spent."""
+    detector = UniversalDetector()
+    for start in range(
+        0, min(len(byte_data), ENCODING_DETECTION_MAX_BYTES), ENCODING_DETECTION_CHUNK_SIZE
+    ):
+        detector.feed(byte_data[start : start + ENCODING_DETECTION_CHUNK_SIZE])
+        if detector.done:
+            break
+    result = detector.close()
+    return result["encoding"], result["confidence"]
+
+
+def _decode_with_common_encodings(byte_data: bytes) -> Tuple[str, str]:
+    """Decode `byte_data` with the first of `COMMON_ENCODINGS` that can decode it."""
+    for enc in COMMON_ENCODINGS:
+        try:
+            return enc, byte_data.decode(enc)
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+
+    raise UnicodeDecodeError(
+        "Unable to determine the encoding of the file or match it with any "
+        "of the specified encodings.",
+        byte_data,
+        0,
+        len(byte_data),
+        "Invalid encoding",
+    )
+
+
 def read_txt_file(
     filename: str = "",
     file: Optional[Union[bytes, IO[bytes]]] = None,
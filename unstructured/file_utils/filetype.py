@@ -28,6 +28,7 @@ MIME-types. Additional differentiators are planned, one for `application/x-ole-s
 
 from __future__ import annotations
 
+import codecs
 import contextlib
 import functools
 import importlib.util
@@ -45,12 +46,15 @@ from oxmsg.storage import Storage
 from typing_extensions import ParamSpec
 
 from unstructured.documents.elements import Element
-from unstructured.file_utils.encoding import detect_file_encoding, format_encoding_str
+from unstructured.file_utils.encoding import (
+    ENCODING_DETECTION_MAX_BYTES,
+    detect_file_encoding,
+    format_encoding_str,
+)
 from unstructured.file_utils.model import FileType
 from unstructured.logger import logger
 from unstructured.nlp.patterns import EMAIL_HEAD_RE, LIST_OF_DICTS_PATTERN
 from unstructured.partition.common.common import add_element_metadata, exactly_one
-from unstructured.partition.common.metadata import set_element_hierarchy
 from unstructured.utils import get_call_args_applying_defaults, lazyproperty
 
 try:
@@ -94,19 +98,16 @@ def detect_filetype(
           filesystem.
         - Neither `file_path` nor `file` were specified.
     """
-    file_buffer = file
-    if isinstance(file, tempfile.SpooledTemporaryFile):
-        file_buffer = io.BytesIO(file.read())
-        file.seek(0)
-
-    ctx = _FileTypeDetectionContext.new(
+    # -- a `SpooledTemporaryFile` is read in place; detection only ever reads a bounded head of
+    # -- the file (plus the central directory of a Zip archive), so copying it is not worthwhile.
+    with _FileTypeDetectionContext.new(
         file_path=file_path,
-        file=file_buffer,
+        file=file,
         encoding=encoding,
         content_type=content_type,
         metadata_file_path=metadata_file_path,
-    )
-    return _FileTypeDetector.file_type(ctx)
+    ) as ctx:
+        return _FileTypeDetector.file_type(ctx)
 
 
 def is_json_processable(
@@ -123,9 +124,8 @@ def is_json_processable(
     exactly_one(filename=filename, file=file, file_text=file_text)
 
     if file_text is None:
-        file_text = _FileTypeDetectionContext.new(
-            file_path=filename, file=file, encoding=encoding
-        ).text_head
+        with _FileTypeDetectionContext.new(file_path=filename, file=file, encoding=encoding) as ctx:
+            file_text = ctx.text_head
 
     return re.match(LIST_OF_DICTS_PATTERN, file_text) is not None
 
@@ -144,9 +144,8 @@ def is_ndjson_processable(
     exactly_one(filename=filename, file=file, file_text=file_text)
 
     if file_text is None:
-        file_text = _FileTypeDetectionContext.new(
-            file_path=filename, file=file, encoding=encoding
-        ).text_head
+        with _FileTypeDetectionContext.new(file_path=filename, file=file, encoding=encoding) as ctx:
+            file_text = ctx.text_head
     return file_text.lstrip().startswith("{")
 
 
@@ -286,6 +285,10 @@ class _FileTypeDetectionContext:
     This keeps computation of derived values out of the file-detection code but more importantly
     allows the main filetype-detector to pass the full context to any delegates without coupling
     itself to which values it might need.
+
+    A file specified by path is opened once, on first use, and that handle is shared by every probe
+    until `.close()` is called (or the `with` block ends when the context is used as a context
+    manager).
     """
 
     def __init__(
@@ -302,6 +305,13 @@ class _FileTypeDetectionContext:
         self._encoding_arg = encoding
         self._content_type = content_type
         self._metadata_file_path = metadata_file_path
+        self._file_handle: IO[bytes] | None = None
+
+    def __enter__(self) -> _FileTypeDetectionContext:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     @classmethod
     def new(
@@ -323,6 +333,12 @@ class _FileTypeDetectionContext:
         self._validate()
         return self
 
+    def close(self) -> None:
+        """Close the file opened from `file_path`, if any; a caller-provided file is left open."""
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
+
     @property
     def content_type(self) -> str | None:
         """MIME-type asserted by caller; not based on inspection of file by this process.
@@ -348,8 +364,9 @@ class _FileTypeDetectionContext:
         """Best filename-extension we can muster, "" when there is no available source."""
         # -- get from file_path, or file when it has a name (path) --
         with self.open() as file:
-            if hasattr(file, "name") and file.name:
-                return os.path.splitext(file.name)[1].lower()
+            # -- a rolled-over `SpooledTemporaryFile` has an int file-descriptor for a name --
+            if isinstance(name := getattr(file, "name", None), str) and name:
+                return os.path.splitext(name)[1].lower()
 
         # -- otherwise use metadata file-path when provided --
         if file_path := self._metadata_file_path:
@@ -451,11 +468,14 @@ class _FileTypeDetectionContext:
             with self._file as file:
                 do things with file
 
-        File is guaranteed to be at read position 0 when called.
+        File is guaranteed to be at read position 0 when called. A file-path is opened only once;
+        the same handle is provided on each call and is closed by `.close()`.
         """
         if self.file_path:
-            with open(self.file_path, "rb") as f:
-                yield f
+            if self._file_handle is None:
+                self._file_handle = open(self.file_path, "rb")  # noqa: SIM115
+            self._file_handle.seek(0)
+            yield self._file_handle
         else:
             file = self._file_arg
             assert file is not None  # -- guaranteed by `._validate()` --
@@ -514,16 +534,42 @@ class _FileTypeDetectionContext:
                 else content.decode(encoding=self.encoding, errors="ignore")
             )
 
-        file_path = self.file_path
-        assert file_path is not None  # -- guaranteed by `._validate` --
-
         try:
-            with open(file_path, encoding=self.encoding) as f:
-                return f.read(4096)
+            return self._read_text_head(self.encoding)
         except UnicodeDecodeError:
-            encoding, _ = detect_file_encoding(filename=file_path)
-            with open(file_path, encoding=encoding) as f:
-                return f.read(4096)
+            return self._read_text_head(self._detected_head_encoding)
+
+    @lazyproperty
+    def _detected_head_encoding(self) -> str:
+        """Character-set of this file detected from its first `ENCODING_DETECTION_MAX_BYTES`."""
+        with self.open() as file:
+            head = file.read(ENCODING_DETECTION_MAX_BYTES + 1)
+
+        if len(head) <= ENCODING_DETECTION_MAX_BYTES:
+            return detect_file_encoding(file=head)[0]
+
+        # -- the head may end part-way through a multi-byte character, which no encoding can
+        # -- decode; a character is at most four bytes so back off up to three bytes.
+        head = head[:ENCODING_DETECTION_MAX_BYTES]
+        for trim in range(3):
+            try:
+                return detect_file_encoding(file=head[: len(head) - trim])[0]
+            except UnicodeDecodeError:
+                continue
+        return detect_file_encoding(file=head[:-3])[0]
+
+    def _read_text_head(self, encoding: str) -> str:
+        """The first 4096 characters of the file decoded with `encoding`.
+
+        Decodes from the shared binary handle, so the file is not reopened in text mode.
+        """
+        with self.open() as file:
+            text_file = io.TextIOWrapper(file, encoding=encoding)
+            try:
+                return text_file.read(4096)
+            finally:
+                # -- detach so the shared binary handle is not closed with the wrapper --
+                text_file.detach()
 
     def _validate(self) -> None:
         """Raise if the context is invalid."""
@@ -572,8 +618,7 @@ class _OleFileDetector:
     @lazyproperty
     def _is_ole_file(self) -> bool:
         """True when file has CFB magic first 8 bytes."""
-        with self._ctx.open() as file:
-            return file.read(8) == b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+        return self._ctx.file_head[:8] == b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
 
     @lazyproperty
     def _ole_file_type(self) -> FileType | None:
@@ -703,14 +748,123 @@ class _TextFileDifferentiator:
         if text_head.lstrip()[0] not in "[{":
             return False
 
+        # -- only a bounded head is read. A file that fits in it must parse as JSON; for a longer
+        # -- file it is enough that the head is a well-formed prefix of a JSON document.
+        with self._ctx.open() as file:
+            head = file.read(_JSON_HEAD_MAX_BYTES + 1)
+
         try:
-            with self._ctx.open() as file:
-                json.load(file)
-            return True
-        except json.JSONDecodeError:
+            if len(head) <= _JSON_HEAD_MAX_BYTES:
+                json.loads(head)
+                return True
+            return _is_json_prefix(_decode_json_head(head[:_JSON_HEAD_MAX_BYTES]))
+        except (json.JSONDecodeError, UnicodeDecodeError):
             return False
 
 
+# -- maximum number of bytes read to decide whether a textual file is JSON --
+_JSON_HEAD_MAX_BYTES = 1024 * 1024
+
+# -- one JSON token, after optional whitespace --
+_JSON_TOKEN_RE = re.compile(
+    r"""[ \t\n\r]*(?:
+        (?P<punct>[{}\[\]:,])
+        |(?P<string>"(?:[^"\\\x00-\x1f]|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*")
+        |(?P<number>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)
+        |(?P<literal>true|false|null)
+    )""",
+    re.VERBOSE,
+)
+
+# -- a JSON string, number, or literal cut short by the end of the head --
+_JSON_PARTIAL_TOKEN_RE = re.compile(
+    r"""
+    "(?:[^"\\\x00-\x1f]|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*(?:\\(?:u[0-9a-fA-F]{0,3})?)?
+    |-?(?:(?:0|[1-9][0-9]*)(?:\.[0-9]*)?)?
+    |-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?[eE][+-]?[0-9]*
+    |t(?:r(?:u)?)?|f(?:a(?:l(?:s)?)?)?|n(?:u(?:l)?)?
+    """,
+    re.VERBOSE,
+)
+
+
+def _decode_json_head(head: bytes | str) -> str:
+    """Decode the leading bytes of a JSON file, dropping a trailing partial character.
+
+    The encoding is detected the way `json.loads()` detects it for a complete document.
+    """
+    if isinstance(head, str):
+        return head
+    decoder = codecs.getincrementaldecoder(json.detect_encoding(head))()
+    return decoder.decode(head, final=False)
+
+
+def _is_json_prefix(text: str) -> bool:
+    """True when `text` is a JSON document or the start of one.
+
+    Validates incrementally, token by token, tracking only the stack of open containers, so no
+    value is materialized. `text` may end part-way through a token.
+    """
+    # -- `expect` is the set of tokens allowed next: "value", "key", ":", ",", "]", "}" --
+    stack: list[str] = []
+    expect = {"value"}
+    pos = 0
+    end = len(text)
+    number_end = -1
+
+    def after_value() -> set[str]:
+        if not stack:
+            return set()
+        return {",", "]"} if stack[-1] == "[" else {",", "}"}
+
+    while pos < end:
+        match = _JSON_TOKEN_RE.match(text, pos)
+        if match is None:
+            break
+        kind = match.lastgroup
+        token = match.group(kind) if kind else ""
+
+        if kind == "punct":
+            if token not in "{[" and token not in expect:
+                return False
+            if token in "{[":
+                if "value" not in expect:
+                    return False
+                stack.append(token)
+                expect = {"key", "}"} if token == "{" else {"value", "]"}
+            elif token in "]}":
+                stack.pop()
+                expect = after_value()
+            elif token == ":":
+                expect = {"value"}
+            else:
+                expect = {"key"} if stack[-1] == "{" else {"value"}
+        elif kind == "string" and "key" in expect:
+            expect = {":"}
+        elif "value" in expect:
+            expect = after_value()
+        else:
+            return False
+
+        pos = match.end()
+        number_end = pos if kind == "number" else -1
+
+    rest = text[pos:].lstrip(" \t\n\r")
+    if not rest:
+        return True
+
+    # -- what remains must be a single token truncated by the end of the head. A number the
+    # -- tokenizer already accepted may continue into it, like "1." or "2e".
+    if pos == number_end and text[pos] not in " \t\n\r":
+        start = pos
+        while start > 0 and text[start - 1] in "+-.0123456789Ee":
+            start -= 1
+        return _JSON_PARTIAL_TOKEN_RE.fullmatch(text[start:]) is not None
+    if _JSON_PARTIAL_TOKEN_RE.fullmatch(rest) is None:
+        return False
+    return "value" in expect or ("key" in expect and rest.startswith('"'))
+
+
 class _ZipFileDetector:
     """Detect and differentiate a Zip-archive file."""
 
@@ -775,11 +929,7 @@ def add_metadata(func: Callable[_P, list[Element]]) -> Callable[_P, list[Element
         metadata_kwargs = {
             kwarg: call_args.get(kwarg) for kwarg in ("filename", "url", "text_as_html")
         }
-        # NOTE (yao): do not use cast here as cast(None) still is None
-        if not str(kwargs.get("model_name", "")).startswith("chipper"):
-            # NOTE(alan): Skip hierarchy if using chipper, as it should take care of that
-            elements = set_element_hierarchy(elements)
-
+        # -- `parent_id` is assigned by `process_metadata()`, in the same pass as the hash ids --
         for element in elements:
             # NOTE(robinson) - Attached files have already run through this logic
             # in their own partitioning function
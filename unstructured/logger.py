@@ -1,4 +1,5 @@
 import logging
+import threading
 
 from unstructured.utils import scarf_analytics
 
@@ -18,7 +19,8 @@ def detail(self, message, *args, **kws):
 
 # Note(Trevor,Crag): to opt out of scarf analytics, set the environment variable:
 # SCARF_NO_ANALYTICS=true. See the README for more info.
-scarf_analytics()
+# -- runs in a daemon thread because the GPU probe and HTTP request must not delay import --
+threading.Thread(target=scarf_analytics, name="scarf-analytics", daemon=True).start()
 
 # Add the custom log method to the logging.Logger class
 logging.Logger.detail = detail  # type: ignore
@@ -0,0 +1,100 @@
+"""Opt-in on-disk cache of per-document evaluation results.
+
+A `MetricsCache` maps a key derived from everything that determines the metrics row of a document
+(the calculator, the document's relative path, the metric parameters, the content hashes of the
+output and ground-truth files it reads and the library version) to that row. Re-running an
+evaluation after a few documents changed then rescores only those documents; the rows of the
+others are read back and the dataframes are aggregated from all rows as before.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from unstructured.__version__ import __version__
+from unstructured.partition.utils.cache import hash_document_content
+
+logger = logging.getLogger("unstructured.eval")
+
+_CACHE_FILE_EXTENSION = ".json"
+
+
+class MetricsCache:
+    """Directory of per-document metrics rows, one JSON file per entry named by its key.
+
+    Entries are written atomically, so the worker processes of an evaluation can share a cache
+    directory; an entry that can't be read is treated as a miss. Entries are small and never
+    evicted; delete the directory to reclaim the space.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self._cache_dir = str(cache_dir)
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @staticmethod
+    def make_key(
+        calculator_name: str,
+        doc: str | Path,
+        params: dict[str, Any],
+        input_paths: Sequence[str | Path],
+    ) -> str:
+        """The cache key for the row of `doc` computed from the files at `input_paths`.
+
+        `params` must hold every calculator setting that affects the row. A value that is not
+        JSON-serializable is keyed by its `repr()`.
+        """
+        key_data = {
+            "version": __version__,
+            "calculator": calculator_name,
+            "doc": str(doc),
+            "params": params,
+            "content_hashes": [hash_document_content(filename=str(p)) for p in input_paths],
+        }
+        key_json = json.dumps(key_data, sort_keys=True, default=repr)
+        return hashlib.sha256(key_json.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[list[Any]]:
+        """The row cached under `key`, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable metrics cache entry {path}: {e}")
+            return None
+
+    def put(self, key: str, row: list[Any]) -> None:
+        """Cache `row` under `key`."""
+        payload = json.dumps(row, default=_row_value_default)
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key + _CACHE_FILE_EXTENSION)
+
+
+def _row_value_default(value: Any) -> Any:
+    """JSON-serializable stand-in for a metric value json can't serialize, like `np.int64`."""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import concurrent.futures
+import dataclasses
 import json
 import logging
 import os
@@ -10,12 +11,13 @@ import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+from unstructured.metrics.cache import MetricsCache
 from unstructured.metrics.element_type import (
     calculate_element_type_percent_match,
     get_element_type_frequency,
@@ -59,6 +61,16 @@ AGG_HEADERS_MAPPING = {
     "_count": "count",
 }
 OUTPUT_TYPE_OPTIONS = ["json", "txt"]
+# -- calculator fields that do not change the per-document rows, so are left out of cache keys;
+# -- the rest only shape the aggregation of those rows --
+_FIELDS_NOT_AFFECTING_ROWS = (
+    "documents_dir",
+    "ground_truths_dir",
+    "cache_dir",
+    "group_by",
+    "weighted_average",
+    "include_false_positives",
+)
 
 
 @dataclass
@@ -67,10 +79,15 @@ class BaseMetricsCalculator(ABC):
 
     It provides a common interface for calculating metrics based on outputs and ground truths.
     Those can be provided as either directories or lists of files.
+
+    When `cache_dir` is set, the metrics row of each document is cached there, keyed by the
+    content of the output and ground-truth files it was computed from and the calculator's
+    parameters. A later run rescores only the documents whose files or parameters changed.
     """
 
     documents_dir: str | Path
     ground_truths_dir: str | Path
+    cache_dir: Optional[str | Path] = None
 
     def __post_init__(self):
         """Discover all files in the provided directories."""
@@ -193,11 +210,46 @@ class BaseMetricsCalculator(ABC):
         """Safe wrapper around the document processing method."""
         logger.info(f"Processing {doc}")
         try:
-            return self._process_document(doc)
+            if self.cache_dir is None:
+                return self._process_document(doc)
+            return self._process_document_with_cache(doc)
         except Exception as e:
             logger.error(f"Failed to process document {doc}: {e}")
             return None
 
+    def _process_document_with_cache(self, doc: Path) -> Optional[list]:
+        """Row of `doc` from the cache, computing and caching it on a miss.
+
+        Documents whose input files can't be determined or don't exist are not cached, nor are
+        documents that produce no row, so they are processed again on the next run.
+        """
+        input_paths = self._cache_input_paths(doc)
+        if input_paths is None or not all(path.is_file() for path in input_paths):
+            return self._process_document(doc)
+
+        cache = MetricsCache(self.cache_dir)  # type: ignore[arg-type]
+        key = MetricsCache.make_key(type(self).__qualname__, doc, self._cache_params(), input_paths)
+        if (row := cache.get(key)) is not None:
+            logger.debug(f"Using cached metrics for {doc}")
+            return row
+
+        row = self._process_document(doc)
+        if row is not None:
+            cache.put(key, row)
+        return row
+
+    def _cache_input_paths(self, doc: Path) -> Optional[list[Path]]:
+        """The files the row of `doc` is computed from, None when it should not be cached."""
+        return None
+
+    def _cache_params(self) -> dict[str, Any]:
+        """The calculator settings the rows depend on, for the cache key."""
+        return {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.name not in _FIELDS_NOT_AFFECTING_ROWS
+        }
+
     @abstractmethod
     def _process_document(self, doc: Path) -> Optional[list]:
         """Should return all metadata and metrics for a single document."""
@@ -279,6 +331,9 @@ class TableStructureMetricsCalculator(BaseMetricsCalculator):
             report_from_html.total_predicted_tables,
         ] + [getattr(report_from_html, metric) for metric in self.supported_metric_names]
 
+    def _cache_input_paths(self, doc: Path) -> Optional[list[Path]]:
+        return [self.documents_dir / doc, self.ground_truths_dir / (Path(doc).stem + ".json")]
+
     def _generate_dataframes(self, rows):
         headers = [
             "filename",
@@ -421,6 +476,9 @@ class TextExtractionMetricsCalculator(BaseMetricsCalculator):
         percent_missing = round(calculate_percent_missing_text(output_cct, source_cct), 3)
         return [filename, doctype, connector, accuracy, percent_missing]
 
+    def _cache_input_paths(self, doc: Path) -> Optional[list[Path]]:
+        return [self.documents_dir / doc, self.ground_truths_dir / doc.with_suffix(".txt")]
+
     def _get_ccts(self, doc: Path) -> tuple[str, str]:
         output_cct = _prepare_output_cct(
             docpath=self.documents_dir / doc, output_type=self.document_type
@@ -492,6 +550,9 @@ class ElementTypeMetricsCalculator(BaseMetricsCalculator):
         accuracy = round(calculate_element_type_percent_match(output, source), 3)
         return [filename, doctype, connector, accuracy]
 
+    def _cache_input_paths(self, doc: Path) -> Optional[list[Path]]:
+        return [self.documents_dir / doc, self.ground_truths_dir / doc.with_suffix(".json")]
+
     def _generate_dataframes(self, rows):
         headers = ["filename", "doctype", "connector", "element-type-accuracy"]
         df = pd.DataFrame(rows, columns=headers)
@@ -756,6 +817,13 @@ class ObjectDetectionMetricsCalculatorBase(BaseMetricsCalculator, ABC):
 
         return doctype, prediction_file, ground_truth_file
 
+    def _cache_input_paths(self, doc: Path) -> Optional[list[Path]]:
+        try:
+            _, prediction_file, ground_truth_file = self._get_paths(doc)
+        except ValueError:
+            return None
+        return [prediction_file, ground_truth_file]
+
     def _generate_dataframes(self, rows) -> tuple[pd.DataFrame, pd.DataFrame]:
         headers = ["filename", "doctype", "connector"] + self.supported_metric_names
         df = pd.DataFrame(rows, columns=headers)
@@ -835,6 +903,10 @@ class ObjectDetectionPerClassMetricsCalculator(ObjectDetectionMetricsCalculatorB
             per_class_metrics_row.append(class_metrics[class_name])
         return per_class_metrics_row
 
+    def _cache_params(self) -> dict[str, Any]:
+        # -- the per-class columns depend on the classes found across all ground-truth files --
+        return {**super()._cache_params(), "metric_names": self.supported_metric_names}
+
     def _set_supported_metrics(self):
         """Sets the supported metrics based on the classes found in the ground truth files.
         The difference between per class and aggregated calculator is that the list of classes
@@ -1,10 +1,73 @@
 import difflib
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 from unstructured_inference.models.eval import compare_contents_as_df
 
+# -- slack when comparing the rapidfuzz bound to a difflib score, both computed in floating point --
+_SCORE_EPSILON = 1e-9
+# -- maximum number of scores held in one block of the `process.cdist()` similarity matrix --
+_CDIST_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def get_best_close_matches(
+    words: Sequence[str], possibilities: Sequence[str], cutoff: float
+) -> List[Optional[str]]:
+    """The best close match in `possibilities` for each of `words`, `None` when there is none.
+
+    Each result is the same as `difflib.get_close_matches(word, possibilities, n=1,
+    cutoff=cutoff)`, but the search is not a scan of every possibility with `SequenceMatcher`.
+    The normalized Indel similarity, `2 * LCS / (len(a) + len(b))`, is never less than
+    `SequenceMatcher.ratio()` because the matching blocks difflib finds form a common subsequence.
+    So a matrix of Indel similarities from `rapidfuzz.process.cdist()` rules out every possibility
+    that cannot reach `cutoff`, and the remaining ones are scored with `SequenceMatcher` in
+    decreasing order of that bound only until no remaining one can beat the best score so far.
+    Duplicate words and possibilities are scored once.
+    """
+    unique_words = list(dict.fromkeys(words))
+    choices = list(dict.fromkeys(possibilities))
+    best_by_word: Dict[str, Optional[str]] = {}
+
+    if choices and unique_words:
+        block_rows = max(1, _CDIST_BLOCK_SIZE // len(choices))
+        for start in range(0, len(unique_words), block_rows):
+            block = unique_words[start : start + block_rows]
+            # -- no `score_cutoff`, rapidfuzz can drop a score exactly at the cutoff when it
+            # -- converts it to a distance; `_best_close_match()` applies the cutoff instead.
+            bounds = process.cdist(
+                block, choices, scorer=Indel.normalized_similarity, dtype=np.float64
+            )
+            for word, word_bounds in zip(block, bounds):
+                best_by_word[word] = _best_close_match(word, choices, word_bounds, cutoff)
+
+    return [best_by_word.get(word) for word in words]
+
+
+def _best_close_match(
+    word: str, choices: List[str], bounds: np.ndarray, cutoff: float
+) -> Optional[str]:
+    """Highest `(ratio, choice)` of `choices` scoring at least `cutoff`, like `nlargest(1, ...)`."""
+    candidates = np.flatnonzero(bounds >= cutoff - _SCORE_EPSILON)
+    if candidates.size == 0:
+        return None
+
+    # -- same argument order as `difflib.get_close_matches()`, `ratio()` is not symmetric --
+    matcher = difflib.SequenceMatcher()
+    matcher.set_seq2(word)
+    best: Optional[Tuple[float, str]] = None
+    for i in candidates[np.argsort(-bounds[candidates], kind="stable")]:
+        if best is not None and bounds[i] < best[0] - _SCORE_EPSILON:
+            break
+        matcher.set_seq1(choices[i])
+        score = matcher.ratio()
+        if score >= cutoff and (best is None or (score, choices[i]) > best):
+            best = (score, choices[i])
+
+    return best[1] if best else None
+
 
 class TableAlignment:
     def __init__(self, cutoff: float = 0.8):
@@ -41,12 +104,16 @@ class TableAlignment:
 
         """
         ground_truth_texts = TableAlignment.get_content_in_tables(ground_truth_table_data)
-        matched_indices = []
-        for td in predicted_table_data:
-            reference = TableAlignment.get_content_in_tables([td])[0]
-            matches = difflib.get_close_matches(reference, ground_truth_texts, cutoff=0.1, n=1)
-            matched_indices.append(ground_truth_texts.index(matches[0]) if matches else -1)
-        return matched_indices
+        predicted_texts = TableAlignment.get_content_in_tables(predicted_table_data)
+        # -- the first table with a given text, as `list.index()` would find --
+        first_index_by_text: Dict[str, int] = {}
+        for i, text in enumerate(ground_truth_texts):
+            first_index_by_text.setdefault(text, i)
+
+        return [
+            first_index_by_text[match] if match is not None else -1
+            for match in get_best_close_matches(predicted_texts, ground_truth_texts, cutoff=0.1)
+        ]
 
     @staticmethod
     def _zip_to_dataframe(table_data: List[Dict[str, Any]]) -> pd.DataFrame:
@@ -104,44 +171,37 @@ class TableAlignment:
             total_element_count = 0
             # Get row and col index accuracy
             ground_truth_td_contents_list = [gtd["content"].lower() for gtd in ground_truth_td]
-            used_indices = set()
+            contents = [td_ele["content"].lower() for td_ele in td]
+            best_matches = get_best_close_matches(
+                contents, ground_truth_td_contents_list, cutoff=cutoff
+            )
+            # -- A ground-truth cell whose content has duplicates is matched to its first unused
+            # -- occurrence. Once every occurrence is used, the used cells of all contents are
+            # -- released and matching starts over from the first occurrence. Occurrences are used
+            # -- in order, so a cursor per content stands in for the set of used cells; the cursors
+            # -- of an earlier generation count as reset.
+            indices_by_content: Dict[str, List[int]] = {}
+            for i, b_string in enumerate(ground_truth_td_contents_list):
+                indices_by_content.setdefault(b_string, []).append(i)
+            generation = 0
+            cursors: Dict[str, Tuple[int, int]] = {}
             indices_tuple_pairs = []
-            for td_ele in td:
-                content = td_ele["content"].lower()
+            for td_ele, match in zip(td, best_matches):
                 row_index = td_ele["row_index"]
                 col_idx = td_ele["col_index"]
 
-                matches = difflib.get_close_matches(
-                    content,
-                    ground_truth_td_contents_list,
-                    cutoff=cutoff,
-                    n=1,
-                )
-                # BUG FIX: the previous matched_idx will only output the first matched index if
-                # the match has duplicates in the
-                # ground_truth_td_contents_list, the current fix will output its correspondence idx
-                # once matching is exhausted, it will go back search again the same fashion
-                matching_indices = []
-                if matches != []:
-                    b_indices = [
-                        i
-                        for i, b_string in enumerate(ground_truth_td_contents_list)
-                        if b_string == matches[0] and i not in used_indices
-                    ]
-                    if not b_indices:
-                        # If all indices are used, reset used_indices and use the first index
-                        used_indices.clear()
-                        b_indices = [
-                            i
-                            for i, b_string in enumerate(ground_truth_td_contents_list)
-                            if b_string == matches[0] and i not in used_indices
-                        ]
-                    matching_index = b_indices[0]
-                    matching_indices.append(matching_index)
-                    used_indices.add(matching_index)
-                else:
-                    matching_indices = [-1]
-                matched_idx = matching_indices[0]
+                matched_idx = -1
+                if match is not None:
+                    b_indices = indices_by_content[match]
+                    cursor_generation, cursor = cursors.get(match, (generation, 0))
+                    if cursor_generation != generation:
+                        cursor = 0
+                    if cursor == len(b_indices):
+                        # -- every occurrence is used, release all cells and use the first one --
+                        generation += 1
+                        cursor = 0
+                    matched_idx = b_indices[cursor]
+                    cursors[match] = (generation, cursor + 1)
                 if matched_idx >= 0:
                     gt_row_index = ground_truth_td[matched_idx]["row_index"]
                     gt_col_index = ground_truth_td[matched_idx]["col_index"]
@@ -1,8 +1,15 @@
+import functools
+import re
+from collections import Counter
 from typing import Dict, Optional, Tuple
 
 from rapidfuzz.distance import Levenshtein
 
-from unstructured.cleaners.core import clean_bullets, remove_sentence_punctuation
+from unstructured.cleaners.core import clean_bullets, sentence_punctuation_translation_table
+
+# -- a run of consecutive single-character words, like the "h e l l o" of a spaced-out word --
+_SINGLE_CHAR_RUN_RE = re.compile(r"(?<!\S)\S(?!\S)(?:\s+\S(?!\S))*")
+_NON_ASCII_RUN_RE = re.compile(r"[^\x00-\x7f]+")
 
 
 def calculate_accuracy(
@@ -71,40 +78,23 @@ def calculate_edit_distance(
     return 0.0
 
 
-def bag_of_words(text: str) -> Dict[str, int]:
+def bag_of_words(text: str) -> Counter[str]:
     """
     Outputs the bag of words (BOW) found in the input text and their frequencies.
 
     Takes "clean, concatenated text" (CCT) from a document as input.
 
     Removes sentence punctuation, but not punctuation within a word (ex. apostrophes).
+
+    Single-character words are counted only when alphanumeric and not next to another
+    single-character word; a run of them (ex. h e l l o) is a spaced-out word and is dropped.
     """
-    bow: Dict[str, int] = {}
-    incorrect_word: str = ""
-    words = clean_bullets(remove_sentence_punctuation(text.lower(), ["-", "'"])).split()
-
-    i = 0
-    while i < len(words):
-        if len(words[i]) > 1:
-            if words[i] in bow:
-                bow[words[i]] += 1
-            else:
-                bow[words[i]] = 1
-            i += 1
-        else:
-            j = i
-            incorrect_word = ""
-
-            while j < len(words) and len(words[j]) == 1:
-                incorrect_word += words[j]
-                j += 1
-
-            if len(incorrect_word) == 1 and words[i].isalnum():
-                if incorrect_word in bow:
-                    bow[incorrect_word] += 1
-                else:
-                    bow[incorrect_word] = 1
-            i = j
+    text = clean_bullets(_remove_sentence_punctuation(text.lower()))
+    bow = Counter(text.split())
+    for word in [word for word in bow if len(word) == 1]:
+        del bow[word]
+    # -- a run of one single-character word matches as just that character --
+    bow.update(run for run in _SINGLE_CHAR_RUN_RE.findall(text) if len(run) == 1 and run.isalnum())
     return bow
 
 
@@ -128,23 +118,12 @@ def calculate_percent_missing_text(
 
     Returns the percentage of missing text represented as a decimal between 0 and 1.
     """
-    output = prepare_str(output)
-    source = prepare_str(source)
-    output_bow = bag_of_words(output)
-    source_bow = bag_of_words(source)
-
-    # get total words in source bow while counting missing words
-    total_source_word_count = 0
-    total_missing_word_count = 0
-
-    for source_word, source_count in source_bow.items():
-        total_source_word_count += source_count
-        if source_word not in output_bow:
-            # entire count is missing
-            total_missing_word_count += source_count
-        else:
-            output_count = output_bow[source_word]
-            total_missing_word_count += max(source_count - output_count, 0)
+    output_bow = bag_of_words(prepare_str(output))
+    source_bow = bag_of_words(prepare_str(source))
+
+    total_source_word_count = sum(source_bow.values())
+    # -- `Counter` subtraction keeps only the words the output has fewer of than the source --
+    total_missing_word_count = sum((source_bow - output_bow).values())
 
     # calculate percent missing text
     if total_source_word_count == 0:
@@ -154,6 +133,34 @@ def calculate_percent_missing_text(
     return min(fraction_missing, 1)  # limit to 100%
 
 
+@functools.lru_cache(maxsize=1)
+def _sentence_punctuation_tables() -> Tuple[bytes, Dict[int, None]]:
+    """The ASCII bytes and the `str.translate()` table of sentence punctuation.
+
+    That is all unicode punctuation except hyphens and apostrophes.
+    """
+    table = sentence_punctuation_translation_table(["-", "'"])
+    return bytes(c for c in table if c < 128), table
+
+
+def _remove_sentence_punctuation(text: str) -> str:
+    """Same as `remove_sentence_punctuation(text, ["-", "'"])`, but faster on non-ASCII text.
+
+    `str.translate()` looks up every character of a non-ASCII string in the table, so instead
+    ASCII punctuation is deleted from the UTF-8 bytes, where an ASCII byte is always an ASCII
+    character, and only the runs of non-ASCII characters left are translated.
+    """
+    ascii_punctuation, table = _sentence_punctuation_tables()
+    if text.isascii():
+        return text.translate(table)
+    text = (
+        text.encode("utf-8", "surrogatepass")
+        .translate(None, ascii_punctuation)
+        .decode("utf-8", "surrogatepass")
+    )
+    return _NON_ASCII_RUN_RE.sub(lambda match: match.group().translate(table), text)
+
+
 def prepare_str(string: Optional[str], standardize_whitespaces: bool = False) -> str:
     if not string:
         return ""
@@ -1,6 +1,7 @@
+import functools
 import os
 import pathlib
-from typing import List, Set
+from typing import Any, List, Set
 
 DIRECTORY = pathlib.Path(__file__).parent.resolve()
 # NOTE(robinson) - the list of English words is based on the nlkt.corpus.words corpus
@@ -9,9 +10,27 @@ DIRECTORY = pathlib.Path(__file__).parent.resolve()
 # ref: https://github.com/jeremy-rifkin/Wordlist
 ENGLISH_WORDS_FILE = os.path.join(DIRECTORY, "english-words.txt")
 
-with open(ENGLISH_WORDS_FILE) as f:
-    BASE_ENGLISH_WORDS = f.read().split("\n")
-
 # NOTE(robinson) - add new words that we want to pass for the English check in here
 ADDITIONAL_ENGLISH_WORDS: List[str] = []
-ENGLISH_WORDS: Set[str] = set(BASE_ENGLISH_WORDS + ADDITIONAL_ENGLISH_WORDS)
+
+
+@functools.lru_cache(maxsize=None)
+def get_base_english_words() -> List[str]:
+    """The words in `ENGLISH_WORDS_FILE`, read on first use rather than at import time."""
+    with open(ENGLISH_WORDS_FILE) as f:
+        return f.read().split("\n")
+
+
+@functools.lru_cache(maxsize=None)
+def get_english_words() -> Set[str]:
+    """Set of all words that pass the English check, built on first use."""
+    return set(get_base_english_words() + ADDITIONAL_ENGLISH_WORDS)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily provide `BASE_ENGLISH_WORDS` and `ENGLISH_WORDS` for existing importers."""
+    if name == "BASE_ENGLISH_WORDS":
+        return get_base_english_words()
+    if name == "ENGLISH_WORDS":
+        return get_english_words()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
 import os
+import threading
 from functools import lru_cache
 from typing import Final, List, Tuple
 
-import nltk
-from nltk import pos_tag as _pos_tag
-from nltk import sent_tokenize as _sent_tokenize
-from nltk import word_tokenize as _word_tokenize
-
 CACHE_MAX_SIZE: Final[int] = 128
 
+# -- NLTK takes about a second to import (it pulls in scipy) so it is imported on first use, and
+# -- the check for its data packages happens on first use too.
+_nltk_packages_lock = threading.Lock()
+_nltk_packages_checked = False
+
 
 def check_for_nltk_package(package_name: str, package_category: str) -> bool:
     """Checks to see if the specified NLTK package exists on the image."""
+    import nltk
+
     paths: list[str] = []
     for path in nltk.data.path:
         if not path.endswith("nltk_data"):
@@ -29,6 +32,7 @@ def check_for_nltk_package(package_name: str, package_category: str) -> bool:
 
 def download_nltk_packages():
     """If required NLTK packages are not available, download them."""
+    import nltk
 
     tagger_available = check_for_nltk_package(
         package_category="taggers",
@@ -43,9 +47,42 @@ def download_nltk_packages():
         nltk.download("punkt_tab", quiet=True)
 
 
-# auto download nltk packages if the environment variable is set
-if os.getenv("AUTO_DOWNLOAD_NLTK", "True").lower() == "true":
-    download_nltk_packages()
+def _ensure_nltk_packages() -> None:
+    """Download NLTK packages on first tokenizer use when `AUTO_DOWNLOAD_NLTK` is set.
+
+    This used to happen at import time.
+    """
+    global _nltk_packages_checked
+
+    if _nltk_packages_checked:
+        return
+    with _nltk_packages_lock:
+        if not _nltk_packages_checked:
+            # auto download nltk packages if the environment variable is set
+            if os.getenv("AUTO_DOWNLOAD_NLTK", "True").lower() == "true":
+                download_nltk_packages()
+            _nltk_packages_checked = True
+
+
+def _sent_tokenize(text: str) -> List[str]:
+    from nltk import sent_tokenize
+
+    _ensure_nltk_packages()
+    return sent_tokenize(text)
+
+
+def _word_tokenize(text: str) -> List[str]:
+    from nltk import word_tokenize
+
+    _ensure_nltk_packages()
+    return word_tokenize(text)
+
+
+def _pos_tag(tokens: List[str]) -> List[Tuple[str, str]]:
+    from nltk import pos_tag
+
+    _ensure_nltk_packages()
+    return pos_tag(tokens)
 
 
 @lru_cache(maxsize=CACHE_MAX_SIZE)
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
-from typing import IO, Any, Optional, Sequence
+import io
+import os
+from typing import IO, Any, NamedTuple, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
 from unstructured_client import UnstructuredClient
 from unstructured_client.models import operations, shared
 from unstructured_client.utils import retries
+from urllib3.util.retry import Retry
 
 from unstructured.documents.elements import Element
 from unstructured.logger import logger
 from unstructured.partition.common.common import exactly_one
 from unstructured.staging.base import elements_from_dicts, elements_from_json
+from unstructured.utils import requires_dependencies
 
 # Default retry configuration taken from the client code
 DEFAULT_RETRIES_INITIAL_INTERVAL_SEC = 3000
@@ -20,6 +26,10 @@ DEFAULT_RETRIES_EXPONENT = 1.5
 DEFAULT_RETRIES_MAX_ELAPSED_TIME_SEC = 1800000
 DEFAULT_RETRIES_CONNECTION_ERRORS = True
 
+DEFAULT_API_URL = "https://api.unstructured.io/general/v0/general"
+# HTTP status codes on which `PartitionApiClient` retries a request
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 
 def partition_via_api(
     filename: Optional[str] = None,
@@ -339,3 +349,244 @@ def partition_multiple_via_api(
         raise ValueError(
             f"Receive unexpected status code {response.status_code} from the API.",
         )
+
+
+class PartitionApiClient:
+    """Reusable client for partitioning documents with the Unstructured REST API.
+
+    Unlike `partition_via_api()`, which builds a new SDK client for each call, a
+    `PartitionApiClient` keeps one pooled HTTP session and one thread pool for its lifetime, so
+    connections are reused across documents and at most `max_concurrency` requests are in
+    flight at any time. Use it as a context manager, or call `.close()` when done.
+
+    Failed requests (connection errors and the `RETRY_STATUS_CODES` responses) are retried up to
+    `retries` times with exponential backoff of `retries_backoff_factor * 2 ** (n - 1)` seconds.
+
+    When `split_pdf_page_range_size` is set, a PDF with more pages than that is split into
+    page ranges of that many pages, the ranges are sent as concurrent requests and the
+    resulting elements are merged in page order. Each range is sent with the
+    `starting_page_number` of its first page, so the API numbers pages, and computes element
+    ids, relative to the whole document.
+
+    Parameters
+    ----------
+    api_url
+        The URL for the Unstructured API. Defaults to the hosted Unstructured API.
+    api_key
+        The API key to pass to the Unstructured API.
+    max_concurrency
+        The maximum number of requests in flight at once, also the size of the connection pool.
+    split_pdf_page_range_size
+        The number of pages sent per request when splitting a PDF. PDFs are not split when None.
+    retries
+        The maximum number of times a failed request is retried.
+    retries_backoff_factor
+        Scales the exponential delay, in seconds, between retries.
+    timeout
+        Seconds to wait for the API to respond to each request, no limit when None.
+    """
+
+    def __init__(
+        self,
+        api_url: str = DEFAULT_API_URL,
+        api_key: str = "",
+        max_concurrency: int = 8,
+        split_pdf_page_range_size: Optional[int] = None,
+        retries: int = 3,
+        retries_backoff_factor: float = 0.5,
+        timeout: Optional[float] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if split_pdf_page_range_size is not None and split_pdf_page_range_size < 1:
+            raise ValueError("split_pdf_page_range_size must be at least 1.")
+
+        self._api_url = api_url
+        self._split_pdf_page_range_size = split_pdf_page_range_size
+        self._timeout = timeout
+
+        self._session = requests.Session()
+        self._session.headers.update(
+            {"ACCEPT": "application/json", "UNSTRUCTURED-API-KEY": api_key}
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_concurrency,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=retries_backoff_factor,
+                status_forcelist=RETRY_STATUS_CODES,
+                # -- partition requests are idempotent, so POST can be retried too --
+                allowed_methods=None,
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def __enter__(self) -> PartitionApiClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Wait for requests in flight, then release the thread pool and pooled connections."""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    def partition(
+        self,
+        filename: Optional[str] = None,
+        *,
+        file: Optional[IO[bytes]] = None,
+        metadata_filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        **request_kwargs: Any,
+    ) -> list[Element]:
+        """Partitions one document. Parameters are as for `partition_via_api()`."""
+        exactly_one(filename=filename, file=file)
+        if file is not None and metadata_filename is None:
+            raise ValueError("metadata_filename must be specified if file is passed.")
+
+        return self.partition_multiple(
+            filenames=[filename] if filename is not None else None,
+            files=[file] if file is not None else None,
+            metadata_filenames=[metadata_filename] if metadata_filename is not None else None,
+            content_types=[content_type] if content_type is not None else None,
+            **request_kwargs,
+        )[0]
+
+    def partition_multiple(
+        self,
+        filenames: Optional[list[str]] = None,
+        *,
+        files: Optional[Sequence[IO[bytes]]] = None,
+        metadata_filenames: Optional[list[str]] = None,
+        content_types: Optional[list[Optional[str]]] = None,
+        **request_kwargs: Any,
+    ) -> list[list[Element]]:
+        """Partitions several documents concurrently, one document (or page range) per request.
+
+        Parameters are as for `partition_multiple_via_api()`. The returned element lists are in
+        the order of the documents given.
+        """
+        exactly_one(filenames=filenames, files=files)
+
+        if filenames is not None:
+            names = metadata_filenames or filenames
+            if len(names) != len(filenames):
+                raise ValueError("metadata_filenames and filenames must have the same length.")
+            contents: list[bytes] = []
+            for filename in filenames:
+                with open(filename, "rb") as f:
+                    contents.append(f.read())
+        else:
+            assert files is not None
+            if not metadata_filenames:
+                raise ValueError("metadata_filenames must be specified if files are passed")
+            if len(metadata_filenames) != len(files):
+                raise ValueError("metadata_filenames and files must have the same length.")
+            names = metadata_filenames
+            contents = [file.read() for file in files]
+
+        if content_types is not None and len(content_types) != len(contents):
+            raise ValueError("content_types and files must have the same length.")
+
+        # -- build every request of every document up front and submit them all to the one
+        # -- bounded pool, rather than nesting per-document work that would wait on the pool.
+        document_requests = [
+            self._document_requests(
+                name, content, content_types[i] if content_types is not None else None
+            )
+            for i, (name, content) in enumerate(zip(names, contents))
+        ]
+        document_futures = [
+            [self._executor.submit(self._send, request, request_kwargs) for request in doc_requests]
+            for doc_requests in document_requests
+        ]
+
+        return [
+            [element for future in futures for element in future.result()]
+            for futures in document_futures
+        ]
+
+    def _document_requests(
+        self, file_name: str, content: bytes, content_type: Optional[str]
+    ) -> list[_ApiRequest]:
+        """The requests to send for one document, in page order."""
+        page_range_size = self._split_pdf_page_range_size
+        if page_range_size is None or not _is_pdf(file_name, content, content_type):
+            return [_ApiRequest(file_name, content, content_type, page_offset=0)]
+
+        return [
+            _ApiRequest(file_name, range_content, "application/pdf", page_offset=page_offset)
+            for page_offset, range_content in _split_pdf(content, page_range_size)
+        ]
+
+    def _send(self, request: _ApiRequest, request_kwargs: dict[str, Any]) -> list[Element]:
+        """Send `request`, returning its elements with document-relative page numbers."""
+        data = request_kwargs
+        if request.page_offset:
+            # -- have the API number the pages of the range, so hash element ids, which include
+            # -- the page number, are those of the whole document --
+            starting_page_number = int(request_kwargs.get("starting_page_number") or 1)
+            data = {
+                **request_kwargs,
+                "starting_page_number": starting_page_number + request.page_offset,
+            }
+
+        response = self._session.post(
+            self._api_url,
+            data=data,
+            files=[("files", (request.file_name, request.content, request.content_type))],
+            timeout=self._timeout,
+        )
+        if response.status_code != 200:
+            raise ValueError(
+                f"Receive unexpected status code {response.status_code} from the API.",
+            )
+
+        return elements_from_dicts(response.json())
+
+
+class _ApiRequest(NamedTuple):
+    """One file (or PDF page range) to send to the API in its own request."""
+
+    file_name: str
+    content: bytes
+    content_type: Optional[str]
+    # -- number of pages of the document that precede this page range --
+    page_offset: int
+
+
+def _is_pdf(file_name: str, content: bytes, content_type: Optional[str]) -> bool:
+    if content_type is not None:
+        return content_type == "application/pdf"
+    return content.startswith(b"%PDF") or os.path.splitext(file_name)[1].lower() == ".pdf"
+
+
+@requires_dependencies("pypdf", extras="pdf")
+def _split_pdf(content: bytes, page_range_size: int) -> list[tuple[int, bytes]]:
+    """Split PDF `content` into PDFs of at most `page_range_size` pages.
+
+    Returns `(page_offset, pdf_bytes)` pairs in page order. A PDF that doesn't need splitting is
+    returned as is.
+    """
+    import pypdf
+
+    reader = pypdf.PdfReader(io.BytesIO(content))
+    page_count = len(reader.pages)
+    if page_count <= page_range_size:
+        return [(0, content)]
+
+    page_ranges: list[tuple[int, bytes]] = []
+    for start in range(0, page_count, page_range_size):
+        writer = pypdf.PdfWriter()
+        for page in reader.pages[start : start + page_range_size]:
+            writer.add_page(page)
+        range_file = io.BytesIO()
+        writer.write(range_file)
+        page_ranges.append((start, range_file.getvalue()))
+    return page_ranges
@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
-import copy
 import importlib
 import io
-from typing import IO, Any, Callable, Optional
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional
 
-import requests
 from typing_extensions import TypeAlias
 
-from unstructured.documents.elements import DataSourceMetadata, Element
+from unstructured.documents.elements import DataSourceMetadata, Element, assign_and_map_new_uuids
 from unstructured.file_utils.filetype import (
     detect_filetype,
     is_json_processable,
@@ -24,6 +22,9 @@ from unstructured.partition.common.lang import check_language_args
 from unstructured.partition.utils.constants import PartitionStrategy
 from unstructured.utils import dependency_exists
 
+if TYPE_CHECKING:
+    from unstructured.partition.utils.cache import PartitionCache
+
 Partitioner: TypeAlias = Callable[..., list[Element]]
 
 
@@ -52,6 +53,7 @@ def partition(
     hi_res_model_name: Optional[str] = None,
     model_name: Optional[str] = None,  # to be deprecated
     starting_page_number: int = 1,
+    partition_cache: Optional[PartitionCache] = None,
     **kwargs: Any,
 ) -> list[Element]:
     """Partitions a document into its constituent elements.
@@ -136,6 +138,11 @@ def partition(
         Indicates what page number should be assigned to the first page in the document.
         This information will be reflected in elements' metadata and can be be especially
         useful when partitioning a document that is part of a larger document.
+    partition_cache
+        An `unstructured.partition.utils.cache.PartitionCache` to reuse the elements of an
+        earlier call that partitioned the same bytes, detected as the same file-type, with the
+        same arguments, environment settings and library version. Calls that write extracted
+        images to a directory are not cached.
     """
     exactly_one(file=file, filename=filename, url=url)
 
@@ -189,11 +196,52 @@ def partition(
         )
     )
 
+    cache_key: Optional[str] = None
+    writes_image_files = extract_image_block_output_dir is not None or (
+        (extract_images_in_pdf or bool(extract_image_block_types))
+        and not extract_image_block_to_payload
+    )
+    if partition_cache is not None and not writes_image_files:
+        from unstructured.partition.common.metadata import get_last_modified_date
+        from unstructured.partition.utils.cache import hash_document_content
+
+        cache_key = partition_cache.make_key(
+            content_hash=hash_document_content(filename=filename, file=file),
+            file_type_name=file_type.name,
+            partition_args={
+                "filename": filename,
+                # -- a file's last-modified date can appear in metadata --
+                "filename_last_modified": get_last_modified_date(filename) if filename else None,
+                "url": url,
+                "encoding": encoding,
+                "content_type": content_type,
+                "strategy": strategy,
+                "skip_infer_table_types": skip_infer_table_types,
+                "languages": languages,
+                "detect_language_per_element": detect_language_per_element,
+                "pdf_infer_table_structure": pdf_infer_table_structure,
+                "infer_table_structure": infer_table_structure,
+                "extract_images_in_pdf": extract_images_in_pdf,
+                "extract_image_block_types": extract_image_block_types,
+                "extract_image_block_to_payload": extract_image_block_to_payload,
+                "data_source_metadata": data_source_metadata,
+                "hi_res_model_name": hi_res_model_name,
+                "model_name": model_name,
+                "starting_page_number": starting_page_number,
+                "kwargs": kwargs,
+            },
+        )
+        if (cached_elements := partition_cache.get(cache_key)) is not None:
+            # -- UUIDs were requested, so don't hand out the ones of the call that was cached --
+            if kwargs.get("unique_element_ids"):
+                return assign_and_map_new_uuids(cached_elements)
+            return cached_elements
+
     partitioner_loader = _PartitionerLoader()
 
     # -- extracting this post-processing to allow multiple exit-points from function --
     def augment_metadata(elements: list[Element]) -> list[Element]:
-        """Add some metadata fields to each element."""
+        """Add some metadata fields to each element and cache them when so requested."""
         for element in elements:
             element.metadata.url = url
             element.metadata.data_source = data_source_metadata
@@ -203,6 +251,9 @@ def partition(
             else:
                 element.metadata.filetype = file_type.mime_type
 
+        if partition_cache is not None and cache_key is not None:
+            partition_cache.put(cache_key, elements)
+
         return elements
 
     # -- handle PDF/Image partitioning separately because they have a lot of special-case
@@ -276,7 +327,7 @@ def partition(
     #  ALL OTHER FILE TYPES
     # ============================================================================================
 
-    partitioning_kwargs = copy.deepcopy(kwargs)
+    partitioning_kwargs = dict(kwargs)
     partitioning_kwargs["detect_language_per_element"] = detect_language_per_element
     partitioning_kwargs["encoding"] = encoding
     partitioning_kwargs["infer_table_structure"] = infer_table_structure
@@ -298,6 +349,8 @@ def file_and_type_from_url(
     ssl_verify: bool = True,
     request_timeout: Optional[int] = None,
 ) -> tuple[io.BytesIO, FileType]:
+    import requests
+
     response = requests.get(url, headers=headers, verify=ssl_verify, timeout=request_timeout)
     file = io.BytesIO(response.content)
 
@@ -0,0 +1,87 @@
+"""Helpers shared by the partitioners of messages that carry file attachments (EML, MSG)."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import copy
+import hashlib
+from typing import Hashable, Iterator, Protocol, Sequence
+
+from unstructured.documents.elements import Element, assign_and_map_new_uuids
+
+
+class AttachmentPartitioner(Protocol):
+    """Partitions a single attachment of a message."""
+
+    @property
+    def cache_key(self) -> Hashable:
+        """Equal for attachments that produce the same elements when partitioned."""
+        ...
+
+    def partition(self) -> list[Element]:
+        """The elements of the attachment, empty when its file-format is not partitionable."""
+        ...
+
+
+def attachment_content_hash(file_bytes: bytes) -> str:
+    """SHA-256 hex digest of the bytes of an attachment."""
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def iter_attachment_elements(
+    attachment_partitioners: Sequence[AttachmentPartitioner],
+    max_workers: int = 1,
+    unique_element_ids: bool = False,
+) -> Iterator[Element]:
+    """Generate the elements of each attachment, in attachment order.
+
+    Attachments with the same `.cache_key` are partitioned only once; each later one gets a copy
+    of the first one's elements. When `unique_element_ids` is True, those copies are given fresh
+    UUID element-ids (with `parent_id` references remapped to match) so ids remain unique.
+
+    When `max_workers` is greater than 1, the distinct attachments are partitioned concurrently
+    on a thread pool of at most that many threads. Element order does not depend on completion
+    order.
+    """
+    first_index_by_key: dict[Hashable, int] = {}
+    distinct_partitioners: list[AttachmentPartitioner] = []
+    for partitioner in attachment_partitioners:
+        if partitioner.cache_key not in first_index_by_key:
+            first_index_by_key[partitioner.cache_key] = len(distinct_partitioners)
+            distinct_partitioners.append(partitioner)
+
+    if max_workers > 1 and len(distinct_partitioners) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(distinct_partitioners))
+        ) as executor:
+            # -- run each partitioner in a copy of the caller's context so context-local state
+            # -- like pinned `env_config` settings applies in the worker threads too.
+            futures = [
+                executor.submit(contextvars.copy_context().run, partitioner.partition)
+                for partitioner in distinct_partitioners
+            ]
+            distinct_results = [future.result() for future in futures]
+    else:
+        distinct_results = [partitioner.partition() for partitioner in distinct_partitioners]
+
+    # -- make all copies before any element is yielded, so a caller that changes a yielded
+    # -- element can't affect the copies made of it.
+    is_reused = [False] * len(distinct_results)
+    attachment_elements: list[list[Element]] = []
+    for partitioner in attachment_partitioners:
+        index = first_index_by_key[partitioner.cache_key]
+        elements = distinct_results[index]
+        if is_reused[index]:
+            elements = _copy_elements(elements, unique_element_ids)
+        is_reused[index] = True
+        attachment_elements.append(elements)
+
+    for elements in attachment_elements:
+        yield from elements
+
+
+def _copy_elements(elements: list[Element], unique_element_ids: bool) -> list[Element]:
+    """Deep copies of `elements`, with fresh ids when `unique_element_ids` is True."""
+    copies = copy.deepcopy(elements)
+    return assign_and_map_new_uuids(copies) if unique_element_ids else copies
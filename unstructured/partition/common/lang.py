@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, Iterator, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
-import iso639  # pyright: ignore[reportMissingTypeStubs]
 from langdetect import (  # pyright: ignore[reportMissingTypeStubs]
     DetectorFactory,
     detect_langs,  # pyright: ignore[reportUnknownVariableType]
@@ -17,6 +16,9 @@ from unstructured.partition.utils.constants import (
     TESSERACT_LANGUAGES_SPLITTER,
 )
 
+if TYPE_CHECKING:
+    import iso639  # pyright: ignore[reportMissingTypeStubs]
+
 # pytesseract.get_languages(config="") only shows user installed language packs,
 # so manually include the list of all currently supported Tesseract languages
 PYTESSERACT_LANG_CODES = [
@@ -363,6 +365,9 @@ def _convert_language_code_to_pytesseract_lang_code(lang: str) -> str:
 
 
 def _get_iso639_language_object(lang: str) -> Optional[iso639.Language]:
+    # -- `iso639` loads its language tables at import, which takes a few hundred milliseconds --
+    import iso639  # pyright: ignore[reportMissingTypeStubs]
+
     try:
         return iso639.Language.match(lang.lower())  # pyright: ignore[reportUnknownMemberType]
     except iso639.LanguageNotFoundError:
@@ -7,13 +7,14 @@ import datetime as dt
 import functools
 import itertools
 import os
-from typing import Any, Callable, Iterator, Sequence
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from typing_extensions import ParamSpec
 
 from unstructured.documents.elements import Element, ElementMetadata
 from unstructured.file_utils.model import FileType
 from unstructured.partition.common.lang import apply_lang_metadata
+from unstructured.partition.utils.config import env_config
 from unstructured.utils import get_call_args_applying_defaults
 
 _P = ParamSpec("_P")
@@ -70,46 +71,115 @@ def set_element_hierarchy(
     element's category is determined by a rule set. The rule set trumps category_depth. That is,
     category_depth is only relevant when elements are of the same category.
     """
-    stack: list[Element] = []
+    hierarchy = _ElementHierarchy(ruleset)
     for element in elements:
-        if element.metadata.parent_id is not None:
-            continue
-        parent_id = None
-        element_category = getattr(element, "category", None)
-        element_category_depth = getattr(element.metadata, "category_depth", 0) or 0
+        hierarchy.assign_parent_id(element)
+
+    return list(elements)
+
+
+def assign_hash_ids_and_hierarchy(
+    elements: Iterable[Element], ruleset: dict[str, list[str]] = HIERARCHY_RULE_SET
+) -> list[Element]:
+    """Hash the `.id` of each element and set its `.metadata.parent_id`, in one pass.
+
+    Gives the same IDs and parent-ids as `set_element_hierarchy(assign_and_map_hash_ids(elements))`:
+    the hash of each element is based on its text, filename, page-number and sequence number on its
+    page; a `parent_id` already set is mapped from the parent's original ID to its hash; and other
+    elements are assigned the hash ID of their parent in the hierarchy.
+    """
+    hierarchy = _ElementHierarchy(ruleset)
+    # -- original ID of each element that had one, to its hash --
+    hash_ids: dict[str, str] = {}
+    # -- elements whose `parent_id` was mapped, or left for later because it is the ID of an
+    # -- element not hashed yet, with their original `parent_id`
+    mapped_parents: list[tuple[Element, str]] = []
+    unresolved_parents: list[tuple[Element, str]] = []
+    has_duplicate_ids = False
+    # -- sequence number of element on its page, resets when page-number changes --
+    page_number, seq_on_page = object(), 0
+
+    processed_elements: list[Element] = []
+    for element in elements:
+        processed_elements.append(element)
+        metadata = element.metadata
+        if metadata.page_number == page_number:
+            seq_on_page += 1
+        else:
+            page_number, seq_on_page = metadata.page_number, 0
+
+        # -- an element without an ID yet cannot be referenced as a parent, so no need to map it --
+        original_id = element._element_id  # pyright: ignore[reportPrivateUsage]
+        hash_id = element.id_to_hash(seq_on_page)
+        if original_id is not None:
+            has_duplicate_ids = has_duplicate_ids or original_id in hash_ids
+            hash_ids[original_id] = hash_id
+
+        parent_id = metadata.parent_id
+        if not parent_id:
+            hierarchy.assign_parent_id(element)
+        elif parent_id in hash_ids:
+            metadata.parent_id = hash_ids[parent_id]
+            mapped_parents.append((element, parent_id))
+        else:
+            unresolved_parents.append((element, parent_id))
+
+    # -- like `assign_and_map_hash_ids()`, a duplicated original ID maps to the hash of the last
+    # -- element having it, which may come after children already mapped to the first one.
+    for element, parent_id in (
+        itertools.chain(mapped_parents, unresolved_parents)
+        if has_duplicate_ids
+        else unresolved_parents
+    ):
+        if parent_id in hash_ids:
+            element.metadata.parent_id = hash_ids[parent_id]
+
+    return processed_elements
+
+
+class _ElementHierarchy:
+    """Assigns `.metadata.parent_id` to elements presented one at a time, in document order.
+
+    Separated from `set_element_hierarchy()` so the assignment can be fused into another pass over
+    the elements.
+    """
+
+    def __init__(self, ruleset: dict[str, list[str]] = HIERARCHY_RULE_SET):
+        # -- sets, for each stack comparison to be a hash lookup rather than a list scan --
+        self._ruleset = {category: frozenset(children) for category, children in ruleset.items()}
+        # -- (category, category_depth, element) of each potential parent, innermost last --
+        self._stack: list[tuple[str, int, Element]] = []
+
+    def assign_parent_id(self, element: Element) -> None:
+        """Set `.metadata.parent_id` of `element` unless it already has one."""
+        metadata = element.metadata
+        if metadata.parent_id is not None:
+            return
+        category = getattr(element, "category", None)
 
         # -- skip elements without a category --
-        if not element_category:
-            continue
+        if not category:
+            return
+
+        category_depth = metadata.category_depth or 0
+        stack = self._stack
+        parent_id = None
 
         while stack:
-            top_element: Element = stack[-1]
-            top_element_category = getattr(top_element, "category")
-            top_element_category_depth = (
-                getattr(
-                    top_element.metadata,
-                    "category_depth",
-                    0,
-                )
-                or 0
-            )
+            top_category, top_category_depth, top_element = stack[-1]
 
-            if (
-                top_element_category == element_category
-                and top_element_category_depth < element_category_depth
-            ) or (
-                top_element_category != element_category
-                and element_category in ruleset.get(top_element_category, [])
+            if (top_category == category and top_category_depth < category_depth) or (
+                top_category != category and category in self._ruleset.get(top_category, ())
             ):
                 parent_id = top_element.id
                 break
 
             stack.pop()
 
-        element.metadata.parent_id = parent_id
-        stack.append(element)
-
-    return list(elements)
+        # -- `parent_id` is already None otherwise --
+        if parent_id is not None:
+            metadata.parent_id = parent_id
+        stack.append((category, category_depth, element))
 
 
 # ================================================================================================
@@ -125,6 +195,8 @@ def apply_metadata(
     This decorator adds a post-processing step to a partitioner, primarily to apply metadata that
     is common to all partitioners. It assumes the following responsibilities:
 
+      - Resolve `env_config` settings once, for use by the partitioner and everything it calls.
+
       - Hash element-ids. Computes and applies SHA1 hash element.id when `unique_element_ids`
         argument is False.
 
@@ -159,36 +231,11 @@ def apply_metadata(
 
         @functools.wraps(func)
         def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> list[Element]:
-            elements = func(*args, **kwargs)
+            # -- resolve environment settings once for the whole partitioning call --
+            with env_config.pinned():
+                elements = func(*args, **kwargs)
             call_args = get_call_args_applying_defaults(func, *args, **kwargs)
 
-            # ------------------------------------------------------------------------------------
-            # unique-ify elements
-            # ------------------------------------------------------------------------------------
-            # Do this first to ensure all following operations behave as expected. It's easy for a
-            # partitioner to re-use an element or metadata instance when its values are common to
-            # multiple elements. This can lead to very hard-to diagnose bugs downstream when
-            # mutating one element unexpectedly also mutates others (because they are the same
-            # instance).
-            # ------------------------------------------------------------------------------------
-
-            elements = _uniqueify_elements_and_metadata(elements)
-
-            # ------------------------------------------------------------------------------------
-            # apply metadata - do this first because it affects the hash computation.
-            # ------------------------------------------------------------------------------------
-
-            # -- `language` - auto-detect language (e.g. eng, spa) --
-            languages = call_args.get("languages")
-            detect_language_per_element = call_args.get("detect_language_per_element", False)
-            elements = list(
-                apply_lang_metadata(
-                    elements=elements,
-                    languages=languages,
-                    detect_language_per_element=detect_language_per_element,
-                )
-            )
-
             # == apply filetype, filename, last_modified, and url metadata ===================
             metadata_kwargs: dict[str, Any] = {}
 
@@ -212,78 +259,79 @@ def apply_metadata(
             if url:
                 metadata_kwargs["url"] = url
 
-            # -- update element.metadata in single pass --
-            for element in elements:
-                # NOTE(robinson) - Attached files have already run through this logic in their own
-                # partitioning function
-                if element.metadata.attached_to_filename:
-                    continue
-                element.metadata.update(ElementMetadata(**metadata_kwargs))
+            # -- resolve once, e.g. `filename` is split into `filename` and `file_directory` --
+            metadata_updates = ElementMetadata(**metadata_kwargs).fields.items()
 
             # ------------------------------------------------------------------------------------
-            # compute hash ids (when so requestsd)
+            # Post-process elements in a single streaming pass, in this order for each element:
+            #
+            # - unique-ify. Do this first to ensure all following operations behave as expected.
+            #   It's easy for a partitioner to re-use an element or metadata instance when its
+            #   values are common to multiple elements. This can lead to very hard-to diagnose bugs
+            #   downstream when mutating one element unexpectedly also mutates others (because they
+            #   are the same instance).
+            # - `language` - auto-detect language (e.g. eng, spa). Note that document-level
+            #   detection needs the text of all elements before it can emit the first one, so
+            #   `apply_lang_metadata()` buffers the unique-ified elements in that case.
+            # - apply filetype etc. metadata - do this before hashing because it affects the hash.
+            # - compute hash ids (when so requested), mapping a `parent_id` set by the partitioner
+            #   to the hash of that parent.
+            # - assign parent-id - do this after hash computation so parent-id is stable. A parent
+            #   always precedes its children so it has already been hashed.
             # ------------------------------------------------------------------------------------
 
+            languages = call_args.get("languages")
+            detect_language_per_element = call_args.get("detect_language_per_element", False)
+            lang_elements = apply_lang_metadata(
+                elements=_iter_unique_elements_and_metadata(elements),
+                languages=languages,
+                detect_language_per_element=detect_language_per_element,
+            )
+            updated_elements = _iter_elements_applying_metadata(lang_elements, metadata_updates)
+
             # -- Compute and apply hash-ids if the user does not want UUIDs. Note this mutates the
             # -- elements themselves, not their metadata.
             unique_element_ids: bool = call_args.get("unique_element_ids", False)
             if unique_element_ids is False:
-                elements = _assign_hash_ids(elements)
-
-            # ------------------------------------------------------------------------------------
-            # assign parent-id - do this after hash computation so parent-id is stable.
-            # ------------------------------------------------------------------------------------
+                return assign_hash_ids_and_hierarchy(updated_elements)
 
             # -- `parent_id` - process category-level etc. to assign parent-id --
-            elements = set_element_hierarchy(elements)
-
-            return elements
+            return set_element_hierarchy(list(updated_elements))
 
         return wrapper
 
     return decorator
 
 
-def _assign_hash_ids(elements: list[Element]) -> list[Element]:
-    """Converts `.id` of each element from UUID to hash.
-
-    The hash is based on the `.text` of the element, but also on its page-number and sequence number
-    on that page. This provides for deterministic results even when the document is split into one
-    or more fragments for parallel processing.
-    """
-    # -- generate sequence number for each element on a page --
-    page_numbers = [e.metadata.page_number for e in elements]
-    page_seq_numbers = [
-        seq_on_page
-        for _, group in itertools.groupby(page_numbers)
-        for seq_on_page, _ in enumerate(group)
-    ]
-
-    for element, seq_on_page_counter in zip(elements, page_seq_numbers):
-        element.id_to_hash(seq_on_page_counter)
-
-    return elements
+def _iter_elements_applying_metadata(
+    elements: Iterable[Element], metadata_updates: Iterable[tuple[str, Any]]
+) -> Iterator[Element]:
+    """Generate each of `elements` after setting each (field_name, value) of `metadata_updates`."""
+    for element in elements:
+        metadata = element.metadata
+        # NOTE(robinson) - Attached files have already run through this logic in their own
+        # partitioning function
+        if not metadata.attached_to_filename:
+            for field_name, value in metadata_updates:
+                setattr(metadata, field_name, value)
+        yield element
 
 
-def _uniqueify_elements_and_metadata(elements: list[Element]) -> list[Element]:
-    """Ensure each of `elements` and their metadata are unique instances.
+def _iter_unique_elements_and_metadata(elements: Iterable[Element]) -> Iterator[Element]:
+    """Generate each of `elements`, ensuring it and its metadata are unique instances.
 
-    This prevents hard-to-diagnose bugs downstream when mutating one element unexpectedly also
-    mutates others because they are the same instance.
+    Deep-copies are substituted for any non-unique elements or metadata. This prevents
+    hard-to-diagnose bugs downstream when mutating one element unexpectedly also mutates others
+    because they are the same instance.
     """
+    seen_elements: set[int] = set()
+    seen_metadata: set[int] = set()
 
-    def iter_unique_elements(elements: list[Element]) -> Iterator[Element]:
-        """Substitute deep-copies of any non-unique elements or metadata in `elements`."""
-        seen_elements: set[int] = set()
-        seen_metadata: set[int] = set()
-
-        for element in elements:
-            if id(element) in seen_elements:
-                element = copy.deepcopy(element)
-            if id(element.metadata) in seen_metadata:
-                element.metadata = copy.deepcopy(element.metadata)
-            seen_elements.add(id(element))
-            seen_metadata.add(id(element.metadata))
-            yield element
-
-    return list(iter_unique_elements(elements))
+    for element in elements:
+        if id(element) in seen_elements:
+            element = copy.deepcopy(element)
+        if id(element.metadata) in seen_metadata:
+            element.metadata = copy.deepcopy(element.metadata)
+        seen_elements.add(id(element))
+        seen_metadata.add(id(element.metadata))
+        yield element
@@ -25,6 +25,7 @@ def partition_csv(
     encoding: str | None = None,
     include_header: bool = False,
     infer_table_structure: bool = True,
+    rows_per_table: int | None = None,
     **kwargs: Any,
 ) -> list[Element]:
     """Partitions Microsoft Excel Documents in .csv format into its document elements.
@@ -45,6 +46,13 @@ def partition_csv(
         I.e., rows and cells are preserved.
         Whether True or False, the "text" field is always present in any Table element
         and is the text content of the table (no structure).
+    rows_per_table
+        When specified, the file is read `rows_per_table` data rows at a time and each such window
+        becomes its own `Table` element. The header row, when `include_header` is True, is
+        repeated in each window and `metadata.table_row_start` and `metadata.table_row_end` record
+        the (0-based, end-exclusive) range of data rows in the window. This bounds the size of the
+        DataFrame and HTML rendered at any one time for large files. By default the whole file
+        becomes a single `Table` element.
     """
     ctx = _CsvPartitioningContext.load(
         file_path=filename,
@@ -52,23 +60,26 @@ def partition_csv(
         encoding=encoding,
         include_header=include_header,
         infer_table_structure=infer_table_structure,
+        rows_per_table=rows_per_table,
     )
 
-    with ctx.open() as file:
-        dataframe = pd.read_csv(file, header=ctx.header, sep=ctx.delimiter, encoding=encoding)
+    # -- by default a CSV file becomes a single `Table` element --
+    if rows_per_table is None:
+        with ctx.open() as file:
+            dataframe = pd.read_csv(file, header=ctx.header, sep=ctx.delimiter, encoding=encoding)
+        return [ctx.table_from_dataframe(dataframe)]
 
-    html_table = HtmlTable.from_html_text(
-        dataframe.to_html(index=False, header=include_header, na_rep="")
-    )
-
-    metadata = ElementMetadata(
-        filename=filename,
-        last_modified=ctx.last_modified,
-        text_as_html=html_table.html if infer_table_structure else None,
-    )
+    elements: list[Element] = []
+    row_start = 0
+    with ctx.open() as file, pd.read_csv(
+        file, header=ctx.header, sep=ctx.delimiter, encoding=encoding, chunksize=rows_per_table
+    ) as reader:
+        for dataframe in reader:
+            row_end = row_start + len(dataframe)
+            elements.append(ctx.table_from_dataframe(dataframe, row_start, row_end))
+            row_start = row_end
 
-    # -- a CSV file becomes a single `Table` element --
-    return [Table(text=html_table.text, metadata=metadata, detection_origin=DETECTION_ORIGIN)]
+    return elements
 
 
 class _CsvPartitioningContext:
@@ -85,12 +96,14 @@ class _CsvPartitioningContext:
         encoding: str | None = None,
         include_header: bool = False,
         infer_table_structure: bool = True,
+        rows_per_table: int | None = None,
     ):
         self._file_path = file_path
         self._file = file
         self._encoding = encoding
         self._include_header = include_header
         self._infer_table_structure = infer_table_structure
+        self._rows_per_table = rows_per_table
 
     @classmethod
     def load(
@@ -100,6 +113,7 @@ class _CsvPartitioningContext:
         encoding: str | None,
         include_header: bool,
         infer_table_structure: bool,
+        rows_per_table: int | None = None,
     ) -> _CsvPartitioningContext:
         return cls(
             file_path=file_path,
@@ -107,6 +121,7 @@ class _CsvPartitioningContext:
             encoding=encoding,
             include_header=include_header,
             infer_table_structure=infer_table_structure,
+            rows_per_table=rows_per_table,
         )._validate()
 
     @lazyproperty
@@ -168,8 +183,28 @@ class _CsvPartitioningContext:
             yield file
             file.seek(0)
 
+    def table_from_dataframe(
+        self, dataframe: pd.DataFrame, row_start: int | None = None, row_end: int | None = None
+    ) -> Table:
+        """A `Table` element for `dataframe`, which is all or a row-window of the CSV file."""
+        html_table = HtmlTable.from_html_text(
+            dataframe.to_html(index=False, header=self._include_header, na_rep="")
+        )
+        metadata = ElementMetadata(
+            filename=self._file_path,
+            last_modified=self.last_modified,
+            table_row_end=row_end,
+            table_row_start=row_start,
+            text_as_html=html_table.html if self._infer_table_structure else None,
+        )
+        return Table(text=html_table.text, metadata=metadata, detection_origin=DETECTION_ORIGIN)
+
     def _validate(self) -> _CsvPartitioningContext:
         """Raise on invalid argument values."""
         if self._file_path is None and self._file is None:
             raise ValueError("either file-path or file-like object must be provided")
+        if self._rows_per_table is not None and self._rows_per_table < 1:
+            raise ValueError(
+                f"rows_per_table must be a positive integer, got {self._rows_per_table}"
+            )
         return self
@@ -17,6 +17,10 @@ from typing import IO, Any, Final, Iterator, cast
 from unstructured.documents.elements import Element, ElementMetadata
 from unstructured.file_utils.model import FileType
 from unstructured.partition.common import UnsupportedFileFormatError
+from unstructured.partition.common.attachments import (
+    attachment_content_hash,
+    iter_attachment_elements,
+)
 from unstructured.partition.common.metadata import get_last_modified_date
 from unstructured.partition.html import partition_html
 from unstructured.partition.text import partition_text
@@ -33,6 +37,7 @@ def partition_email(
     metadata_filename: str | None = None,
     metadata_last_modified: str | None = None,
     process_attachments: bool = True,
+    attachments_max_workers: int = 1,
     **kwargs: Any,
 ) -> list[Element]:
     """Partitions an .eml file into document elements.
@@ -54,6 +59,10 @@ def partition_email(
             partitioning the message body. All document elements appear in the single returned
             element list. The filename of the attachment, when available, is used as the
             `filename` metadata value for elements arising from the attachment.
+        attachments_max_workers: The maximum number of attachments to partition concurrently, on
+            a thread pool. The default of 1 partitions attachments one at a time. In either case
+            attachments with identical bytes and file-name are partitioned only once and element
+            order follows attachment order.
 
     Note that all global keyword arguments such as `unique_element_ids`, `language` and
     `chunking_strategy` can be used and will be passed along to the decorators that implement
@@ -67,6 +76,7 @@ def partition_email(
         metadata_file_path=metadata_filename,
         metadata_last_modified=metadata_last_modified,
         process_attachments=process_attachments,
+        attachments_max_workers=attachments_max_workers,
         kwargs=kwargs,
     )
 
@@ -84,6 +94,7 @@ class EmailPartitioningContext:
         metadata_file_path: str | None = None,
         metadata_last_modified: str | None = None,
         process_attachments: bool = False,
+        attachments_max_workers: int = 1,
         kwargs: dict[str, Any] = {},
     ):
         self._file_path = file_path
@@ -92,6 +103,7 @@ class EmailPartitioningContext:
         self._metadata_file_path = metadata_file_path
         self._metadata_last_modified = metadata_last_modified
         self._process_attachments = process_attachments
+        self._attachments_max_workers = attachments_max_workers
         self._kwargs = kwargs
 
     @classmethod
@@ -104,6 +116,7 @@ class EmailPartitioningContext:
         metadata_last_modified: str | None,
         process_attachments: bool,
         kwargs: dict[str, Any],
+        attachments_max_workers: int = 1,
     ) -> EmailPartitioningContext:
         """Construct and validate an instance."""
         return cls(
@@ -113,9 +126,15 @@ class EmailPartitioningContext:
             metadata_file_path=metadata_file_path,
             metadata_last_modified=metadata_last_modified,
             process_attachments=process_attachments,
+            attachments_max_workers=attachments_max_workers,
             kwargs=kwargs,
         )._validate()
 
+    @lazyproperty
+    def attachments_max_workers(self) -> int:
+        """The maximum number of attachments partitioned concurrently."""
+        return self._attachments_max_workers
+
     @lazyproperty
     def bcc_addresses(self) -> list[str] | None:
         """The "blind carbon-copy" Bcc: addresses of the message."""
@@ -296,6 +315,11 @@ class EmailPartitioningContext:
                 raise ValueError("file object must be opened in binary mode")
             self._file.seek(0)
 
+        if self._attachments_max_workers < 1:
+            raise ValueError(
+                f"attachments_max_workers must be at least 1, got {self._attachments_max_workers}"
+            )
+
         if self._content_source not in VALID_CONTENT_SOURCES:
             raise ValueError(
                 f"{repr(self._content_source)} is not a valid value for content_source;"
@@ -329,8 +353,14 @@ class _EmailPartitioner:
         if not self._ctx.process_attachments:
             return
 
-        for attachment in self._ctx.msg.iter_attachments():
-            yield from _AttachmentPartitioner.iter_elements(attachment, self._ctx)
+        yield from iter_attachment_elements(
+            [
+                _AttachmentPartitioner(attachment, self._ctx)
+                for attachment in self._ctx.msg.iter_attachments()
+            ],
+            max_workers=self._ctx.attachments_max_workers,
+            unique_element_ids=self._ctx.partitioning_kwargs.get("unique_element_ids", False),
+        )
 
     def _iter_email_body_elements(self) -> Iterator[Element]:
         """Generate document elements from the email body."""
@@ -369,12 +399,18 @@ class _AttachmentPartitioner:
         self._attachment = attachment
         self._ctx = ctx
 
-    @classmethod
-    def iter_elements(
-        cls, attachment: EmailMessage, ctx: EmailPartitioningContext
-    ) -> Iterator[Element]:
-        """Partition an attachment MIME-part from a MIME email message (.eml file)."""
-        return cls(attachment, ctx)._iter_elements()
+    @lazyproperty
+    def cache_key(self) -> tuple[str, str | None]:
+        """Equal for attachments that have the same bytes and file-name.
+
+        The file-name is included because it is applied as `filename` metadata and so affects
+        hash element-ids. The last-modified date is the same for all attachments of a message.
+        """
+        return (attachment_content_hash(self._file_bytes), self._attachment_file_name)
+
+    def partition(self) -> list[Element]:
+        """The elements of this attachment, empty when it is not partitionable."""
+        return list(self._iter_elements())
 
     def _iter_elements(self) -> Iterator[Element]:
         """Partition the byte-stream in the attachment MIME-part into elements.
@@ -16,6 +16,7 @@ from unstructured.file_utils.model import FileType
 from unstructured.partition.common.metadata import apply_metadata, get_last_modified_date
 from unstructured.partition.html.parser import Flow, html_parser
 from unstructured.partition.html.transformations import (
+    discard_ontology_tags,
     ontology_to_unstructured_elements,
     parse_html_to_ontology,
 )
@@ -217,6 +218,7 @@ class _HtmlPartitioner:
         )
 
         for e in elements_iter:
+            discard_ontology_tags(e)
             e.metadata.last_modified = self._opts.last_modified
             e.metadata.detection_origin = self._opts.detection_origin
 
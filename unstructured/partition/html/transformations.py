@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import html
 from collections import OrderedDict
-from itertools import chain
 from typing import Sequence, Type
 
 from bs4 import BeautifulSoup, Tag
@@ -17,6 +16,10 @@ from unstructured.documents.mappings import (
 
 RECURSION_LIMIT = 50
 
+# -- name of the attribute under which an element produced from the ontology carries the
+# -- ontology elements its `metadata.text_as_html` was rendered from --
+_ONTOLOGY_TAGS_ATTR = "_ontology_tags"
+
 
 def ontology_to_unstructured_elements(
     ontology_element: ontology.OntologyElement,
@@ -57,20 +60,20 @@ def ontology_to_unstructured_elements(
             page_number = ontology_element.page_number
 
         if not isinstance(ontology_element, ontology.Document):
-            elements_to_return += [
-                elements.Text(
-                    text="",
-                    element_id=ontology_element.id,
-                    detection_origin="vlm_partitioner",
-                    metadata=elements.ElementMetadata(
-                        parent_id=parent_id,
-                        text_as_html=ontology_element.to_html(add_children=False),
-                        page_number=page_number,
-                        category_depth=depth,
-                        filename=filename,
-                    ),
-                )
-            ]
+            layout_element = elements.Text(
+                text="",
+                element_id=ontology_element.id,
+                detection_origin="vlm_partitioner",
+                metadata=elements.ElementMetadata(
+                    parent_id=parent_id,
+                    text_as_html=ontology_element.to_html(add_children=False),
+                    page_number=page_number,
+                    category_depth=depth,
+                    filename=filename,
+                ),
+            )
+            _attach_ontology_tags(layout_element, [(ontology_element, False)])
+            elements_to_return += [layout_element]
         children: list[elements.Element] = []
         for child in ontology_element.children:
             child = ontology_to_unstructured_elements(
@@ -89,8 +92,11 @@ def ontology_to_unstructured_elements(
         element_class: type[elements.Element] = ONTOLOGY_CLASS_TO_UNSTRUCTURED_ELEMENT_TYPE[
             ontology_element.__class__
         ]
-        html_code_of_ontology_element = ontology_element.to_html()
-        element_text = ontology_element.to_text(add_img_alt_text=add_img_alt_text)
+        html_cache: dict[int, str] = {}
+        html_code_of_ontology_element = ontology_element.to_html_memoized(html_cache)
+        element_text = ontology_element.to_text(
+            add_img_alt_text=add_img_alt_text, html_cache=html_cache
+        )
 
         unstructured_element = element_class(
             text=element_text,  # type: ignore
@@ -104,6 +110,7 @@ def ontology_to_unstructured_elements(
                 filename=filename,
             ),
         )
+        _attach_ontology_tags(unstructured_element, [(ontology_element, True)])
         elements_to_return = [unstructured_element]
 
     return elements_to_return
@@ -137,8 +144,12 @@ def combine_inline_elements(elements: list[elements.Element]) -> list[elements.E
             continue
 
         if can_unstructured_elements_be_merged(current_element, next_element):
+            current_tags = _get_ontology_tags(current_element)
+            next_tags = _get_ontology_tags(next_element)
             current_element.text += " " + next_element.text
             current_element.metadata.text_as_html += next_element.metadata.text_as_html
+            if current_tags is not None and next_tags is not None:
+                _attach_ontology_tags(current_element, current_tags + next_tags)
         else:
             result_elements.append(current_element)
             current_element = next_element
@@ -161,28 +172,45 @@ def can_unstructured_elements_be_merged(
     if current_element.metadata.category_depth != next_element.metadata.category_depth:
         return False
 
-    current_html_tags = BeautifulSoup(
-        current_element.metadata.text_as_html, "html.parser"
-    ).find_all(recursive=False)
-    next_html_tags = BeautifulSoup(next_element.metadata.text_as_html, "html.parser").find_all(
-        recursive=False
-    )
+    return _is_mergeable(current_element) and _is_mergeable(next_element)
 
-    ontology_elements = [
-        parse_html_to_ontology_element(html_tag)
-        for html_tag in chain(current_html_tags, next_html_tags)
-    ]
 
-    for ontology_element in ontology_elements:
+def _is_mergeable(element: elements.Element) -> bool:
+    """True when every top-level tag of `element.metadata.text_as_html` is a childless inline
+    or text element.
+
+    Uses the ontology elements carried from `ontology_to_unstructured_elements()` when
+    available and falls back to parsing `text_as_html` otherwise.
+    """
+    ontology_tags = _get_ontology_tags(element)
+    if ontology_tags is not None and all(
+        _is_free_of_raw_html(ontology_element, add_children=False)
+        for ontology_element, _ in ontology_tags
+    ):
+        return all(
+            not (add_children and ontology_element.children)
+            and _is_inline_or_text_element(ontology_element)
+            for ontology_element, add_children in ontology_tags
+        )
+
+    html_tags = BeautifulSoup(element.metadata.text_as_html, "html.parser").find_all(
+        recursive=False
+    )
+    for html_tag in html_tags:
+        ontology_element = parse_html_to_ontology_element(html_tag)
         if ontology_element.children:
             return False
 
-        if not (is_inline_element(ontology_element) or is_text_element(ontology_element)):
+        if not _is_inline_or_text_element(ontology_element):
             return False
 
     return True
 
 
+def _is_inline_or_text_element(ontology_element: ontology.OntologyElement) -> bool:
+    return is_inline_element(ontology_element) or is_text_element(ontology_element)
+
+
 def is_text_element(ontology_element: ontology.OntologyElement) -> bool:
     """Categories or classes that we want to combine with inline text"""
 
@@ -250,9 +278,6 @@ def unstructured_elements_to_ontology(
     )
 
     for element in unstructured_elements:
-        html_as_tags = BeautifulSoup(element.metadata.text_as_html, "html.parser").find_all(
-            recursive=False
-        )
         element_id = element.id
         parent_id = element.metadata.parent_id
 
@@ -260,8 +285,7 @@ def unstructured_elements_to_ontology(
             # Make sure that no element is lost
             parent_id = root_element_id
 
-        for html_as_tag in html_as_tags:
-            ontology_element = parse_html_to_ontology_element(html_as_tag)
+        for ontology_element in _ontology_elements_from_unstructured_element(element):
             id_to_element_mapping[element_id] = ontology_element
             id_to_element_mapping[parent_id].children.append(ontology_element)
 
@@ -269,10 +293,94 @@ def unstructured_elements_to_ontology(
     return root_element
 
 
+def _ontology_elements_from_unstructured_element(
+    element: elements.Element,
+) -> list[ontology.OntologyElement]:
+    """Returns one fresh ontology element per top-level tag of `element.metadata.text_as_html`.
+
+    Elements produced by `ontology_to_unstructured_elements()` are copied from the ontology
+    elements they carry; other elements have their `text_as_html` parsed.
+    """
+    ontology_tags = _get_ontology_tags(element)
+    if ontology_tags is not None and all(
+        _is_free_of_raw_html(ontology_element, add_children)
+        for ontology_element, add_children in ontology_tags
+    ):
+        return [
+            (
+                ontology_element.model_copy(deep=True)
+                if add_children
+                else ontology_element.model_copy(update={"children": []}).model_copy(deep=True)
+            )
+            for ontology_element, add_children in ontology_tags
+        ]
+
+    html_as_tags = BeautifulSoup(element.metadata.text_as_html, "html.parser").find_all(
+        recursive=False
+    )
+    return [parse_html_to_ontology_element(html_as_tag) for html_as_tag in html_as_tags]
+
+
+def _is_free_of_raw_html(
+    ontology_element: ontology.OntologyElement, add_children: bool = True
+) -> bool:
+    """False when some rendered text holds markup, e.g. the text left by `RECURSION_LIMIT`.
+
+    Such text turns into tags when `text_as_html` is re-parsed, so the carried ontology
+    elements can't stand in for the parsed HTML.
+    """
+    stack = [ontology_element]
+    while stack:
+        current = stack.pop()
+        if "<" in (current.text or ""):
+            return False
+        if add_children:
+            stack.extend(current.children)
+    return True
+
+
+def _attach_ontology_tags(
+    element: elements.Element,
+    ontology_tags: list[tuple[ontology.OntologyElement, bool]],
+) -> None:
+    """Records on `element` the ontology elements its `text_as_html` was rendered from.
+
+    Each entry pairs an ontology element with whether its children were rendered too.
+    """
+    setattr(element, _ONTOLOGY_TAGS_ATTR, (element.metadata.text_as_html, ontology_tags))
+
+
+def discard_ontology_tags(element: elements.Element) -> None:
+    """Removes the ontology elements recorded on `element` by `ontology_to_unstructured_elements()`.
+
+    They only serve the conversion to and from the ontology, so elements leaving a partitioner
+    shouldn't keep them alive.
+    """
+    vars(element).pop(_ONTOLOGY_TAGS_ATTR, None)
+
+
+def _get_ontology_tags(
+    element: elements.Element,
+) -> list[tuple[ontology.OntologyElement, bool]] | None:
+    """The ontology elements recorded on `element`, or None when `text_as_html` has changed."""
+    recorded = getattr(element, _ONTOLOGY_TAGS_ATTR, None)
+    if recorded is None:
+        return None
+    text_as_html, ontology_tags = recorded
+    if text_as_html != element.metadata.text_as_html:
+        return None
+    return ontology_tags
+
+
 def parse_html_to_ontology(html_code: str) -> ontology.OntologyElement:
     """
     Parses the given HTML code and converts it into an Element object.
 
+    The HTML is parsed once and empty nodes are pruned from that tree in place, rather than
+    re-serializing and re-parsing the document after each cleanup step. `html.parser` is kept
+    on purpose: lenient builders like lxml or html5lib "repair" invalid nesting (e.g. a block
+    inside <p>) and would change the resulting ontology structure.
+
     Args:
         html_code (str): The HTML code to be parsed.
             Parsing HTML will start from <div class="Page">.
@@ -282,9 +390,12 @@ def parse_html_to_ontology(html_code: str) -> ontology.OntologyElement:
     Raises:
         ValueError: If no <body class="Document"> element is found in the HTML.
     """
-    html_code = remove_empty_divs_from_html_content(html_code)
-    html_code = remove_empty_tags_from_html_content(html_code)
     soup = BeautifulSoup(html_code, "html.parser")
+    _remove_empty_divs(soup)
+    _remove_empty_tags(soup)
+    # -- unwrapping and decomposing leave sibling strings split; a re-parse would merge them --
+    soup.smooth()
+
     document = soup.find("body", class_="Document")
     if not document:
         document = soup.find("div", class_="Page")
@@ -300,17 +411,27 @@ def parse_html_to_ontology(html_code: str) -> ontology.OntologyElement:
 
 def remove_empty_divs_from_html_content(html_content: str) -> str:
     soup = BeautifulSoup(html_content, "html.parser")
-    divs = soup.find_all("div")
-    for div in reversed(divs):
-        if not div.attrs:
-            div.unwrap()
+    _remove_empty_divs(soup)
     return str(soup)
 
 
 def remove_empty_tags_from_html_content(html_content: str) -> str:
     soup = BeautifulSoup(html_content, "html.parser")
+    _remove_empty_tags(soup)
+    return str(soup)
+
+
+def _remove_empty_divs(soup: BeautifulSoup) -> None:
+    """Unwrap, in place, every <div> that has no attributes."""
+    for div in reversed(soup.find_all("div")):
+        if not div.attrs:
+            div.unwrap()
+
+
+def _remove_empty_tags(soup: BeautifulSoup) -> None:
+    """Decompose, in place, text-container tags that have no attributes, children or text."""
 
-    def is_empty(tag):
+    def is_empty(tag: Tag) -> bool:
         # Remove only specific tags, omit self-closing ones
         if tag.name not in ["p", "span", "div", "h1", "h2", "h3", "h4", "h5", "h6"]:
             return False
@@ -323,14 +444,9 @@ def remove_empty_tags_from_html_content(html_content: str) -> str:
 
         return bool(not tag.get_text(strip=True))
 
-    def remove_empty_tags(soup):
-        for tag in soup.find_all():
-            if is_empty(tag):
-                tag.decompose()
-
-    remove_empty_tags(soup)
-
-    return str(soup)
+    for tag in soup.find_all():
+        if is_empty(tag):
+            tag.decompose()
 
 
 def parse_html_to_ontology_element(soup: Tag, recursion_depth: int = 1) -> ontology.OntologyElement:
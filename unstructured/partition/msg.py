@@ -12,6 +12,10 @@ from unstructured.documents.elements import Element, ElementMetadata
 from unstructured.file_utils.model import FileType
 from unstructured.logger import logger
 from unstructured.partition.common import UnsupportedFileFormatError
+from unstructured.partition.common.attachments import (
+    attachment_content_hash,
+    iter_attachment_elements,
+)
 from unstructured.partition.common.metadata import get_last_modified_date
 from unstructured.partition.html import partition_html
 from unstructured.partition.text import partition_text
@@ -25,6 +29,7 @@ def partition_msg(
     metadata_filename: Optional[str] = None,
     metadata_last_modified: Optional[str] = None,
     process_attachments: bool = True,
+    attachments_max_workers: int = 1,
     **kwargs: Any,
 ) -> list[Element]:
     """Partitions a MSFT Outlook .msg file
@@ -42,6 +47,11 @@ def partition_msg(
     process_attachments
         If True, partition_email will process email attachments in addition to
         processing the content of the email itself.
+    attachments_max_workers
+        The maximum number of attachments to partition concurrently, on a thread pool. The
+        default of 1 partitions attachments one at a time. In either case attachments with
+        identical bytes, file-name and last-modified date are partitioned only once and element
+        order follows attachment order.
     """
     opts = MsgPartitionerOptions(
         file=file,
@@ -49,6 +59,7 @@ def partition_msg(
         metadata_file_path=metadata_filename,
         metadata_last_modified=metadata_last_modified,
         partition_attachments=process_attachments,
+        attachments_max_workers=attachments_max_workers,
         kwargs=kwargs,
     )
 
@@ -67,14 +78,26 @@ class MsgPartitionerOptions:
         metadata_last_modified: str | None,
         partition_attachments: bool,
         kwargs: dict[str, Any],
+        attachments_max_workers: int = 1,
     ):
+        if attachments_max_workers < 1:
+            raise ValueError(
+                f"attachments_max_workers must be at least 1, got {attachments_max_workers}"
+            )
+
         self._file = file
         self._file_path = file_path
         self._metadata_file_path = metadata_file_path
         self._metadata_last_modified = metadata_last_modified
         self._partition_attachments = partition_attachments
+        self._attachments_max_workers = attachments_max_workers
         self._kwargs = kwargs
 
+    @lazyproperty
+    def attachments_max_workers(self) -> int:
+        """The maximum number of attachments partitioned concurrently."""
+        return self._attachments_max_workers
+
     @lazyproperty
     def extra_msg_metadata(self) -> ElementMetadata:
         """ElementMetadata suitable for use on an element formed from message content.
@@ -197,8 +220,11 @@ class _MsgPartitioner:
         if not self._opts.partition_attachments:
             return
 
-        for attachment in self._attachments:
-            yield from _AttachmentPartitioner.iter_elements(attachment, self._opts)
+        yield from iter_attachment_elements(
+            [_AttachmentPartitioner(attachment, self._opts) for attachment in self._attachments],
+            max_workers=self._opts.attachments_max_workers,
+            unique_element_ids=self._opts.partitioning_kwargs.get("unique_element_ids", False),
+        )
 
     @lazyproperty
     def _attachments(self) -> tuple[Attachment, ...]:
@@ -242,12 +268,22 @@ class _AttachmentPartitioner:
         self._attachment = attachment
         self._opts = opts
 
-    @classmethod
-    def iter_elements(
-        cls, attachment: Attachment, opts: MsgPartitionerOptions
-    ) -> Iterator[Element]:
-        """Partition an `oxmsg.attachment.Attachment` from an Outlook email message (.msg file)."""
-        return cls(attachment, opts)._iter_elements()
+    @lazyproperty
+    def cache_key(self) -> tuple[str, str, str | None]:
+        """Equal for attachments that have the same bytes, file-name and last-modified date.
+
+        The file-name and last-modified date are applied as metadata, and the file-name also
+        affects hash element-ids, so they are part of the key.
+        """
+        return (
+            attachment_content_hash(self._file_bytes),
+            self._attachment_file_name,
+            self._attachment_last_modified,
+        )
+
+    def partition(self) -> list[Element]:
+        """The elements of this attachment, empty when it is not partitionable."""
+        return list(self._iter_elements())
 
     def _iter_elements(self) -> Iterator[Element]:
         """Partition the file in an `oxmsg.attachment.Attachment` into elements."""
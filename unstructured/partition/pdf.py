@@ -5,6 +5,7 @@ import copy
 import io
 import os
 import re
+import tempfile
 import warnings
 from pathlib import Path
 from typing import IO, TYPE_CHECKING, Any, Optional, cast
@@ -94,7 +95,11 @@ from unstructured.partition.utils.constants import (
     OCRMode,
     PartitionStrategy,
 )
-from unstructured.partition.utils.sorting import coord_has_valid_points, sort_page_elements
+from unstructured.partition.utils.sorting import (
+    coord_has_valid_points,
+    sort_document_elements,
+    sort_page_elements,
+)
 from unstructured.patches.pdfminer import patch_psparser
 from unstructured.utils import first, requires_dependencies
 
@@ -250,6 +255,7 @@ def partition_pdf(
     )
 
 
+@env_config.pinned()
 def partition_pdf_or_image(
     filename: str = "",
     file: Optional[bytes | IO[bytes]] = None,
@@ -644,234 +650,251 @@ def _partition_pdf_or_image_local(
     final_layout_dumper: Optional[FinalLayoutDumper] = None
 
     skip_analysis_dump = env_config.ANALYSIS_DUMP_OD_SKIP
-
-    if file is None:
-        inferred_document_layout = process_file_with_model(
-            filename,
-            is_image=is_image,
-            model_name=hi_res_model_name,
-            pdf_image_dpi=pdf_image_dpi,
-            password=password,
-        )
-
-        extracted_layout, layouts_links = (
-            process_file_with_pdfminer(
-                filename=filename,
-                dpi=pdf_image_dpi,
+    # -- PDF pages rendered for OCR are kept to draw the analysis bboxes on, instead of rendering
+    # -- them again afterwards.
+    with (
+        tempfile.TemporaryDirectory()
+        if analysis and not is_image and not (skip_analysis_dump or env_config.ANALYSIS_BBOX_SKIP)
+        else contextlib.nullcontext()
+    ) as page_images_dir:
+        if file is None:
+            inferred_document_layout = process_file_with_model(
+                filename,
+                is_image=is_image,
+                model_name=hi_res_model_name,
+                pdf_image_dpi=pdf_image_dpi,
                 password=password,
-                pdfminer_config=pdfminer_config,
             )
-            if pdf_text_extractable
-            else ([], [])
-        )
 
-        if analysis:
-            if not analyzed_image_output_dir_path:
-                if env_config.GLOBAL_WORKING_DIR_ENABLED:
-                    analyzed_image_output_dir_path = str(
-                        Path(env_config.GLOBAL_WORKING_PROCESS_DIR) / "annotated"
-                    )
-                else:
-                    analyzed_image_output_dir_path = str(Path.cwd() / "annotated")
-            os.makedirs(analyzed_image_output_dir_path, exist_ok=True)
-            if not skip_analysis_dump:
-                od_model_layout_dumper = ObjectDetectionLayoutDumper(
-                    layout=inferred_document_layout,
-                    model_name=hi_res_model_name,
-                )
-                extracted_layout_dumper = ExtractedLayoutDumper(
-                    layout=[layout.as_list() for layout in extracted_layout],
+            extracted_layout, layouts_links = (
+                process_file_with_pdfminer(
+                    filename=filename,
+                    dpi=pdf_image_dpi,
+                    password=password,
+                    pdfminer_config=pdfminer_config,
                 )
-                ocr_layout_dumper = OCRLayoutDumper()
-        # NOTE(christine): merged_document_layout = extracted_layout + inferred_layout
-        merged_document_layout = merge_inferred_with_extracted_layout(
-            inferred_document_layout=inferred_document_layout,
-            extracted_layout=extracted_layout,
-            hi_res_model_name=hi_res_model_name,
-        )
-
-        final_document_layout = process_file_with_ocr(
-            filename,
-            merged_document_layout,
-            extracted_layout=extracted_layout,
-            is_image=is_image,
-            infer_table_structure=infer_table_structure,
-            ocr_agent=ocr_agent,
-            ocr_languages=ocr_languages,
-            ocr_mode=ocr_mode,
-            pdf_image_dpi=pdf_image_dpi,
-            ocr_layout_dumper=ocr_layout_dumper,
-            password=password,
-            table_ocr_agent=table_ocr_agent,
-        )
-    else:
-        inferred_document_layout = process_data_with_model(
-            file,
-            is_image=is_image,
-            model_name=hi_res_model_name,
-            pdf_image_dpi=pdf_image_dpi,
-            password=password,
-        )
+                if pdf_text_extractable
+                else ([], [])
+            )
 
-        if hasattr(file, "seek"):
-            file.seek(0)
+            if analysis:
+                if not analyzed_image_output_dir_path:
+                    if env_config.GLOBAL_WORKING_DIR_ENABLED:
+                        analyzed_image_output_dir_path = str(
+                            Path(env_config.GLOBAL_WORKING_PROCESS_DIR) / "annotated"
+                        )
+                    else:
+                        analyzed_image_output_dir_path = str(Path.cwd() / "annotated")
+                os.makedirs(analyzed_image_output_dir_path, exist_ok=True)
+                if not skip_analysis_dump:
+                    od_model_layout_dumper = ObjectDetectionLayoutDumper(
+                        layout=inferred_document_layout,
+                        model_name=hi_res_model_name,
+                    )
+                    extracted_layout_dumper = ExtractedLayoutDumper(
+                        layout=[layout.as_list() for layout in extracted_layout],
+                    )
+                    ocr_layout_dumper = OCRLayoutDumper()
+            # NOTE(christine): merged_document_layout = extracted_layout + inferred_layout
+            merged_document_layout = merge_inferred_with_extracted_layout(
+                inferred_document_layout=inferred_document_layout,
+                extracted_layout=extracted_layout,
+                hi_res_model_name=hi_res_model_name,
+            )
 
-        extracted_layout, layouts_links = (
-            process_data_with_pdfminer(
-                file=file, dpi=pdf_image_dpi, password=password, pdfminer_config=pdfminer_config
+            final_document_layout = process_file_with_ocr(
+                filename,
+                merged_document_layout,
+                extracted_layout=extracted_layout,
+                is_image=is_image,
+                infer_table_structure=infer_table_structure,
+                ocr_agent=ocr_agent,
+                ocr_languages=ocr_languages,
+                ocr_mode=ocr_mode,
+                pdf_image_dpi=pdf_image_dpi,
+                ocr_layout_dumper=ocr_layout_dumper,
+                password=password,
+                table_ocr_agent=table_ocr_agent,
+                page_images_dir=page_images_dir,
+            )
+        else:
+            inferred_document_layout = process_data_with_model(
+                file,
+                is_image=is_image,
+                model_name=hi_res_model_name,
+                pdf_image_dpi=pdf_image_dpi,
+                password=password,
             )
-            if pdf_text_extractable
-            else ([], [])
-        )
 
-        if analysis:
-            if not analyzed_image_output_dir_path:
-                if env_config.GLOBAL_WORKING_DIR_ENABLED:
-                    analyzed_image_output_dir_path = str(
-                        Path(env_config.GLOBAL_WORKING_PROCESS_DIR) / "annotated"
-                    )
-                else:
-                    analyzed_image_output_dir_path = str(Path.cwd() / "annotated")
-            if not skip_analysis_dump:
-                od_model_layout_dumper = ObjectDetectionLayoutDumper(
-                    layout=inferred_document_layout,
-                    model_name=hi_res_model_name,
-                )
-                extracted_layout_dumper = ExtractedLayoutDumper(
-                    layout=[layout.as_list() for layout in extracted_layout],
+            if hasattr(file, "seek"):
+                file.seek(0)
+
+            extracted_layout, layouts_links = (
+                process_data_with_pdfminer(
+                    file=file, dpi=pdf_image_dpi, password=password, pdfminer_config=pdfminer_config
                 )
-                ocr_layout_dumper = OCRLayoutDumper()
+                if pdf_text_extractable
+                else ([], [])
+            )
 
-        # NOTE(christine): merged_document_layout = extracted_layout + inferred_layout
-        merged_document_layout = merge_inferred_with_extracted_layout(
-            inferred_document_layout=inferred_document_layout,
-            extracted_layout=extracted_layout,
-            hi_res_model_name=hi_res_model_name,
-        )
+            if analysis:
+                if not analyzed_image_output_dir_path:
+                    if env_config.GLOBAL_WORKING_DIR_ENABLED:
+                        analyzed_image_output_dir_path = str(
+                            Path(env_config.GLOBAL_WORKING_PROCESS_DIR) / "annotated"
+                        )
+                    else:
+                        analyzed_image_output_dir_path = str(Path.cwd() / "annotated")
+                if not skip_analysis_dump:
+                    od_model_layout_dumper = ObjectDetectionLayoutDumper(
+                        layout=inferred_document_layout,
+                        model_name=hi_res_model_name,
+                    )
+                    extracted_layout_dumper = ExtractedLayoutDumper(
+                        layout=[layout.as_list() for layout in extracted_layout],
+                    )
+                    ocr_layout_dumper = OCRLayoutDumper()
 
-        if hasattr(file, "seek"):
-            file.seek(0)
-        final_document_layout = process_data_with_ocr(
-            file,
-            merged_document_layout,
-            extracted_layout=extracted_layout,
-            is_image=is_image,
-            infer_table_structure=infer_table_structure,
-            ocr_agent=ocr_agent,
-            ocr_languages=ocr_languages,
-            ocr_mode=ocr_mode,
-            pdf_image_dpi=pdf_image_dpi,
-            ocr_layout_dumper=ocr_layout_dumper,
-            password=password,
-            table_ocr_agent=table_ocr_agent,
-        )
+            # NOTE(christine): merged_document_layout = extracted_layout + inferred_layout
+            merged_document_layout = merge_inferred_with_extracted_layout(
+                inferred_document_layout=inferred_document_layout,
+                extracted_layout=extracted_layout,
+                hi_res_model_name=hi_res_model_name,
+            )
 
-    # vectorization of the data structure ends here
-    final_document_layout = clean_pdfminer_inner_elements(final_document_layout)
+            if hasattr(file, "seek"):
+                file.seek(0)
+            final_document_layout = process_data_with_ocr(
+                file,
+                merged_document_layout,
+                extracted_layout=extracted_layout,
+                is_image=is_image,
+                infer_table_structure=infer_table_structure,
+                ocr_agent=ocr_agent,
+                ocr_languages=ocr_languages,
+                ocr_mode=ocr_mode,
+                pdf_image_dpi=pdf_image_dpi,
+                ocr_layout_dumper=ocr_layout_dumper,
+                password=password,
+                table_ocr_agent=table_ocr_agent,
+                page_images_dir=page_images_dir,
+            )
 
-    elements = document_to_element_list(
-        final_document_layout,
-        sortable=True,
-        include_page_breaks=include_page_breaks,
-        last_modification_date=metadata_last_modified,
-        # NOTE(crag): do not attempt to derive ListItem's from a layout-recognized "list"
-        # block with NLP rules. Otherwise, the assumptions in
-        # unstructured.partition.common::layout_list_to_list_items often result in weird chunking.
-        infer_list_items=False,
-        languages=languages,
-        starting_page_number=starting_page_number,
-        layouts_links=layouts_links,
-        **kwargs,
-    )
+        # vectorization of the data structure ends here
+        final_document_layout = clean_pdfminer_inner_elements(final_document_layout)
 
-    extract_image_block_types = check_element_types_to_extract(extract_image_block_types)
-    #  NOTE(christine): `extract_images_in_pdf` would deprecate
-    #  (but continue to support for a while)
-    if extract_images_in_pdf:
-        save_elements(
-            elements=elements,
+        elements = document_to_element_list(
+            final_document_layout,
+            sortable=True,
+            include_page_breaks=include_page_breaks,
+            last_modification_date=metadata_last_modified,
+            # NOTE(crag): do not attempt to derive ListItem's from a layout-recognized "list"
+            # block with NLP rules. Otherwise, the assumptions in
+            # unstructured.partition.common::layout_list_to_list_items often result in weird
+            # chunking.
+            infer_list_items=False,
+            languages=languages,
             starting_page_number=starting_page_number,
-            element_category_to_save=ElementType.IMAGE,
-            filename=filename,
-            file=file,
-            is_image=is_image,
-            pdf_image_dpi=pdf_image_dpi,
-            extract_image_block_to_payload=extract_image_block_to_payload,
-            output_dir_path=extract_image_block_output_dir,
+            layouts_links=layouts_links,
+            **kwargs,
         )
 
-    for el_type in extract_image_block_types:
-        if extract_images_in_pdf and el_type == ElementType.IMAGE:
-            continue
+        extract_image_block_types = check_element_types_to_extract(extract_image_block_types)
+        #  NOTE(christine): `extract_images_in_pdf` would deprecate
+        #  (but continue to support for a while)
+        if extract_images_in_pdf:
+            save_elements(
+                elements=elements,
+                starting_page_number=starting_page_number,
+                element_category_to_save=ElementType.IMAGE,
+                filename=filename,
+                file=file,
+                is_image=is_image,
+                pdf_image_dpi=pdf_image_dpi,
+                extract_image_block_to_payload=extract_image_block_to_payload,
+                output_dir_path=extract_image_block_output_dir,
+            )
 
-        save_elements(
-            elements=elements,
-            starting_page_number=starting_page_number,
-            element_category_to_save=el_type,
-            filename=filename,
-            file=file,
-            is_image=is_image,
-            pdf_image_dpi=pdf_image_dpi,
-            extract_image_block_to_payload=extract_image_block_to_payload,
-            output_dir_path=extract_image_block_output_dir,
-        )
+        for el_type in extract_image_block_types:
+            if extract_images_in_pdf and el_type == ElementType.IMAGE:
+                continue
 
-    out_elements = []
-    for el in elements:
-        if isinstance(el, PageBreak) and not include_page_breaks:
-            continue
-
-        if isinstance(el, Image):
-            out_elements.append(cast(Element, el))
-        # NOTE(crag): this is probably always a Text object, but check for the sake of typing
-        elif isinstance(el, Text):
-            el.text = re.sub(
-                RE_MULTISPACE_INCLUDING_NEWLINES,
-                " ",
-                el.text or "",
-            ).strip()
-            if el.text or isinstance(el, PageBreak):
-                out_elements.append(cast(Element, el))
+            save_elements(
+                elements=elements,
+                starting_page_number=starting_page_number,
+                element_category_to_save=el_type,
+                filename=filename,
+                file=file,
+                is_image=is_image,
+                pdf_image_dpi=pdf_image_dpi,
+                extract_image_block_to_payload=extract_image_block_to_payload,
+                output_dir_path=extract_image_block_output_dir,
+            )
 
-    if extract_forms:
-        forms = run_form_extraction(
-            file=file,
-            filename=filename,
-            model_name=hi_res_model_name,
-            elements=out_elements,
-            skip_table_regions=form_extraction_skip_tables,
-        )
-        out_elements.extend(forms)
+        out_elements = []
+        for el in elements:
+            if isinstance(el, PageBreak) and not include_page_breaks:
+                continue
 
-    if analysis:
-        if not skip_analysis_dump:
-            final_layout_dumper = FinalLayoutDumper(
-                layout=out_elements,
+            if isinstance(el, Image):
+                out_elements.append(cast(Element, el))
+            # NOTE(crag): this is probably always a Text object, but check for the sake of typing
+            elif isinstance(el, Text):
+                el.text = re.sub(
+                    RE_MULTISPACE_INCLUDING_NEWLINES,
+                    " ",
+                    el.text or "",
+                ).strip()
+                if el.text or isinstance(el, PageBreak):
+                    out_elements.append(cast(Element, el))
+
+        if extract_forms:
+            forms = run_form_extraction(
+                file=file,
+                filename=filename,
+                model_name=hi_res_model_name,
+                elements=out_elements,
+                skip_table_regions=form_extraction_skip_tables,
             )
-        layout_dumpers = []
-        if od_model_layout_dumper:
-            layout_dumpers.append(od_model_layout_dumper)
-        if extracted_layout_dumper:
-            layout_dumpers.append(extracted_layout_dumper)
-        if ocr_layout_dumper:
-            layout_dumpers.append(ocr_layout_dumper)
-        if final_layout_dumper:
-            layout_dumpers.append(final_layout_dumper)
-        save_analysis_artifiacts(
-            *layout_dumpers,
-            filename=filename,
-            file=file,
-            is_image=is_image,
-            analyzed_image_output_dir_path=analyzed_image_output_dir_path,
-            skip_bboxes=env_config.ANALYSIS_BBOX_SKIP,
-            skip_dump_od=env_config.ANALYSIS_DUMP_OD_SKIP,
-            draw_grid=env_config.ANALYSIS_BBOX_DRAW_GRID,
-            draw_caption=env_config.ANALYSIS_BBOX_DRAW_CAPTION,
-            resize=env_config.ANALYSIS_BBOX_RESIZE,
-            format=env_config.ANALYSIS_BBOX_FORMAT,
-        )
+            out_elements.extend(forms)
 
-    return out_elements
+        if analysis:
+            if not skip_analysis_dump:
+                final_layout_dumper = FinalLayoutDumper(
+                    layout=out_elements,
+                )
+            layout_dumpers = []
+            if od_model_layout_dumper:
+                layout_dumpers.append(od_model_layout_dumper)
+            if extracted_layout_dumper:
+                layout_dumpers.append(extracted_layout_dumper)
+            if ocr_layout_dumper:
+                layout_dumpers.append(ocr_layout_dumper)
+            if final_layout_dumper:
+                layout_dumpers.append(final_layout_dumper)
+            save_analysis_artifiacts(
+                *layout_dumpers,
+                filename=filename,
+                file=file,
+                is_image=is_image,
+                analyzed_image_output_dir_path=analyzed_image_output_dir_path,
+                skip_bboxes=env_config.ANALYSIS_BBOX_SKIP,
+                skip_dump_od=env_config.ANALYSIS_DUMP_OD_SKIP,
+                draw_grid=env_config.ANALYSIS_BBOX_DRAW_GRID,
+                draw_caption=env_config.ANALYSIS_BBOX_DRAW_CAPTION,
+                resize=env_config.ANALYSIS_BBOX_RESIZE,
+                format=env_config.ANALYSIS_BBOX_FORMAT,
+                page_images=(
+                    # -- pdf2image zero-pads page numbers, so file names sort in page order --
+                    sorted(str(path) for path in Path(page_images_dir).iterdir())
+                    if page_images_dir
+                    else None
+                ),
+                max_workers=env_config.ANALYSIS_BBOX_MAX_WORKERS,
+                time_budget=env_config.ANALYSIS_BBOX_TIME_BUDGET,
+            )
+
+        return out_elements
 
 
 def _partition_pdf_with_pdfparser(
@@ -883,13 +906,13 @@ def _partition_pdf_with_pdfparser(
     """Partitions a PDF using pdfparser."""
     elements = []
 
-    for page_elements in extracted_elements:
-        # NOTE(crag, christine): always do the basic sort first for deterministic order across
-        # python versions.
-        sorted_page_elements = sort_page_elements(page_elements, SORT_MODE_BASIC)
-        if sort_mode != SORT_MODE_BASIC:
-            sorted_page_elements = sort_page_elements(sorted_page_elements, sort_mode)
+    # NOTE(crag, christine): always do the basic sort first for deterministic order across
+    # python versions.
+    sorted_pages = sort_document_elements(extracted_elements, SORT_MODE_BASIC)
+    if sort_mode != SORT_MODE_BASIC:
+        sorted_pages = sort_document_elements(sorted_pages, sort_mode)
 
+    for sorted_page_elements in sorted_pages:
         elements += sorted_page_elements
 
         if include_page_breaks:
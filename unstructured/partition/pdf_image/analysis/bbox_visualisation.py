@@ -1,24 +1,31 @@
+import concurrent.futures
+import contextlib
+import functools
 import logging
 import math
+import multiprocessing
 import tempfile
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Generator, List, Optional, TypeVar, Union
+from typing import Any, Generator, Iterator, List, Optional, Sequence, TypeVar, Union
 
 import numpy as np
 from matplotlib import colors, font_manager
 from PIL import Image, ImageDraw, ImageFont
 from unstructured_inference.constants import ElementType
 
+from unstructured.logger import logger
 from unstructured.partition.pdf_image.analysis.processor import AnalysisProcessor
 from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_image
 
 PageImage = TypeVar("PageImage", Image.Image, np.ndarray)
 
 
+@functools.lru_cache(maxsize=None)
 def get_font():
     preferred_fonts = ["Arial.ttf"]
     available_fonts = font_manager.findSystemFonts()
@@ -31,6 +38,12 @@ def get_font():
     return available_fonts[0]
 
 
+@functools.lru_cache(maxsize=None)
+def get_truetype_font(font_size: int) -> ImageFont.FreeTypeFont:
+    """The font used for labels and captions at `font_size`, loaded once per size."""
+    return ImageFont.truetype(get_font(), font_size)
+
+
 COLOR_WHITE = ("white", (255, 255, 255))
 COLOR_BLACK = ("black", (0, 0, 0))
 
@@ -277,7 +290,7 @@ def draw_bbox_label(
         font_size:          Font size of the text.
         background_color:   RGB values of the background color.
     """
-    font = ImageFont.truetype(get_font(), font_size)
+    font = get_truetype_font(font_size)
     text_x1, text_y1, text_x2, text_y2 = image_draw.textbbox(
         (0, 0), text, font=font, align="center"
     )
@@ -534,6 +547,15 @@ class FinalLayoutDrawer(LayoutDrawer):
         return self.color_map.get(element_type, "cyan")
 
 
+@dataclass
+class AnalysisDrawingReport:
+    """Outcome of drawing the analysis bboxes of a document."""
+
+    pages_drawn: int
+    pages_skipped: int
+    seconds: float
+
+
 class AnalysisDrawer(AnalysisProcessor):
 
     def __init__(
@@ -546,7 +568,18 @@ class AnalysisDrawer(AnalysisProcessor):
         draw_grid: bool = False,
         resize: Optional[float] = None,
         format: str = "png",
+        page_images: Optional[Sequence[Union[str, Path]]] = None,
+        max_workers: int = 1,
+        time_budget: Optional[float] = None,
     ):
+        """
+        Args:
+            page_images: Paths of already-rendered images of the pages, in page order, to draw on
+                instead of rendering the source file again.
+            max_workers: Number of worker processes to draw pages on. 1 draws them in-process.
+            time_budget: Seconds after which no more pages are drawn. Pages not drawn by then are
+                skipped and reported.
+        """
         self.draw_caption = draw_caption
         self.draw_grid = draw_grid
         self.resize = resize
@@ -554,64 +587,149 @@ class AnalysisDrawer(AnalysisProcessor):
         self.format = format
         self.drawers = []
         self.file = file
+        self.page_images = page_images
+        self.max_workers = max_workers
+        self.time_budget = time_budget
 
         super().__init__(filename, save_dir)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # -- the source file is not needed to draw a page on a worker process --
+        return {**self.__dict__, "file": None}
+
     def add_drawer(self, drawer: LayoutDrawer):
         self.drawers.append(drawer)
 
-    def process(self):
-
+    def process(self) -> AnalysisDrawingReport:
+        start_time = time.perf_counter()
         filename_stem = Path(self.filename).stem
         analysis_save_dir = Path(self.save_dir) / "analysis" / filename_stem / "bboxes"
         analysis_save_dir.mkdir(parents=True, exist_ok=True)
 
-        for page_idx, orig_image_page in enumerate(self.load_source_image()):
-            images_for_grid = []
-            page_num = page_idx + 1
-            for drawer in self.drawers:
-                try:
-                    image = drawer.draw_layout_on_page(orig_image_page.copy(), page_num=page_num)
-                except:  # noqa: E722
-                    logging.exception(
-                        f"Error while drawing layout for page {page_num} "
-                        f"for file {self.filename} with drawer "
-                        f"{drawer.__class__.__name__}"
-                    )
-                    continue
-                if self.draw_caption:
-                    image = self.add_caption(
-                        image, caption=f"Layout source: {drawer.layout_source}"
-                    )
-                if not self.draw_grid:
-                    if self.resize is not None:
-                        image = image.resize(
-                            (int(image.width * self.resize), int(image.height * self.resize)),
-                        )
-                    image.save(
-                        analysis_save_dir / f"page{page_num}"
-                        f"_layout_{drawer.layout_source}.{self.format}",
-                        optimize=True,
-                        quality=85,
-                    )
-                    image.close()
-                else:
-                    images_for_grid.append(image)
-            if images_for_grid:
-                grid_image = self.paste_images_on_grid(images_for_grid)
+        with self.source_image_paths() as image_paths:
+            if self.max_workers > 1 and len(image_paths) > 1:
+                pages_drawn = self._draw_pages_on_workers(
+                    image_paths, analysis_save_dir, start_time
+                )
+            else:
+                pages_drawn = self._draw_pages_in_process(
+                    image_paths, analysis_save_dir, start_time
+                )
+
+        report = AnalysisDrawingReport(
+            pages_drawn=pages_drawn,
+            pages_skipped=len(image_paths) - pages_drawn,
+            seconds=time.perf_counter() - start_time,
+        )
+        logger.info(
+            f"Drew analysis bboxes on {report.pages_drawn} of {len(image_paths)} pages of "
+            f"{self.filename} in {report.seconds:.2f}s"
+            + (" (time budget exceeded)" if report.pages_skipped else "")
+        )
+        return report
+
+    def _is_over_time_budget(self, start_time: float) -> bool:
+        return self.time_budget is not None and time.perf_counter() - start_time > self.time_budget
+
+    def _draw_pages_in_process(
+        self, image_paths: Sequence[Union[str, Path]], save_dir: Path, start_time: float
+    ) -> int:
+        for page_idx, image_path in enumerate(image_paths):
+            if self._is_over_time_budget(start_time):
+                return page_idx
+            self.draw_page(image_path, page_idx + 1, save_dir)
+        return len(image_paths)
+
+    def _draw_pages_on_workers(
+        self, image_paths: Sequence[Union[str, Path]], save_dir: Path, start_time: float
+    ) -> int:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(image_paths)),
+            mp_context=multiprocessing.get_context("spawn"),
+            # -- each worker receives the drawer and its layout dumps once rather than per page --
+            initializer=_set_worker_analysis_drawer,
+            initargs=(self,),
+        )
+        futures = [
+            executor.submit(_draw_page_on_worker, image_path, page_idx + 1, save_dir)
+            for page_idx, image_path in enumerate(image_paths)
+        ]
+        try:
+            concurrent.futures.wait(
+                futures,
+                timeout=(
+                    None
+                    if self.time_budget is None
+                    else max(self.time_budget - (time.perf_counter() - start_time), 0)
+                ),
+            )
+        finally:
+            # -- over the time budget, pages not started yet are cancelled but the pages being
+            # -- drawn are waited for, so no worker still writes files when this returns --
+            executor.shutdown(wait=True, cancel_futures=True)
+        pages_drawn = 0
+        for page_idx, future in enumerate(futures):
+            if future.cancelled():
+                continue
+            if (exception := future.exception()) is not None:
+                logger.error(
+                    f"Error while drawing analysis bboxes on page {page_idx + 1} of "
+                    f"{self.filename}",
+                    exc_info=exception,
+                )
+                continue
+            pages_drawn += 1
+        return pages_drawn
+
+    def draw_page(self, image_path: Union[str, Path], page_num: int, save_dir: Path) -> None:
+        """Draw the layout of each drawer on the page image at `image_path` and save the result."""
+        with Image.open(image_path) as source_image:
+            orig_image_page = source_image.convert("RGB")
+
+        images_for_grid = []
+        for drawer_idx, drawer in enumerate(self.drawers):
+            # -- the last drawer can draw on the page image itself --
+            is_last_drawer = drawer_idx == len(self.drawers) - 1
+            page_image = orig_image_page if is_last_drawer else orig_image_page.copy()
+            try:
+                image = drawer.draw_layout_on_page(page_image, page_num=page_num)
+            except:  # noqa: E722
+                logging.exception(
+                    f"Error while drawing layout for page {page_num} "
+                    f"for file {self.filename} with drawer "
+                    f"{drawer.__class__.__name__}"
+                )
+                continue
+            if self.draw_caption:
+                image = self.add_caption(image, caption=f"Layout source: {drawer.layout_source}")
+            if not self.draw_grid:
                 if self.resize is not None:
-                    grid_image = grid_image.resize(
-                        (int(grid_image.width * self.resize), int(grid_image.height * self.resize))
+                    image = image.resize(
+                        (int(image.width * self.resize), int(image.height * self.resize)),
                     )
-                grid_image.save(
-                    analysis_save_dir / f"page{page_num}_layout_all.{self.format}",
+                image.save(
+                    save_dir / f"page{page_num}_layout_{drawer.layout_source}.{self.format}",
                     optimize=True,
                     quality=85,
                 )
-                grid_image.close()
+                image.close()
+            else:
+                images_for_grid.append(image)
+        if images_for_grid:
+            grid_image = self.paste_images_on_grid(images_for_grid)
+            if self.resize is not None:
+                grid_image = grid_image.resize(
+                    (int(grid_image.width * self.resize), int(grid_image.height * self.resize))
+                )
+            grid_image.save(
+                save_dir / f"page{page_num}_layout_all.{self.format}",
+                optimize=True,
+                quality=85,
+            )
+            grid_image.close()
 
     def add_caption(self, image: Image.Image, caption: str):
-        font = ImageFont.truetype(get_font(), 52)
+        font = get_truetype_font(52)
         draw = ImageDraw.ImageDraw(image)
         text_x1, text_y1, text_x2, text_y2 = draw.textbbox(
             (0, 0), caption, font=font, align="center"
@@ -655,6 +773,19 @@ class AnalysisDrawer(AnalysisProcessor):
         return new_im
 
     def load_source_image(self) -> Generator[Image.Image, None, None]:
+        with self.source_image_paths() as image_paths:
+            for image_path in image_paths:
+                with Image.open(image_path) as image:
+                    yield image.convert("RGB")
+
+    @contextlib.contextmanager
+    def source_image_paths(self) -> Iterator[Sequence[Union[str, Path]]]:
+        """Paths of the page images of the source file, rendered to a temporary directory when
+        `page_images` was not provided."""
+        if self.page_images is not None:
+            yield self.page_images
+            return
+
         with tempfile.TemporaryDirectory() as temp_dir:
             image_paths = []
             if self.is_image:
@@ -685,6 +816,17 @@ class AnalysisDrawer(AnalysisProcessor):
                         f"exception: {ex}",
                     )
 
-            for image_path in image_paths:
-                with Image.open(image_path) as image:
-                    yield image.convert("RGB")
+            yield image_paths
+
+
+_worker_analysis_drawer: Optional[AnalysisDrawer] = None
+
+
+def _set_worker_analysis_drawer(analysis_drawer: AnalysisDrawer) -> None:
+    global _worker_analysis_drawer
+    _worker_analysis_drawer = analysis_drawer
+
+
+def _draw_page_on_worker(image_path: Union[str, Path], page_num: int, save_dir: Path) -> None:
+    assert _worker_analysis_drawer is not None
+    _worker_analysis_drawer.draw_page(image_path, page_num, save_dir)
@@ -2,7 +2,7 @@ import json
 import uuid
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 from unstructured.partition.pdf_image.analysis.bbox_visualisation import (
     AnalysisDrawer,
@@ -66,6 +66,9 @@ def save_analysis_artifiacts(
     draw_caption: bool = True,
     resize: Optional[float] = None,
     format: str = "png",
+    page_images: Optional[Sequence[Union[str, Path]]] = None,
+    max_workers: int = 1,
+    time_budget: Optional[float] = None,
 ):
     """Save the analysis artifacts for a given file. Loads some settings from
     the environment configuration.
@@ -82,6 +85,10 @@ def save_analysis_artifiacts(
         draw_caption: Flag for drawing the caption above the analyzed page (for e.g. layout source)
         resize: Output image resize value. If not provided, the image will not be resized.
         format: The format for analyzed pages with bboxes drawn on them. Default is 'png'.
+        page_images: Paths of already-rendered page images to draw the bboxes on, in page order.
+            If not provided, the pages are rendered from the file.
+        max_workers: Number of worker processes drawing the bboxes on pages.
+        time_budget: Seconds after which pages are no longer drawn on.
     """
     if not filename:
         filename = _generate_filename(is_image)
@@ -109,6 +116,9 @@ def save_analysis_artifiacts(
             draw_caption=draw_caption,
             resize=resize,
             format=format,
+            page_images=page_images,
+            max_workers=max_workers,
+            time_budget=time_budget,
         )
 
         for layout_dumper in layout_dumpers:
@@ -125,6 +135,8 @@ def render_bboxes_for_file(
     draw_caption: bool = True,
     resize: Optional[float] = None,
     format: str = "png",
+    max_workers: int = 1,
+    time_budget: Optional[float] = None,
 ):
     """Render the bounding boxes for a given layout dimp file.
     To be used for analysis after the partition is performed for
@@ -144,6 +156,8 @@ def render_bboxes_for_file(
         draw_caption: Flag for drawing the caption above the analyzed page (for e.g. layout source)
         resize: Output image resize value. If not provided, the image will not be resized.
         format: The format for analyzed pages with bboxes drawn on them. Default is 'png'.
+        max_workers: Number of worker processes drawing the bboxes on pages.
+        time_budget: Seconds after which pages are no longer drawn on.
     """
     filename_stem = Path(filename).stem
     is_image = not Path(filename).suffix.endswith("pdf")
@@ -183,6 +197,8 @@ def render_bboxes_for_file(
             draw_caption=draw_caption,
             resize=resize,
             format=format,
+            max_workers=max_workers,
+            time_budget=time_budget,
         )
 
         for drawer in layout_drawers:
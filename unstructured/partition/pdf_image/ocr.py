@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import itertools
 import os
 import tempfile
-from typing import IO, TYPE_CHECKING, Any, List, Optional, cast
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Sequence, cast
 
 import numpy as np
 import pdf2image
@@ -22,11 +24,18 @@ from unstructured.partition.pdf_image.pdfminer_processing import (
     bboxes1_is_almost_subregion_of_bboxes2,
 )
 from unstructured.partition.utils.config import env_config
-from unstructured.partition.utils.constants import OCR_AGENT_PADDLE, OCR_AGENT_TESSERACT, OCRMode
+from unstructured.partition.utils.constants import (
+    IMAGE_COLOR_DEPTH,
+    OCR_AGENT_PADDLE,
+    OCR_AGENT_TESSERACT,
+    TESSERACT_MAX_SIZE,
+    OCRMode,
+)
 from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
 from unstructured.utils import requires_dependencies
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from unstructured_inference.inference.elements import TextRegion, TextRegions
     from unstructured_inference.inference.layout import DocumentLayout, PageLayout
     from unstructured_inference.inference.layoutelement import LayoutElement, LayoutElements
@@ -46,6 +55,7 @@ def process_data_with_ocr(
     ocr_layout_dumper: Optional[OCRLayoutDumper] = None,
     password: Optional[str] = None,
     table_ocr_agent: str = OCR_AGENT_TESSERACT,
+    page_images_dir: Optional[str] = None,
 ) -> "DocumentLayout":
     """
     Process OCR data from a given data and supplement the output DocumentLayout
@@ -73,6 +83,10 @@ def process_data_with_ocr(
 
     - ocr_layout_dumper (OCRLayoutDumper, optional): The OCR layout dumper to save the OCR layout.
 
+    - page_images_dir (str, optional): Directory to render the PDF page images into and keep them
+        in, e.g. to draw analysis bboxes on later. By default they are rendered into a temporary
+        directory and deleted after OCR.
+
     Returns:
         DocumentLayout: The merged layout information obtained after OCR processing.
     """
@@ -96,6 +110,7 @@ def process_data_with_ocr(
             ocr_layout_dumper=ocr_layout_dumper,
             password=password,
             table_ocr_agent=table_ocr_agent,
+            page_images_dir=page_images_dir,
         )
 
     return merged_layouts
@@ -115,6 +130,7 @@ def process_file_with_ocr(
     ocr_layout_dumper: Optional[OCRLayoutDumper] = None,
     password: Optional[str] = None,
     table_ocr_agent: str = OCR_AGENT_TESSERACT,
+    page_images_dir: Optional[str] = None,
 ) -> "DocumentLayout":
     """
     Process OCR data from a given file and supplement the output DocumentLayout
@@ -142,6 +158,10 @@ def process_file_with_ocr(
 
     - pdf_image_dpi (int, optional): DPI (dots per inch) for processing PDF images. Defaults to 200.
 
+    - page_images_dir (str, optional): Directory to render the PDF page images into and keep them
+        in, e.g. to draw analysis bboxes on later. By default they are rendered into a temporary
+        directory and deleted after OCR.
+
     Returns:
         DocumentLayout: The merged layout information obtained after OCR processing.
     """
@@ -153,9 +173,24 @@ def process_file_with_ocr(
         if is_image:
             with PILImage.open(filename) as images:
                 image_format = images.format
-                for i, image in enumerate(ImageSequence.Iterator(images)):
-                    image = image.convert("RGB")
-                    image.format = image_format
+
+                def iter_page_images() -> Iterator[PILImage.Image]:
+                    for image in ImageSequence.Iterator(images):
+                        image = image.convert("RGB")
+                        image.format = image_format
+                        yield image
+
+                page_images: Iterable[PILImage.Image] = iter_page_images()
+                page_ocr_layouts: Iterator[Optional[TextRegions]] = itertools.repeat(None)
+                ocr_max_workers = _ocr_max_workers(ocr_mode, getattr(images, "n_frames", 1))
+                if ocr_max_workers > 1:
+                    # -- the pool needs all pages up front, otherwise they are read one at a time --
+                    page_images = list(page_images)
+                    page_ocr_layouts = _iter_pooled_page_ocr_layouts(
+                        page_images, ocr_max_workers, ocr_agent, ocr_languages
+                    )
+                table_crops = _new_document_table_crops(infer_table_structure)
+                for i, (image, ocr_layout) in enumerate(zip(page_images, page_ocr_layouts)):
                     extracted_regions = extracted_layout[i] if i < len(extracted_layout) else None
                     merged_page_layout = supplement_page_layout_with_ocr(
                         page_layout=out_layout.pages[i],
@@ -167,20 +202,31 @@ def process_file_with_ocr(
                         extracted_regions=extracted_regions,
                         ocr_layout_dumper=ocr_layout_dumper,
                         table_ocr_agent=table_ocr_agent,
+                        ocr_layout=ocr_layout,
+                        table_crops=table_crops,
                     )
                     merged_page_layouts.append(merged_page_layout)
+                if table_crops:
+                    supplement_table_crops_with_batched_table_extraction(table_crops)
                 return DocumentLayout.from_pages(merged_page_layouts)
         else:
             with tempfile.TemporaryDirectory() as temp_dir:
                 _image_paths = pdf2image.convert_from_path(
                     filename,
                     dpi=pdf_image_dpi,
-                    output_folder=temp_dir,
+                    output_folder=page_images_dir or temp_dir,
                     paths_only=True,
                     userpw=password or "",
                 )
                 image_paths = cast(List[str], _image_paths)
-                for i, image_path in enumerate(image_paths):
+                page_ocr_layouts = itertools.repeat(None)
+                ocr_max_workers = _ocr_max_workers(ocr_mode, len(image_paths))
+                if ocr_max_workers > 1:
+                    page_ocr_layouts = _iter_pooled_page_ocr_layouts(
+                        image_paths, ocr_max_workers, ocr_agent, ocr_languages
+                    )
+                table_crops = _new_document_table_crops(infer_table_structure)
+                for i, (image_path, ocr_layout) in enumerate(zip(image_paths, page_ocr_layouts)):
                     extracted_regions = extracted_layout[i] if i < len(extracted_layout) else None
                     with PILImage.open(image_path) as image:
                         merged_page_layout = supplement_page_layout_with_ocr(
@@ -193,8 +239,12 @@ def process_file_with_ocr(
                             extracted_regions=extracted_regions,
                             ocr_layout_dumper=ocr_layout_dumper,
                             table_ocr_agent=table_ocr_agent,
+                            ocr_layout=ocr_layout,
+                            table_crops=table_crops,
                         )
                         merged_page_layouts.append(merged_page_layout)
+                if table_crops:
+                    supplement_table_crops_with_batched_table_extraction(table_crops)
                 return DocumentLayout.from_pages(merged_page_layouts)
     except Exception as e:
         if os.path.isdir(filename) or os.path.isfile(filename):
@@ -203,6 +253,53 @@ def process_file_with_ocr(
             raise FileNotFoundError(f'File "{filename}" not found!') from e
 
 
+def _get_ocr_language(ocr_agent: str, ocr_languages: str) -> str:
+    """The language argument `ocr_agent` expects for Tesseract-style `ocr_languages`."""
+    if ocr_agent == OCR_AGENT_PADDLE:
+        return tesseract_to_paddle_language(ocr_languages)
+    return ocr_languages
+
+
+def _ocr_max_workers(ocr_mode: str, page_count: int) -> int:
+    """Number of OCR worker processes to OCR the `page_count` pages of a document on.
+
+    1 means the pages are OCRed in this process, which is the case unless `OCR_MAX_WORKERS` is
+    greater than 1, the OCR is whole-page and the document has more than one page.
+    """
+    if ocr_mode != OCRMode.FULL_PAGE.value or page_count < 2:
+        return 1
+    # -- not capped by `page_count`, so documents of any length share the same pool --
+    return env_config.snapshot().OCR_MAX_WORKERS
+
+
+def _new_document_table_crops(infer_table_structure: bool) -> Optional[list[TableCrop]]:
+    """Empty list to collect the tables of every page of a document in, when they are batched.
+
+    None, meaning the tables of each page are processed with that page, unless table structure is
+    inferred and `TABLE_STRUCTURE_BATCH_SIZE` is greater than 1.
+    """
+    if infer_table_structure and env_config.snapshot().TABLE_STRUCTURE_BATCH_SIZE > 1:
+        return []
+    return None
+
+
+def _iter_pooled_page_ocr_layouts(
+    page_images: Sequence[PILImage.Image | str],
+    ocr_max_workers: int,
+    ocr_agent: str,
+    ocr_languages: str,
+) -> Iterator[TextRegions]:
+    """Generate the whole-page OCR layout of each page, in page order, OCRed on a worker pool.
+
+    A page is given as its image or, cheaper to send to a worker, the path of its image file.
+    """
+    from unstructured.partition.pdf_image.ocr_pool import iter_page_layouts_on_pool
+
+    return iter_page_layouts_on_pool(
+        ocr_max_workers, page_images, ocr_agent, _get_ocr_language(ocr_agent, ocr_languages)
+    )
+
+
 @requires_dependencies("unstructured_inference")
 def supplement_page_layout_with_ocr(
     page_layout: "PageLayout",
@@ -214,21 +311,26 @@ def supplement_page_layout_with_ocr(
     extracted_regions: Optional[TextRegions] = None,
     ocr_layout_dumper: Optional[OCRLayoutDumper] = None,
     table_ocr_agent: str = OCR_AGENT_TESSERACT,
+    ocr_layout: Optional[TextRegions] = None,
+    table_crops: Optional[list[TableCrop]] = None,
 ) -> "PageLayout":
     """
     Supplement an PageLayout with OCR results depending on OCR mode.
     If mode is "entire_page", we get the OCR layout for the entire image and
-    merge it with PageLayout.
+    merge it with PageLayout. When `ocr_layout` is provided, e.g. by an OCR worker pool, it is used
+    as the OCR layout of the entire image instead of OCRing it again.
     If mode is "individual_blocks", we find the elements from PageLayout
     with no text and add text from OCR to each element.
+    When `table_crops` is provided, the tables of the page are added to it for their structure to
+    be recognized later, together with those of other pages, instead of being processed here.
     """
 
-    language = ocr_languages
-    if ocr_agent == OCR_AGENT_PADDLE:
-        language = tesseract_to_paddle_language(ocr_languages)
-    _ocr_agent = OCRAgent.get_instance(ocr_agent_module=ocr_agent, language=language)
+    _ocr_agent = OCRAgent.get_instance(
+        ocr_agent_module=ocr_agent, language=_get_ocr_language(ocr_agent, ocr_languages)
+    )
     if ocr_mode == OCRMode.FULL_PAGE.value:
-        ocr_layout = _ocr_agent.get_layout_from_image(image)
+        if ocr_layout is None:
+            ocr_layout = _ocr_agent.get_layout_from_image(image)
         if ocr_layout_dumper:
             ocr_layout_dumper.add_ocred_page(ocr_layout.as_list())
         page_layout.elements_array = merge_out_layout_with_ocr_layout(
@@ -236,24 +338,33 @@ def supplement_page_layout_with_ocr(
             ocr_layout=ocr_layout,
         )
     elif ocr_mode == OCRMode.INDIVIDUAL_BLOCKS.value:
+        config = env_config.snapshot()
+        padding = config.IMAGE_CROP_PAD
         # individual block mode still keeps using the list data structure for elements instead of
         # the vectorized page_layout.elements_array data structure
-        for i, text in enumerate(page_layout.elements_array.texts):
-            if text:
-                continue
-            padding = env_config.IMAGE_CROP_PAD
-            cropped_image = image.crop(
+        elements = page_layout.elements_array
+        block_indices = [i for i, text in enumerate(elements.texts) if not text]
+        block_images = (
+            image.crop(
                 (
-                    page_layout.elements_array.x1[i] - padding,
-                    page_layout.elements_array.y1[i] - padding,
-                    page_layout.elements_array.x2[i] + padding,
-                    page_layout.elements_array.y2[i] + padding,
+                    elements.x1[i] - padding,
+                    elements.y1[i] - padding,
+                    elements.x2[i] + padding,
+                    elements.y2[i] + padding,
                 ),
             )
-            # Note(yuming): instead of getting OCR layout, we just need
-            # the text extraced from OCR for individual elements
-            text_from_ocr = _ocr_agent.get_text_from_image(cropped_image)
-            page_layout.elements_array.texts[i] = text_from_ocr
+            for i in block_indices
+        )
+        batch_size = config.OCR_INDIVIDUAL_BLOCKS_BATCH_SIZE
+        # Note(yuming): instead of getting OCR layout, we just need
+        # the text extraced from OCR for individual elements
+        block_texts = (
+            get_texts_from_images_batched(list(block_images), _ocr_agent, batch_size)
+            if batch_size > 1
+            else (_ocr_agent.get_text_from_image(block_image) for block_image in block_images)
+        )
+        for i, text_from_ocr in zip(block_indices, block_texts):
+            elements.texts[i] = text_from_ocr
     else:
         raise ValueError(
             "Invalid OCR mode. Parameter `ocr_mode` "
@@ -262,29 +373,154 @@ def supplement_page_layout_with_ocr(
 
     # Note(yuming): use the OCR data from entire page OCR for table extraction
     if infer_table_structure:
-        language = ocr_languages
-        if table_ocr_agent == OCR_AGENT_PADDLE:
-            language = tesseract_to_paddle_language(ocr_languages)
         _table_ocr_agent = OCRAgent.get_instance(
-            ocr_agent_module=table_ocr_agent, language=language
-        )
-        from unstructured_inference.models import tables
-
-        tables.load_agent()
-        if tables.tables_agent is None:
-            raise RuntimeError("Unable to load table extraction agent.")
-
-        page_layout.elements_array = supplement_element_with_table_extraction(
-            elements=page_layout.elements_array,
-            image=image,
-            tables_agent=tables.tables_agent,
-            ocr_agent=_table_ocr_agent,
-            extracted_regions=extracted_regions,
+            ocr_agent_module=table_ocr_agent,
+            language=_get_ocr_language(table_ocr_agent, ocr_languages),
         )
+        page_tokens = _get_table_page_tokens(ocr_layout)
+        if table_crops is not None:
+            table_crops.extend(
+                get_table_crops(
+                    elements=page_layout.elements_array,
+                    image=image,
+                    ocr_agent=_table_ocr_agent,
+                    page_tokens=page_tokens,
+                )
+            )
+        else:
+            page_layout.elements_array = supplement_element_with_table_extraction(
+                elements=page_layout.elements_array,
+                image=image,
+                tables_agent=_load_tables_agent(),
+                ocr_agent=_table_ocr_agent,
+                extracted_regions=extracted_regions,
+                page_tokens=page_tokens,
+            )
 
     return page_layout
 
 
+def get_texts_from_images_batched(
+    images: Sequence[PILImage.Image], ocr_agent: OCRAgent, batch_size: int
+) -> list[str]:
+    """OCR text of each of `images`, OCRing up to `batch_size` of them at a time.
+
+    The images of a batch are stacked, separated by blank space, into one composite image that is
+    OCRed once. Each word found is assigned to the image whose band of the composite contains the
+    center of the word, so no text leaks between images, and the words of each image are joined
+    into lines in reading order.
+    """
+    texts: list[str] = []
+    for batch in _iter_composite_batches(images, batch_size):
+        composite, band_tops = _compose_images_vertically(batch)
+        ocr_layout = ocr_agent.get_layout_from_image(composite)
+        texts.extend(_split_ocr_layout_text_by_band(ocr_layout, band_tops, len(batch)))
+    return texts
+
+
+# -- blank space, in pixels, around each image stacked into a composite image for OCR --
+_COMPOSITE_MARGIN = 32
+
+
+def _iter_composite_batches(
+    images: Sequence[PILImage.Image], batch_size: int
+) -> Iterator[Sequence[PILImage.Image]]:
+    """Split `images` into consecutive batches that each fit in one composite image for OCR.
+
+    A batch has at most `batch_size` images and, unless it holds a single image, fits within the
+    image size Tesseract accepts.
+    """
+    max_pixels = TESSERACT_MAX_SIZE // IMAGE_COLOR_DEPTH
+    start = 0
+    while start < len(images):
+        end = start + 1
+        width, height = images[start].width, images[start].height
+        while end < min(start + batch_size, len(images)):
+            next_width = max(width, images[end].width)
+            next_height = height + _COMPOSITE_MARGIN + images[end].height
+            if (next_width + 2 * _COMPOSITE_MARGIN) * (
+                next_height + 2 * _COMPOSITE_MARGIN
+            ) > max_pixels:
+                break
+            width, height = next_width, next_height
+            end += 1
+        yield images[start:end]
+        start = end
+
+
+def _compose_images_vertically(
+    images: Sequence[PILImage.Image],
+) -> tuple[PILImage.Image, npt.NDArray[np.float64]]:
+    """Stack `images` top to bottom on a white composite image, separated by blank margins.
+
+    Returns the composite and the y-coordinate of the top of each image's band within it. The band
+    of an image extends from its top to the top of the next band.
+    """
+    width = max(image.width for image in images) + 2 * _COMPOSITE_MARGIN
+    height = sum(image.height for image in images) + (len(images) + 1) * _COMPOSITE_MARGIN
+    composite = PILImage.new("RGB", (width, height), "white")
+
+    band_tops = np.empty(len(images), dtype=np.float64)
+    top = _COMPOSITE_MARGIN
+    for i, image in enumerate(images):
+        composite.paste(image.convert("RGB"), (_COMPOSITE_MARGIN, top))
+        # -- the band starts halfway into the margin above the image --
+        band_tops[i] = top - _COMPOSITE_MARGIN / 2
+        top += image.height + _COMPOSITE_MARGIN
+    return composite, band_tops
+
+
+def _split_ocr_layout_text_by_band(
+    ocr_layout: TextRegions, band_tops: npt.NDArray[np.float64], band_count: int
+) -> list[str]:
+    """Text of the words of `ocr_layout` falling in each band, one line per line of words."""
+    coords = ocr_layout.element_coords
+    if len(coords) == 0:
+        return [""] * band_count
+
+    y_centers = (coords[:, 1] + coords[:, 3]) / 2
+    band_indices = np.searchsorted(band_tops, y_centers, side="right") - 1
+    texts: list[str] = []
+    for band_index in range(band_count):
+        (word_indices,) = np.nonzero(band_indices == band_index)
+        texts.append(_join_words_into_lines(coords[word_indices], ocr_layout.texts[word_indices]))
+    return texts
+
+
+def _join_words_into_lines(coords: npt.NDArray[np.float64], words: npt.NDArray[Any]) -> str:
+    """Join `words` into lines of text, top to bottom and left to right.
+
+    A word is on the same line as the word that started the line when its vertical center lies
+    within that word's vertical extent.
+    """
+    lines: list[list[tuple[float, str]]] = []
+    line_top = line_bottom = 0.0
+    for i in np.argsort((coords[:, 1] + coords[:, 3]) / 2, kind="stable"):
+        x1, y1, _, y2 = coords[i]
+        word = str(words[i]).strip()
+        if not word:
+            continue
+        if not lines or not line_top <= (y1 + y2) / 2 <= line_bottom:
+            lines.append([])
+            line_top, line_bottom = y1, y2
+        lines[-1].append((x1, word))
+    return "\n".join(" ".join(word for _, word in sorted(line)) for line in lines)
+
+
+@dataclass
+class TableCrop:
+    """A table element of a page awaiting structure recognition.
+
+    `index` is the index of the table in `elements`, the layout elements of its page, `image` the
+    table cropped from the page image and `ocr_tokens` the OCR tokens of that crop.
+    """
+
+    elements: LayoutElements
+    index: int
+    image: PILImage.Image
+    ocr_tokens: List[dict[str, Any]]
+
+
 @requires_dependencies("unstructured_inference")
 def supplement_element_with_table_extraction(
     elements: LayoutElements,
@@ -292,50 +528,190 @@ def supplement_element_with_table_extraction(
     tables_agent: "UnstructuredTableTransformerModel",
     ocr_agent,
     extracted_regions: Optional[TextRegions] = None,
+    page_tokens: Optional[TextRegions] = None,
 ) -> List["LayoutElement"]:
     """Supplement the existing layout with table extraction. Any Table elements
     that are extracted will have a metadata fields "text_as_html" where
     the table's text content is rendered into a html string and "table_as_cells"
-    with the raw table cells output from table agent if env_config.EXTRACT_TABLE_AS_CELLS is True
+    with the raw table cells output from table agent if env_config.EXTRACT_TABLE_AS_CELLS is True.
+    When `page_tokens` is provided, the OCR tokens of each table are taken from those text regions
+    of the page instead of OCRing the table.
     """
-    from unstructured_inference.models.tables import cells_to_html
+    extract_table_as_cells = env_config.snapshot().EXTRACT_TABLE_AS_CELLS
+    table_crops = get_table_crops(
+        elements=elements, image=image, ocr_agent=ocr_agent, page_tokens=page_tokens
+    )
+    for table_crop in table_crops:
+        tatr_cells = tables_agent.predict(
+            table_crop.image, ocr_tokens=table_crop.ocr_tokens, result_format="cells"
+        )
+        _set_table_structure(table_crop, tatr_cells, extract_table_as_cells)
+
+    return elements
+
+
+def get_table_crops(
+    elements: LayoutElements,
+    image: PILImage.Image,
+    ocr_agent: OCRAgent,
+    page_tokens: Optional[TextRegions] = None,
+) -> List[TableCrop]:
+    """Crop each Table element of `elements` from `image` and get the OCR tokens of the crop.
 
+    The tokens are clipped from `page_tokens`, text regions of the whole page, when provided and
+    otherwise found by OCRing the crop with `ocr_agent`.
+    """
     table_id = {v: k for k, v in elements.element_class_id_map.items()}.get(ElementType.TABLE)
     if table_id is None:
         # no table found in this page
-        return elements
+        return []
 
     table_ele_indices = np.where(elements.element_class_ids == table_id)[0]
-    table_elements = elements.slice(table_ele_indices)
-    padding = env_config.TABLE_IMAGE_CROP_PAD
-    for i, element_coords in enumerate(table_elements.element_coords):
-        cropped_image = image.crop(
-            (
-                element_coords[0] - padding,
-                element_coords[1] - padding,
-                element_coords[2] + padding,
-                element_coords[3] + padding,
-            ),
+    padding = env_config.snapshot().TABLE_IMAGE_CROP_PAD
+    table_crops: List[TableCrop] = []
+    for table_ele_index, element_coords in zip(
+        table_ele_indices, elements.element_coords[table_ele_indices]
+    ):
+        crop_box = (
+            element_coords[0] - padding,
+            element_coords[1] - padding,
+            element_coords[2] + padding,
+            element_coords[3] + padding,
         )
-        table_tokens = get_table_tokens(
-            table_element_image=cropped_image,
-            ocr_agent=ocr_agent,
+        cropped_image = image.crop(crop_box)
+        table_tokens = (
+            get_table_tokens(
+                table_element_image=cropped_image,
+                ocr_agent=ocr_agent,
+            )
+            if page_tokens is None
+            else get_table_tokens_from_regions(page_tokens, crop_box)
         )
-        tatr_cells = tables_agent.predict(
-            cropped_image, ocr_tokens=table_tokens, result_format="cells"
+        table_crops.append(
+            TableCrop(
+                elements=elements,
+                index=int(table_ele_index),
+                image=cropped_image,
+                ocr_tokens=table_tokens,
+            )
         )
+    return table_crops
 
-        # NOTE(christine): `tatr_cells == ""` means that the table was not recognized
-        text_as_html = "" if tatr_cells == "" else cells_to_html(tatr_cells)
-        elements.text_as_html[table_ele_indices[i]] = text_as_html
 
-        if env_config.EXTRACT_TABLE_AS_CELLS:
-            simple_table_cells = [
-                SimpleTableCell.from_table_transformer_cell(cell).to_dict() for cell in tatr_cells
-            ]
-            elements.table_as_cells[table_ele_indices[i]] = simple_table_cells
+@requires_dependencies(["torch", "unstructured_inference"])
+def supplement_table_crops_with_batched_table_extraction(
+    table_crops: Sequence[TableCrop], batch_size: Optional[int] = None
+) -> None:
+    """Recognize the structure of the tables of `table_crops` in batches, setting the results on
+    their elements like `supplement_element_with_table_extraction()` does.
 
-    return elements
+    The tables, which may come from any number of pages, are batched in order of size, so tables
+    of the same size, whose model inputs can be stacked, tend to share a batch. Batches have up to
+    `batch_size` tables, `TABLE_STRUCTURE_BATCH_SIZE` when not given.
+    """
+    config = env_config.snapshot()
+    batch_size = batch_size or config.TABLE_STRUCTURE_BATCH_SIZE
+    tables_agent = _load_tables_agent()
+    table_crops = sorted(table_crops, key=lambda c: (c.image.height, c.image.width))
+    for start in range(0, len(table_crops), batch_size):
+        batch = table_crops[start : start + batch_size]
+        for table_crop, tatr_cells in zip(batch, _predict_table_cells_batch(tables_agent, batch)):
+            _set_table_structure(table_crop, tatr_cells, config.EXTRACT_TABLE_AS_CELLS)
+
+
+def _predict_table_cells_batch(
+    tables_agent: "UnstructuredTableTransformerModel", table_crops: Sequence[TableCrop]
+) -> list[list[dict[str, Any]] | str]:
+    """Cells of each table of `table_crops`, from one pass of the structure model over each group
+    of them whose model inputs have the same shape.
+
+    Gives what `tables_agent.predict(image, ocr_tokens, result_format="cells")` gives for each
+    table: each model input is prepared the way `predict()` prepares it and only inputs of the same
+    shape are stacked, so none is padded to the size of another.
+    """
+    import torch
+    from unstructured_inference.config import inference_config
+    from unstructured_inference.models.tables import recognize
+    from unstructured_inference.utils import pad_image_with_background_color
+
+    pad = inference_config.TABLE_IMAGE_BACKGROUND_PAD
+    outputs_structures: dict[int, dict[str, Any]] = {}
+    with torch.no_grad():
+        encodings = [
+            tables_agent.feature_extractor(
+                pad_image_with_background_color(c.image, pad), return_tensors="pt"
+            )
+            for c in table_crops
+        ]
+        indices_by_shape: dict[tuple[int, ...], list[int]] = {}
+        for i, encoding in enumerate(encodings):
+            indices_by_shape.setdefault(tuple(encoding["pixel_values"].shape), []).append(i)
+
+        for indices in indices_by_shape.values():
+            batch_encoding = {
+                key: torch.cat([encodings[i][key] for i in indices]).to(tables_agent.device)
+                for key in encodings[indices[0]]
+            }
+            outputs = tables_agent.model(**batch_encoding)
+            for j, i in enumerate(indices):
+                outputs_structures[i] = {
+                    "logits": outputs["logits"][j : j + 1],
+                    "pred_boxes": outputs["pred_boxes"][j : j + 1],
+                    "pad_for_structure_detection": pad,
+                }
+
+    tables_cells: list[list[dict[str, Any]] | str] = []
+    for i, table_crop in enumerate(table_crops):
+        recognized_table = recognize(
+            outputs_structures[i], table_crop.image, tokens=table_crop.ocr_tokens
+        )
+        # -- an empty string marks a table that was not recognized, as from `predict()` --
+        tables_cells.append(recognized_table[0] if len(recognized_table) > 0 else "")
+    return tables_cells
+
+
+def _set_table_structure(
+    table_crop: TableCrop,
+    tatr_cells: list[dict[str, Any]] | str,
+    extract_table_as_cells: bool,
+) -> None:
+    """Set the HTML and, when `extract_table_as_cells`, the cells of the table of `table_crop`."""
+    from unstructured_inference.models.tables import cells_to_html
+
+    elements, index = table_crop.elements, table_crop.index
+    # NOTE(christine): `tatr_cells == ""` means that the table was not recognized
+    text_as_html = "" if tatr_cells == "" else cells_to_html(tatr_cells)
+    elements.text_as_html[index] = text_as_html
+
+    if extract_table_as_cells:
+        simple_table_cells = [
+            SimpleTableCell.from_table_transformer_cell(cell).to_dict() for cell in tatr_cells
+        ]
+        elements.table_as_cells[index] = simple_table_cells
+
+
+def _get_table_page_tokens(ocr_layout: Optional[TextRegions]) -> Optional[TextRegions]:
+    """Text regions of a page to build the OCR tokens of its tables from, if any.
+
+    The whole-page `ocr_layout` when `TABLE_OCR_TOKENS_FROM_PAGE` is set and it has regions. The
+    text extracted from the PDF is not used, its regions being whole lines rather than the words
+    the structure model expects as tokens.
+    """
+    if not env_config.snapshot().TABLE_OCR_TOKENS_FROM_PAGE:
+        return None
+    if ocr_layout is None or len(ocr_layout) == 0:
+        return None
+    return ocr_layout
+
+
+def _load_tables_agent() -> "UnstructuredTableTransformerModel":
+    """The table structure model, loaded on first use."""
+    from unstructured_inference.models import tables
+
+    tables.load_agent()
+    if tables.tables_agent is None:
+        raise RuntimeError("Unable to load table extraction agent.")
+    return tables.tables_agent
 
 
 def get_table_tokens(
@@ -367,6 +743,40 @@ def get_table_tokens(
     return table_tokens
 
 
+def get_table_tokens_from_regions(
+    regions: TextRegions, crop_box: tuple[float, float, float, float]
+) -> List[dict[str, Any]]:
+    """Get the table tokens of the table image cropped to `crop_box` from page text `regions`.
+
+    Regions with text whose center lies within `crop_box` are clipped to it and shifted to the
+    coordinates of the cropped image, in the same form and order `get_table_tokens()` gives. Their
+    text is stripped of surrounding whitespace and whitespace-only regions are skipped.
+    """
+    x1, y1, x2, y2 = crop_box
+    coords = regions.element_coords
+    x_centers = (coords[:, 0] + coords[:, 2]) / 2
+    y_centers = (coords[:, 1] + coords[:, 3]) / 2
+    in_crop = (x_centers >= x1) & (x_centers <= x2) & (y_centers >= y1) & (y_centers <= y2)
+    texts = [text.strip() if text else "" for text in regions.texts]
+    has_text = np.array([bool(text) for text in texts], dtype=bool)
+    (region_indices,) = np.nonzero(in_crop & has_text)
+
+    origin = np.array([x1, y1, x1, y1])
+    clipped_coords = np.clip(coords[region_indices], origin, [x2, y2, x2, y2]) - origin
+    return [
+        {
+            "bbox": region_coords.tolist(),
+            "text": texts[region_index],
+            "span_num": span_num,
+            "line_num": 0,
+            "block_num": 0,
+        }
+        for span_num, (region_index, region_coords) in enumerate(
+            zip(region_indices, clipped_coords)
+        )
+    ]
+
+
 def merge_out_layout_with_ocr_layout(
     out_layout: LayoutElements,
     ocr_layout: TextRegions,
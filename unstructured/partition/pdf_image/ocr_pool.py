@@ -0,0 +1,141 @@
+"""Pool of long-lived worker processes that OCR whole page images concurrently.
+
+Tesseract is effectively single-threaded (`OMP_THREAD_LIMIT=1`), so OCR of a scanned document
+otherwise uses one core no matter how many pages it has. An `OCRWorkerPool` OCRs the pages of a
+document on several worker processes and hands back their OCR layouts in page order, so the
+partitioning process can merge the layout of one page while the workers are still OCRing the next
+ones.
+
+Workers live as long as their pool and the pool is shared by all partitioning calls of the
+process, so an OCR agent is loaded (models, language data) once per worker rather than once per
+page or document.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import multiprocessing
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Iterator, Sequence, Union
+
+from unstructured.partition.utils.config import ENVConfigSnapshot, env_config
+
+if TYPE_CHECKING:
+    from PIL import Image as PILImage
+    from unstructured_inference.inference.elements import TextRegions
+
+# -- a page is sent to a worker as the path of its image file when it has one, which is much cheaper
+# -- than pickling the decoded image.
+PageImage = Union["PILImage.Image", str]
+
+
+class OCRWorkerPool:
+    """Worker processes that each OCR one page image at a time.
+
+    Each worker keeps the OCR agents it loads (`OCRAgent.get_instance()` is cached per process) for
+    its lifetime. The environment settings in effect where `iter_page_layouts()` is called,
+    including settings pinned with `env_config.pinned()`, are used by the workers for those pages.
+    """
+
+    def __init__(self, max_workers: int):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self._max_workers = max_workers
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            # -- "spawn" so a worker does not inherit the threads and model state of a partitioning
+            # -- process forked mid-use.
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def iter_page_layouts(
+        self, page_images: Sequence[PageImage], ocr_agent_module: str, language: str
+    ) -> Iterator[TextRegions]:
+        """Generate the OCR layout of each of `page_images`, in page order.
+
+        All pages are submitted up front. Pages not yet started are cancelled when the generator is
+        closed before it is exhausted.
+        """
+        config = env_config.snapshot()
+        futures = [
+            self._executor.submit(_get_page_layout, page_image, ocr_agent_module, language, config)
+            for page_image in page_images
+        ]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, cancelling pages not yet started."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pools: dict[int, OCRWorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_ocr_worker_pool(max_workers: int) -> OCRWorkerPool:
+    """The pool of `max_workers` OCR workers shared by all callers in this process.
+
+    The pool is started on first use. Its workers are stopped when the process exits.
+    """
+    with _pools_lock:
+        if (pool := _pools.get(max_workers)) is None:
+            pool = _pools[max_workers] = OCRWorkerPool(max_workers)
+        return pool
+
+
+def iter_page_layouts_on_pool(
+    max_workers: int, page_images: Sequence[PageImage], ocr_agent_module: str, language: str
+) -> Iterator[TextRegions]:
+    """Generate the OCR layout of each of `page_images` in page order, OCRed on the shared pool.
+
+    A pool whose worker process died is discarded, so the next call starts a new one, before the
+    error is raised.
+    """
+    pool = get_ocr_worker_pool(max_workers)
+    try:
+        yield from pool.iter_page_layouts(page_images, ocr_agent_module, language)
+    except BrokenProcessPool:
+        with _pools_lock:
+            if _pools.get(max_workers) is pool:
+                del _pools[max_workers]
+        pool.shutdown()
+        raise
+
+
+def shutdown_ocr_worker_pools() -> None:
+    """Stop the worker processes of all shared pools, e.g. to release their memory.
+
+    A later call that uses a pool starts a new one.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+def _get_page_layout(
+    page_image: PageImage, ocr_agent_module: str, language: str, config: ENVConfigSnapshot
+) -> TextRegions:
+    """OCR layout of `page_image`, run in a worker process with the caller's settings."""
+    from PIL import Image as PILImage
+
+    from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+
+    with env_config.pinned(**dataclasses.asdict(config)):
+        ocr_agent = OCRAgent.get_instance(ocr_agent_module=ocr_agent_module, language=language)
+        if isinstance(page_image, str):
+            with PILImage.open(page_image) as image:
+                return ocr_agent.get_layout_from_image(image)
+        return ocr_agent.get_layout_from_image(page_image)
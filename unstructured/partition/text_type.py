@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import os
 import re
 from typing import Final, List, Optional
 
 from unstructured.cleaners.core import remove_punctuation
 from unstructured.logger import trace_logger
-from unstructured.nlp.english_words import ENGLISH_WORDS
+from unstructured.nlp.english_words import get_english_words
 from unstructured.nlp.patterns import (
     EMAIL_ADDRESS_PATTERN_RE,
     ENDS_IN_PUNCT_RE,
@@ -18,6 +17,7 @@ from unstructured.nlp.patterns import (
     US_PHONE_NUMBERS_RE,
 )
 from unstructured.nlp.tokenize import pos_tag, sent_tokenize, word_tokenize
+from unstructured.partition.utils.config import env_config
 
 POS_VERB_TAGS: Final[List[str]] = ["VB", "VBG", "VBD", "VBN", "VBP", "VBZ"]
 ENGLISH_WORD_SPLIT_RE = re.compile(r"[\s\-,.!?_\/]+")
@@ -51,9 +51,9 @@ def is_possible_narrative_text(
         If True, conducts checks that are specific to the chosen language. Turn on for more
         accurate partitioning and off for faster processing.
     """
-    _language_checks = os.environ.get("UNSTRUCTURED_LANGUAGE_CHECKS")
-    if _language_checks is not None:
-        language_checks = _language_checks.lower() == "true"
+    config = env_config.snapshot()
+    if config.UNSTRUCTURED_LANGUAGE_CHECKS is not None:
+        language_checks = config.UNSTRUCTURED_LANGUAGE_CHECKS
 
     if len(text) == 0:
         trace_logger.detail("Not narrative. Text is empty.")  # type: ignore
@@ -66,18 +66,14 @@ def is_possible_narrative_text(
     if "eng" in languages and language_checks and not contains_english_word(text):
         return False
 
-    # NOTE(robinson): it gets read in from the environment as a string so we need to
-    # cast it to a float
-    cap_threshold = float(
-        os.environ.get("UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD", cap_threshold),
-    )
+    if config.UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD is not None:
+        cap_threshold = config.UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD
     if exceeds_cap_ratio(text, threshold=cap_threshold):
         trace_logger.detail(f"Not narrative. Text exceeds cap ratio {cap_threshold}:\n\n{text}")  # type: ignore # noqa: E501
         return False
 
-    non_alpha_threshold = float(
-        os.environ.get("UNSTRUCTURED_NARRATIVE_TEXT_NON_ALPHA_THRESHOLD", non_alpha_threshold),
-    )
+    if config.UNSTRUCTURED_NARRATIVE_TEXT_NON_ALPHA_THRESHOLD is not None:
+        non_alpha_threshold = config.UNSTRUCTURED_NARRATIVE_TEXT_NON_ALPHA_THRESHOLD
     if under_non_alpha_ratio(text, threshold=non_alpha_threshold):
         return False
 
@@ -114,9 +110,9 @@ def is_possible_title(
         If True, conducts checks that are specific to the chosen language. Turn on for more
         accurate partitioning and off for faster processing.
     """
-    _language_checks = os.environ.get("UNSTRUCTURED_LANGUAGE_CHECKS")
-    if _language_checks is not None:
-        language_checks = _language_checks.lower() == "true"
+    config = env_config.snapshot()
+    if config.UNSTRUCTURED_LANGUAGE_CHECKS is not None:
+        language_checks = config.UNSTRUCTURED_LANGUAGE_CHECKS
 
     if len(text) == 0:
         trace_logger.detail("Not a title. Text is empty.")  # type: ignore
@@ -125,17 +121,15 @@ def is_possible_title(
     if text.isupper() and ENDS_IN_PUNCT_RE.search(text) is not None:
         return False
 
-    title_max_word_length = int(
-        os.environ.get("UNSTRUCTURED_TITLE_MAX_WORD_LENGTH", title_max_word_length),
-    )
+    if config.UNSTRUCTURED_TITLE_MAX_WORD_LENGTH is not None:
+        title_max_word_length = config.UNSTRUCTURED_TITLE_MAX_WORD_LENGTH
     # NOTE(robinson) - splitting on spaces here instead of word tokenizing because it
     # is less expensive and actual tokenization doesn't add much value for the length check
     if len(text.split(" ")) > title_max_word_length:
         return False
 
-    non_alpha_threshold = float(
-        os.environ.get("UNSTRUCTURED_TITLE_NON_ALPHA_THRESHOLD", non_alpha_threshold),
-    )
+    if config.UNSTRUCTURED_TITLE_NON_ALPHA_THRESHOLD is not None:
+        non_alpha_threshold = config.UNSTRUCTURED_TITLE_NON_ALPHA_THRESHOLD
     if under_non_alpha_ratio(text, threshold=non_alpha_threshold):
         return False
 
@@ -191,6 +185,7 @@ def contains_english_word(text: str) -> bool:
     """Checks to see if the text contains an English word."""
     text = text.lower()
     words = ENGLISH_WORD_SPLIT_RE.split(text)
+    english_words = get_english_words()
     for word in words:
         # NOTE(Crag): Remove any non-lowercase alphabetical
         # characters.  These removed chars will usually be trailing or
@@ -200,7 +195,7 @@ def contains_english_word(text: str) -> bool:
         # and of course:
         #   "'beggars'"-> "beggars" (also still an english word)
         word = NON_LOWERCASE_ALPHA_RE.sub("", word)
-        if len(word) > 1 and word in ENGLISH_WORDS:
+        if len(word) > 1 and word in english_words:
             return True
     return False
 
@@ -24,6 +24,7 @@ def partition_tsv(
     *,
     file: Optional[IO[bytes]] = None,
     include_header: bool = False,
+    rows_per_table: Optional[int] = None,
     **kwargs: Any,
 ) -> list[Element]:
     """Partitions TSV files into document elements.
@@ -36,29 +37,53 @@ def partition_tsv(
         A file-like object using "rb" mode --> open(filename, "rb").
     include_header
         Determines whether or not header info info is included in text and medatada.text_as_html.
+    rows_per_table
+        When specified, the file is read `rows_per_table` data rows at a time and each such window
+        becomes its own `Table` element, with the header row (when `include_header` is True)
+        repeated in each and its (0-based, end-exclusive) data-row range recorded in
+        `metadata.table_row_start` and `metadata.table_row_end`. By default the whole file becomes
+        a single `Table` element.
     """
     exactly_one(filename=filename, file=file)
+    if rows_per_table is not None and rows_per_table < 1:
+        raise ValueError(f"rows_per_table must be a positive integer, got {rows_per_table}")
 
     header = 0 if include_header else None
+    last_modified = get_last_modified_date(filename) if filename else None
+
+    def table_from_dataframe(
+        dataframe: pd.DataFrame, row_start: Optional[int] = None, row_end: Optional[int] = None
+    ) -> Table:
+        html_table = HtmlTable.from_html_text(
+            dataframe.to_html(index=False, header=include_header, na_rep="")
+        )
+        metadata = ElementMetadata(
+            filename=filename,
+            last_modified=last_modified,
+            table_row_end=row_end,
+            table_row_start=row_start,
+            text_as_html=html_table.html,
+        )
+        metadata.detection_origin = DETECTION_ORIGIN
+        return Table(text=html_table.text, metadata=metadata)
 
     if filename:
-        dataframe = pd.read_csv(filename, sep="\t", header=header)
+        source: str | IO[bytes] = filename
     else:
         assert file is not None
         # -- Note(scanny): `SpooledTemporaryFile` on Python<3.11 does not implement `.readable()`
         # -- which triggers an exception on `pd.DataFrame.read_csv()` call.
-        f = spooled_to_bytes_io_if_needed(file)
-        dataframe = pd.read_csv(f, sep="\t", header=header)
+        source = spooled_to_bytes_io_if_needed(file)
 
-    html_table = HtmlTable.from_html_text(
-        dataframe.to_html(index=False, header=include_header, na_rep="")
-    )
+    if rows_per_table is None:
+        return [table_from_dataframe(pd.read_csv(source, sep="\t", header=header))]
 
-    metadata = ElementMetadata(
-        filename=filename,
-        last_modified=get_last_modified_date(filename) if filename else None,
-        text_as_html=html_table.html,
-    )
-    metadata.detection_origin = DETECTION_ORIGIN
+    elements: list[Element] = []
+    row_start = 0
+    with pd.read_csv(source, sep="\t", header=header, chunksize=rows_per_table) as reader:
+        for dataframe in reader:
+            row_end = row_start + len(dataframe)
+            elements.append(table_from_dataframe(dataframe, row_start, row_end))
+            row_start = row_end
 
-    return [Table(text=html_table.text, metadata=metadata)]
+    return elements
@@ -0,0 +1,171 @@
+"""Opt-in on-disk cache of partitioning results.
+
+A `PartitionCache` maps a key derived from everything that determines the output of `partition()`
+(the document bytes, its detected file-type, the normalized partitioning arguments, the
+environment settings and the library version) to the serialized elements produced for it, so
+partitioning the same bytes the same way again costs a hash and a read.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import IO, Any, Iterator, Optional
+
+from unstructured.__version__ import __version__
+from unstructured.documents.elements import Element
+from unstructured.logger import logger
+
+_CACHE_FILE_EXTENSION = ".json.gz"
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+class PartitionCache:
+    """Size-bounded directory of partitioning results, evicting least-recently-used entries.
+
+    Each entry is one gzipped JSON file of element-dicts named by its key. Entries are written
+    atomically, so several processes can share a cache directory; an entry that can't be read is
+    treated as a miss.
+
+    Parameters
+    ----------
+    cache_dir
+        The directory holding the entries, created when it does not exist.
+    max_size_bytes
+        The total size of the entries is brought back under this many bytes, by deleting the
+        least-recently-used ones, after each new entry is written.
+    """
+
+    def __init__(self, cache_dir: str, max_size_bytes: int = 1024 * 1024 * 1024):
+        if max_size_bytes < 1:
+            raise ValueError("max_size_bytes must be at least 1.")
+        self._cache_dir = cache_dir
+        self._max_size_bytes = max_size_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @staticmethod
+    def make_key(content_hash: str, file_type_name: str, partition_args: dict[str, Any]) -> str:
+        """The cache key for partitioning content having `content_hash` with `partition_args`.
+
+        `partition_args` must hold every argument value that affects the elements produced. A
+        value that is not JSON-serializable is keyed by its `.to_dict()`, its dataclass fields or
+        otherwise its `repr()`; a `repr()` containing an object address just makes for a miss.
+        """
+        from unstructured.partition.utils.config import env_config
+
+        key_data = {
+            "version": __version__,
+            "content_hash": content_hash,
+            "file_type": file_type_name,
+            "partition_args": partition_args,
+            "env_config": dataclasses.asdict(env_config.snapshot()),
+        }
+        key_json = json.dumps(key_data, sort_keys=True, default=_key_default)
+        return hashlib.sha256(key_json.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[list[Element]]:
+        """The elements cached under `key`, or None on a miss."""
+        from unstructured.staging.base import elements_from_dicts
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                element_dicts = json.loads(gzip.decompress(f.read()).decode("utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable partition cache entry {path}: {e}")
+            return None
+
+        # -- mark the entry as recently used for eviction; another process may have evicted it --
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        return elements_from_dicts(element_dicts)
+
+    def put(self, key: str, elements: list[Element]) -> None:
+        """Cache `elements` under `key`, then evict entries to fit the size bound."""
+        from unstructured.staging.base import elements_to_dicts
+
+        payload = gzip.compress(json.dumps(elements_to_dicts(elements)).encode("utf-8"))
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        for entry in self._iter_entries():
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(entry.path)
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until their total size fits `max_size_bytes`."""
+        entries: list[tuple[float, int, str]] = []
+        for entry in self._iter_entries():
+            with contextlib.suppress(FileNotFoundError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self._max_size_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total_size -= size
+
+    def _iter_entries(self) -> Iterator[os.DirEntry[str]]:
+        with os.scandir(self._cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(_CACHE_FILE_EXTENSION):
+                    yield entry
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key + _CACHE_FILE_EXTENSION)
+
+
+def hash_document_content(filename: Optional[str] = None, file: Optional[IO[bytes]] = None) -> str:
+    """SHA-256 hex digest of the bytes of the document at `filename` or in `file`.
+
+    `file` is read from its start and left positioned at its start.
+    """
+    content_hash = hashlib.sha256()
+    if filename is not None:
+        with open(filename, "rb") as f:
+            for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+                content_hash.update(chunk)
+        return content_hash.hexdigest()
+
+    assert file is not None
+    file.seek(0)
+    for chunk in iter(lambda: file.read(_READ_CHUNK_SIZE), b""):
+        content_hash.update(chunk)
+    file.seek(0)
+    return content_hash.hexdigest()
+
+
+def _key_default(value: Any) -> Any:
+    """JSON-serializable stand-in for a partitioning argument value json can't serialize."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(v) for v in value)
+    return repr(value)
@@ -6,12 +6,17 @@ settings that should not be altered without making a code change (e.g., definiti
 in bytes). Constants should go into `./constants.py`
 """
 
+from __future__ import annotations
+
+import contextlib
+import dataclasses
 import os
 import tempfile
+from contextvars import ContextVar
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 
 from unstructured.partition.utils.constants import OCR_AGENT_TESSERACT
 
@@ -22,6 +27,85 @@ def get_tempdir(dir: str) -> str:
     return str(tempdir)
 
 
+@dataclass(frozen=True)
+class ENVConfigSnapshot:
+    """The `ENVConfig` settings resolved once, as plain typed values.
+
+    Reading one of these is an attribute lookup rather than an environment lookup and parse, so hot
+    loops can read them freely. The `GLOBAL_WORKING_*` settings are not included because resolving
+    them has the side effect of setting up the temporary directory.
+    """
+
+    IMAGE_CROP_PAD: int
+    TABLE_IMAGE_CROP_PAD: int
+    TESSERACT_TEXT_HEIGHT_QUANTILE: float
+    TESSERACT_MIN_TEXT_HEIGHT: int
+    TESSERACT_MAX_TEXT_HEIGHT: int
+    TESSERACT_OPTIMUM_TEXT_HEIGHT: int
+    TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD: float
+    GOOGLEVISION_API_ENDPOINT: str
+    OCR_AGENT: str
+    OCR_MAX_WORKERS: int
+    OCR_INDIVIDUAL_BLOCKS_BATCH_SIZE: int
+    TABLE_STRUCTURE_BATCH_SIZE: int
+    TABLE_OCR_TOKENS_FROM_PAGE: bool
+    EXTRACT_IMAGE_BLOCK_CROP_HORIZONTAL_PAD: int
+    EXTRACT_IMAGE_BLOCK_CROP_VERTICAL_PAD: int
+    EXTRACT_TABLE_AS_CELLS: bool
+    OCR_LAYOUT_SUBREGION_THRESHOLD: float
+    EMBEDDED_IMAGE_SAME_REGION_THRESHOLD: float
+    EMBEDDED_TEXT_AGGREGATION_SUBREGION_THRESHOLD: float
+    EMBEDDED_TEXT_SAME_REGION_THRESHOLD: float
+    PDF_ANNOTATION_THRESHOLD: float
+    ANALYSIS_DUMP_OD_SKIP: bool
+    ANALYSIS_BBOX_SKIP: bool
+    ANALYSIS_BBOX_DRAW_GRID: bool
+    ANALYSIS_BBOX_DRAW_CAPTION: bool
+    ANALYSIS_BBOX_RESIZE: Optional[float]
+    ANALYSIS_BBOX_FORMAT: str
+    ANALYSIS_BBOX_MAX_WORKERS: int
+    ANALYSIS_BBOX_TIME_BUDGET: Optional[float]
+    UNSTRUCTURED_LANGUAGE_CHECKS: Optional[bool]
+    UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD: Optional[float]
+    UNSTRUCTURED_NARRATIVE_TEXT_NON_ALPHA_THRESHOLD: Optional[float]
+    UNSTRUCTURED_TITLE_MAX_WORD_LENGTH: Optional[int]
+    UNSTRUCTURED_TITLE_NON_ALPHA_THRESHOLD: Optional[float]
+    UNSTRUCTURED_XY_CUT_BBOX_SHRINK_FACTOR: Optional[float]
+    UNSTRUCTURED_XY_CUT_PRIMARY_DIRECTION: Optional[str]
+
+
+class _EnvironSnapshot(ENVConfigSnapshot):
+    """An `ENVConfigSnapshot` that resolves each setting from the os environment on first read.
+
+    Reading one setting then costs one environment lookup and parse, and a malformed value only
+    raises when that setting is read.
+    """
+
+    def __init__(self, config: ENVConfig):
+        object.__setattr__(self, "_config", config)
+
+    def __getattr__(self, name: str) -> Any:
+        # -- only called for a setting not read yet, since a read one is an instance attribute --
+        if name not in _SNAPSHOT_FIELD_NAMES:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = getattr(self.__dict__["_config"], name)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # -- pickles, e.g. for an OCR worker process, as the settings resolved now --
+        return ENVConfigSnapshot, tuple(getattr(self, name) for name in _SNAPSHOT_FIELD_NAMES)
+
+
+_SNAPSHOT_FIELD_NAMES = tuple(field.name for field in dataclasses.fields(ENVConfigSnapshot))
+
+# -- gives the snapshot pinned by the innermost enclosing `ENVConfig.pinned()` block in this
+# -- context, resolving it on first use so a block that never reads a setting costs nothing.
+_pinned_snapshot: ContextVar[Optional[Callable[[], ENVConfigSnapshot]]] = ContextVar(
+    "_pinned_snapshot", default=None
+)
+
+
 @dataclass
 class ENVConfig:
     """class for configuring enviorment parameters"""
@@ -50,6 +134,10 @@ class ENVConfig:
             return value.lower() in ("true", "1", "t")
         return default_value
 
+    def _get_optional_string(self, var: str) -> Optional[str]:
+        """Value of `var` in the os environment, None when it is not set."""
+        return os.environ.get(var)
+
     def _setup_tmpdir(self, tmpdir: str) -> None:
         Path(tmpdir).mkdir(parents=True, exist_ok=True)
         tempfile.tempdir = tmpdir
@@ -111,6 +199,43 @@ class ENVConfig:
         """OCR Agent to use"""
         return self._get_string("OCR_AGENT", OCR_AGENT_TESSERACT)
 
+    @property
+    def OCR_MAX_WORKERS(self) -> int:
+        """number of worker processes that OCR the pages of a document concurrently
+
+        When greater than 1, whole-page OCR of multi-page documents runs on a shared pool of this
+        many long-lived worker processes instead of in the partitioning process, one page at a time
+        """
+        return self._get_int("OCR_MAX_WORKERS", 1)
+
+    @property
+    def OCR_INDIVIDUAL_BLOCKS_BATCH_SIZE(self) -> int:
+        """maximum number of element crops OCRed together in individual-blocks OCR mode
+
+        When greater than 1, the crops of a page are stacked into composite images of up to this
+        many crops each and each composite is OCRed once, instead of OCRing each crop separately
+        """
+        return self._get_int("OCR_INDIVIDUAL_BLOCKS_BATCH_SIZE", 1)
+
+    @property
+    def TABLE_STRUCTURE_BATCH_SIZE(self) -> int:
+        """maximum number of tables whose structure is recognized in one model call
+
+        When greater than 1, the tables of all pages of a document are collected once every page is
+        OCRed and their structure is recognized in batches of up to this many tables, each batch
+        holding only tables whose model inputs have the same shape, so no input is padded
+        """
+        return self._get_int("TABLE_STRUCTURE_BATCH_SIZE", 1)
+
+    @property
+    def TABLE_OCR_TOKENS_FROM_PAGE(self) -> bool:
+        """whether to build the OCR tokens of a table from the words already OCRed on its page
+
+        When true and the page was OCRed as a whole, the words of its OCR layout are clipped to
+        each table instead of OCRing the table crop again
+        """
+        return self._get_bool("TABLE_OCR_TOKENS_FROM_PAGE", False)
+
     @property
     def EXTRACT_IMAGE_BLOCK_CROP_HORIZONTAL_PAD(self) -> int:
         """extra image block content to add around an identified element(`Image`, `Table`) region
@@ -224,5 +349,106 @@ class ENVConfig:
         """The format for analysed pages with bboxes drawn on them. Default is 'png'."""
         return self._get_string("ANALYSIS_BBOX_FORMAT", "png")
 
+    @property
+    def ANALYSIS_BBOX_MAX_WORKERS(self) -> int:
+        """Number of worker processes drawing analysis bboxes on pages; 1 draws them in-process"""
+        return self._get_int("ANALYSIS_BBOX_MAX_WORKERS", 1)
+
+    @property
+    def ANALYSIS_BBOX_TIME_BUDGET(self) -> Optional[float]:
+        """Seconds after which drawing analysis bboxes stops and the remaining pages are skipped"""
+        time_budget = self._get_float("ANALYSIS_BBOX_TIME_BUDGET", -1.0)
+        if time_budget <= 0:
+            return None
+        return time_budget
+
+    @property
+    def UNSTRUCTURED_LANGUAGE_CHECKS(self) -> Optional[bool]:
+        """Overrides the `language_checks` argument of the text-type checks when set"""
+        value = self._get_optional_string("UNSTRUCTURED_LANGUAGE_CHECKS")
+        return None if value is None else value.lower() == "true"
+
+    @property
+    def UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD(self) -> Optional[float]:
+        """Overrides the `cap_threshold` argument of `is_possible_narrative_text()` when set"""
+        value = self._get_optional_string("UNSTRUCTURED_NARRATIVE_TEXT_CAP_THRESHOLD")
+        return None if value is None else float(value)
+
+    @property
+    def UNSTRUCTURED_NARRATIVE_TEXT_NON_ALPHA_THRESHOLD(self) -> Optional[float]:
+        """Overrides the `non_alpha_threshold` argument of `is_possible_narrative_text()` when
+        set"""
+        value = self._get_optional_string("UNSTRUCTURED_NARRATIVE_TEXT_NON_ALPHA_THRESHOLD")
+        return None if value is None else float(value)
+
+    @property
+    def UNSTRUCTURED_TITLE_MAX_WORD_LENGTH(self) -> Optional[int]:
+        """Overrides the `title_max_word_length` argument of `is_possible_title()` when set"""
+        value = self._get_optional_string("UNSTRUCTURED_TITLE_MAX_WORD_LENGTH")
+        return None if value is None else int(value)
+
+    @property
+    def UNSTRUCTURED_TITLE_NON_ALPHA_THRESHOLD(self) -> Optional[float]:
+        """Overrides the `non_alpha_threshold` argument of `is_possible_title()` when set"""
+        value = self._get_optional_string("UNSTRUCTURED_TITLE_NON_ALPHA_THRESHOLD")
+        return None if value is None else float(value)
+
+    @property
+    def UNSTRUCTURED_XY_CUT_BBOX_SHRINK_FACTOR(self) -> Optional[float]:
+        """Overrides the `shrink_factor` argument of the XY-cut element sorting when set"""
+        value = self._get_optional_string("UNSTRUCTURED_XY_CUT_BBOX_SHRINK_FACTOR")
+        return None if value is None else float(value)
+
+    @property
+    def UNSTRUCTURED_XY_CUT_PRIMARY_DIRECTION(self) -> Optional[str]:
+        """Overrides the `xy_cut_primary_direction` argument of the XY-cut element sorting when
+        set"""
+        return self._get_optional_string("UNSTRUCTURED_XY_CUT_PRIMARY_DIRECTION")
+
+    def reload(self) -> ENVConfigSnapshot:
+        """Resolve every setting from the os environment now, ignoring any pinned snapshot."""
+        return ENVConfigSnapshot(
+            **{
+                field.name: getattr(self, field.name)
+                for field in dataclasses.fields(ENVConfigSnapshot)
+            }
+        )
+
+    def snapshot(self) -> ENVConfigSnapshot:
+        """The settings in effect.
+
+        Inside a `pinned()` block this is the snapshot pinned for it, resolved at most once.
+        Otherwise each setting is resolved from the os environment when it is first read from the
+        returned snapshot, so hot paths should call this once, outside their loop.
+        """
+        pinned_snapshot = _pinned_snapshot.get()
+        return _EnvironSnapshot(self) if pinned_snapshot is None else pinned_snapshot()
+
+    @contextlib.contextmanager
+    def pinned(self, **overrides: Any) -> Iterator[None]:
+        """Use one snapshot of the settings for all calls made within the block.
+
+        The snapshot is resolved on first use within the block and a nested block reuses the
+        snapshot of the enclosing one. `overrides` replace individual settings for the block only,
+        e.g. `env_config.pinned(IMAGE_CROP_PAD=4)`. Because the snapshot is held in a context
+        variable, each thread or asyncio task can pin its own settings without mutating the
+        process environment.
+
+        Also usable as a decorator, which pins the settings for each call of the function.
+        """
+        if overrides:
+            snapshot = ENVConfigSnapshot(**{**dataclasses.asdict(self.snapshot()), **overrides})
+            token = _pinned_snapshot.set(lambda: snapshot)
+        elif _pinned_snapshot.get() is None:
+            token = _pinned_snapshot.set(lru_cache(maxsize=1)(self.reload))
+        else:
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            _pinned_snapshot.reset(token)
+
 
 env_config = ENVConfig()
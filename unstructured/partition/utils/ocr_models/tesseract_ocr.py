@@ -49,11 +49,12 @@ class OCRAgentTesseract(OCRAgent):
         """Get the OCR regions from image as a list of text regions with tesseract."""
 
         trace_logger.detail("Processing entire page OCR with tesseract...")
+        config = env_config.snapshot()
         zoom = 1
         ocr_df: pd.DataFrame = self.image_to_data_with_character_confidence_filter(
             np.array(image),
             lang=self.language,
-            character_confidence_threshold=env_config.TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD,
+            character_confidence_threshold=config.TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD,
         )
         ocr_df = ocr_df.dropna()
 
@@ -62,12 +63,10 @@ class OCRAgentTesseract(OCRAgent):
         # but this needs to be evaluated based on actual use case as the optimum scaling also
         # depend on type of characters (font, language, etc); be careful about this
         # functionality
-        text_height = ocr_df[TESSERACT_TEXT_HEIGHT].quantile(
-            env_config.TESSERACT_TEXT_HEIGHT_QUANTILE
-        )
+        text_height = ocr_df[TESSERACT_TEXT_HEIGHT].quantile(config.TESSERACT_TEXT_HEIGHT_QUANTILE)
         if (
-            text_height < env_config.TESSERACT_MIN_TEXT_HEIGHT
-            or text_height > env_config.TESSERACT_MAX_TEXT_HEIGHT
+            text_height < config.TESSERACT_MIN_TEXT_HEIGHT
+            or text_height > config.TESSERACT_MAX_TEXT_HEIGHT
         ):
             max_zoom = max(
                 0,
@@ -76,13 +75,13 @@ class OCRAgentTesseract(OCRAgent):
             # rounding avoids unnecessary precision and potential numerical issues associated
             # with numbers very close to 1 inside cv2 image processing
             zoom = min(
-                np.round(env_config.TESSERACT_OPTIMUM_TEXT_HEIGHT / text_height, 1),
+                np.round(config.TESSERACT_OPTIMUM_TEXT_HEIGHT / text_height, 1),
                 max_zoom,
             )
             ocr_df = self.image_to_data_with_character_confidence_filter(
                 np.array(zoom_image(image, zoom)),
                 lang=self.language,
-                character_confidence_threshold=env_config.TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD,
+                character_confidence_threshold=config.TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD,
             )
             ocr_df = ocr_df.dropna()
         ocr_regions = self.parse_data(ocr_df, zoom=zoom)
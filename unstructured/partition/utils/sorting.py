@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import os
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable
 
 import numpy as np
 
 from unstructured.documents.elements import CoordinatesMetadata, Element
 from unstructured.logger import trace_logger
+from unstructured.partition.utils.config import ENVConfigSnapshot, env_config
 from unstructured.partition.utils.constants import SORT_MODE_BASIC, SORT_MODE_XY_CUT
 from unstructured.partition.utils.xycut import recursive_xy_cut, recursive_xy_cut_swapped
 
@@ -121,15 +121,41 @@ def sort_page_elements(
     - list[Element]: A list of sorted page elements.
     """
 
-    shrink_factor = float(
-        os.environ.get("UNSTRUCTURED_XY_CUT_BBOX_SHRINK_FACTOR", shrink_factor),
+    settings = env_config.snapshot()
+    return _sort_page_elements(
+        page_elements,
+        sort_mode,
+        _xy_cut_shrink_factor(settings, shrink_factor),
+        _xy_cut_primary_direction(settings, xy_cut_primary_direction),
     )
 
-    xy_cut_primary_direction = os.environ.get(
-        "UNSTRUCTURED_XY_CUT_PRIMARY_DIRECTION",
-        xy_cut_primary_direction,
-    )
 
+def sort_document_elements(
+    pages: Iterable[list[Element]],
+    sort_mode: str = SORT_MODE_XY_CUT,
+    shrink_factor: float = 0.9,
+    xy_cut_primary_direction: str = "x",
+) -> list[list[Element]]:
+    """Sort the elements of each page in `pages`, as `sort_page_elements()` does.
+
+    The XY-cut settings are resolved once for the whole document rather than once per page.
+    """
+    settings = env_config.snapshot()
+    shrink_factor = _xy_cut_shrink_factor(settings, shrink_factor)
+    xy_cut_primary_direction = _xy_cut_primary_direction(settings, xy_cut_primary_direction)
+    return [
+        _sort_page_elements(page_elements, sort_mode, shrink_factor, xy_cut_primary_direction)
+        for page_elements in pages
+    ]
+
+
+def _sort_page_elements(
+    page_elements: list[Element],
+    sort_mode: str,
+    shrink_factor: float,
+    xy_cut_primary_direction: str,
+) -> list[Element]:
+    """Implementation of `sort_page_elements()` with its XY-cut settings already resolved."""
     if not page_elements:
         return []
 
@@ -155,20 +181,18 @@ def sort_page_elements(
     if sort_mode == SORT_MODE_XY_CUT:
         if not _coords_ok(strict_points=True):
             return page_elements
-        shrunken_bboxes = []
-        for coords in coordinates_list:
-            bbox = coordinates_to_bbox(coords)
-            shrunken_bbox = shrink_bbox(bbox, shrink_factor)
-            shrunken_bboxes.append(shrunken_bbox)
-
-        res: list[int] = []
-        xy_cut_sorting_func = (
-            recursive_xy_cut_swapped if xy_cut_primary_direction == "x" else recursive_xy_cut
-        )
-        xy_cut_sorting_func(
-            np.asarray(shrunken_bboxes).astype(int),
-            np.arange(len(shrunken_bboxes)),
-            res,
+        # -- (left, top, right, bottom) integer bboxes, as `coordinates_to_bbox()` makes them --
+        bboxes = np.array(
+            [
+                (points[0][0], points[0][1], points[2][0], points[2][1])
+                for points in (coords.points for coords in coordinates_list)
+            ],
+            dtype=float,
+        ).astype(int)
+        res = sort_bboxes_by_xy_cut(
+            bboxes,
+            shrink_factor=shrink_factor,
+            xy_cut_primary_direction=xy_cut_primary_direction,
         )
         sorted_page_elements = [page_elements[i] for i in res]
     elif sort_mode == SORT_MODE_BASIC:
@@ -194,23 +218,40 @@ def sort_bboxes_by_xy_cut(
 ):
     """Sort bounding boxes using XY-cut algorithm."""
 
-    shrunken_bboxes = []
-    for bbox in bboxes:
-        shrunken_bbox = shrink_bbox(bbox, shrink_factor)
-        shrunken_bboxes.append(shrunken_bbox)
-
     res: list[int] = []
     xy_cut_sorting_func = (
         recursive_xy_cut_swapped if xy_cut_primary_direction == "x" else recursive_xy_cut
     )
-    xy_cut_sorting_func(
-        np.asarray(shrunken_bboxes).astype(int),
-        np.arange(len(shrunken_bboxes)),
-        res,
-    )
+    shrunken_bboxes = _shrink_bboxes(np.asarray(bboxes, dtype=float), shrink_factor)
+    xy_cut_sorting_func(shrunken_bboxes, np.arange(len(shrunken_bboxes)), res)
     return res
 
 
+def _shrink_bboxes(bboxes: np.ndarray, shrink_factor: float) -> np.ndarray:
+    """Integer (N, 4) array of each of `bboxes` shrunk as `shrink_bbox()` would shrink it."""
+    left, top, right, bottom = bboxes.reshape(-1, 4).T
+    width = right - left
+    height = bottom - top
+    new_right = right - (width - width * shrink_factor)
+    new_bottom = bottom - (height - height * shrink_factor)
+    # -- `astype(int)` truncates toward zero, the same as `int()` --
+    return np.stack((left, top, new_right, new_bottom), axis=1).astype(int)
+
+
+def _xy_cut_shrink_factor(settings: ENVConfigSnapshot, shrink_factor: float) -> float:
+    """The XY-cut bbox shrink-factor, from the environment when it is set there."""
+    if settings.UNSTRUCTURED_XY_CUT_BBOX_SHRINK_FACTOR is None:
+        return float(shrink_factor)
+    return settings.UNSTRUCTURED_XY_CUT_BBOX_SHRINK_FACTOR
+
+
+def _xy_cut_primary_direction(settings: ENVConfigSnapshot, xy_cut_primary_direction: str) -> str:
+    """The XY-cut primary direction, from the environment when it is set there."""
+    if settings.UNSTRUCTURED_XY_CUT_PRIMARY_DIRECTION is None:
+        return xy_cut_primary_direction
+    return settings.UNSTRUCTURED_XY_CUT_PRIMARY_DIRECTION
+
+
 def sort_text_regions(
     elements: TextRegions,
     sort_mode: str = SORT_MODE_XY_CUT,
@@ -242,19 +283,11 @@ def sort_text_regions(
         if not _bboxes_ok(strict_points=True):
             return elements
 
-        shrink_factor = float(
-            os.environ.get("UNSTRUCTURED_XY_CUT_BBOX_SHRINK_FACTOR", shrink_factor),
-        )
-
-        xy_cut_primary_direction = os.environ.get(
-            "UNSTRUCTURED_XY_CUT_PRIMARY_DIRECTION",
-            xy_cut_primary_direction,
-        )
-
+        settings = env_config.snapshot()
         res = sort_bboxes_by_xy_cut(
             bboxes=bboxes,
-            shrink_factor=shrink_factor,
-            xy_cut_primary_direction=xy_cut_primary_direction,
+            shrink_factor=_xy_cut_shrink_factor(settings, shrink_factor),
+            xy_cut_primary_direction=_xy_cut_primary_direction(settings, xy_cut_primary_direction),
         )
         sorted_elements = elements.slice(res)
     elif sort_mode == SORT_MODE_BASIC:
@@ -30,9 +30,18 @@ def projection_by_bboxes(boxes: np.ndarray, axis: int) -> np.ndarray:
     assert axis in [0, 1]
     length = np.max(boxes[:, axis::2])
     res = np.zeros(length, dtype=int)
-    # TODO: how to remove for loop?
-    for start, end in boxes[:, axis::2]:
-        res[start:end] += 1
+    starts, ends = boxes[:, axis], boxes[:, axis + 2]
+    # -- negative coordinates index from the end, the same as they would in a slice --
+    if (starts < 0).any() or (ends < 0).any():
+        starts = np.where(starts < 0, np.maximum(starts + length, 0), starts)
+        ends = np.where(ends < 0, np.maximum(ends + length, 0), ends)
+    # -- difference array: +1 where each box starts and -1 where it ends, an empty range adds
+    # -- nothing; the running sum is then the number of boxes covering each position.
+    non_empty = starts < ends
+    diff = np.bincount(starts[non_empty], minlength=length + 1) - np.bincount(
+        ends[non_empty], minlength=length + 1
+    )
+    np.cumsum(diff[:length], out=res)
     return res
 
 
@@ -93,53 +102,8 @@ def recursive_xy_cut(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
         res: save output
 
     """
-    # project to the y-axis
-    assert len(boxes) == len(indices)
-
-    _indices = boxes[:, 1].argsort()
-    y_sorted_boxes = boxes[_indices]
-    y_sorted_indices = indices[_indices]
-
-    # debug_vis(y_sorted_boxes, y_sorted_indices)
-
-    y_projection = projection_by_bboxes(boxes=y_sorted_boxes, axis=1)
-    pos_y = split_projection_profile(y_projection, 0, 1)
-    if not pos_y:
-        return
-
-    arr_y0, arr_y1 = pos_y
-    for r0, r1 in zip(arr_y0, arr_y1):
-        # [r0, r1] means that the areas with bbox will be divided horizontally, and these areas
-        # will be divided vertically.
-        _indices = (r0 <= y_sorted_boxes[:, 1]) & (y_sorted_boxes[:, 1] < r1)
-
-        y_sorted_boxes_chunk = y_sorted_boxes[_indices]
-        y_sorted_indices_chunk = y_sorted_indices[_indices]
-
-        _indices = y_sorted_boxes_chunk[:, 0].argsort()
-        x_sorted_boxes_chunk = y_sorted_boxes_chunk[_indices]
-        x_sorted_indices_chunk = y_sorted_indices_chunk[_indices]
-
-        # project in the x direction
-        x_projection = projection_by_bboxes(boxes=x_sorted_boxes_chunk, axis=0)
-        pos_x = split_projection_profile(x_projection, 0, 1)
-        if not pos_x:
-            continue
-
-        arr_x0, arr_x1 = pos_x
-        if len(arr_x0) == 1:
-            # x-direction cannot be divided
-            res.extend(x_sorted_indices_chunk)
-            continue
-
-        # can be separated in the x-direction and continue to call recursively
-        for c0, c1 in zip(arr_x0, arr_x1):
-            _indices = (c0 <= x_sorted_boxes_chunk[:, 0]) & (x_sorted_boxes_chunk[:, 0] < c1)
-            recursive_xy_cut(
-                x_sorted_boxes_chunk[_indices],
-                x_sorted_indices_chunk[_indices],
-                res,
-            )
+    # project to the y-axis first, then the x-axis
+    _xy_cut(boxes, indices, res, primary_axis=1)
 
 
 def recursive_xy_cut_swapped(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
@@ -150,56 +114,104 @@ def recursive_xy_cut_swapped(boxes: np.ndarray, indices: np.ndarray, res: List[i
         indices: An array representing indices that correspond to boxes in the original data
         res: A list to save the output results
     """
+    # project to the x-axis first, then the y-axis
+    _xy_cut(boxes, indices, res, primary_axis=0)
 
-    # Sort the bounding boxes based on x-coordinates (flipped)
-    assert len(boxes) == len(indices)
-    _indices = boxes[:, 0].argsort()
-    x_sorted_boxes = boxes[_indices]
-    x_sorted_indices = indices[_indices]
 
-    # Project the boxes onto the x-axis and split the projection profile
-    x_projection = projection_by_bboxes(boxes=x_sorted_boxes, axis=0)
-    pos_x = split_projection_profile(x_projection, 0, 1)
+def _xy_cut(boxes: np.ndarray, indices: np.ndarray, res: List[int], primary_axis: int):
+    """Append the indices of `boxes` to `res` in XY-cut reading order.
 
-    if not pos_x:
-        return
+    The boxes are split into bands along `primary_axis` and each band into blocks along the other
+    axis. A band that cannot be split further is emitted in order of its boxes along the other
+    axis; otherwise each of its blocks is cut again the same way. Regions still to be cut are kept
+    on an explicit stack rather than the call stack, so the depth of the cut is not limited by the
+    recursion limit.
+    """
+    assert len(boxes) == len(indices)
+    secondary_axis = 1 - primary_axis
+
+    # -- each work item is either a region still to be cut, as (boxes, indices), or the indices of
+    # -- a band that is already in reading order, as (None, indices). Items are pushed in reverse
+    # -- so they are popped, and emitted, in reading order.
+    stack: List[tuple] = [(boxes, indices)]
+    while stack:
+        boxes, indices = stack.pop()
+        if boxes is None:
+            res.extend(indices)
+            continue
+
+        # -- split the region into bands along the primary axis --
+        _indices = boxes[:, primary_axis].argsort()
+        sorted_boxes = boxes[_indices]
+        sorted_indices = indices[_indices]
+        pos = _split_sorted_boxes(sorted_boxes, primary_axis)
+        if not pos:
+            continue
 
-    arr_x0, arr_x1 = pos_x
+        work_items: List[tuple] = []
+        for band_boxes, band_indices in _slice_sorted_boxes(
+            sorted_boxes, sorted_indices, primary_axis, pos
+        ):
+            # -- split the band into blocks along the secondary axis --
+            _indices = band_boxes[:, secondary_axis].argsort()
+            band_boxes = band_boxes[_indices]
+            band_indices = band_indices[_indices]
+            band_pos = _split_sorted_boxes(band_boxes, secondary_axis)
+            if not band_pos:
+                continue
+
+            if len(band_pos[0]) == 1:
+                # -- the band cannot be divided, it is already in reading order --
+                work_items.append((None, band_indices))
+                continue
+
+            work_items.extend(
+                _slice_sorted_boxes(band_boxes, band_indices, secondary_axis, band_pos)
+            )
 
-    # Loop over the segments obtained from the x-axis projection
-    for c0, c1 in zip(arr_x0, arr_x1):
-        # Obtain sub-boxes in the x-axis segment
-        _indices = (c0 <= x_sorted_boxes[:, 0]) & (x_sorted_boxes[:, 0] < c1)
-        x_sorted_boxes_chunk = x_sorted_boxes[_indices]
-        x_sorted_indices_chunk = x_sorted_indices[_indices]
+        stack.extend(reversed(work_items))
 
-        # Sort the sub-boxes based on y-coordinates (flipped)
-        _indices = x_sorted_boxes_chunk[:, 1].argsort()
-        y_sorted_boxes_chunk = x_sorted_boxes_chunk[_indices]
-        y_sorted_indices_chunk = x_sorted_indices_chunk[_indices]
 
-        # Project the sub-boxes onto the y-axis and split the projection profile
-        y_projection = projection_by_bboxes(boxes=y_sorted_boxes_chunk, axis=1)
-        pos_y = split_projection_profile(y_projection, 0, 1)
+def _split_sorted_boxes(sorted_boxes: np.ndarray, axis: int):
+    """Same as `split_projection_profile(projection_by_bboxes(sorted_boxes, axis), 0, 1)`.
 
-        if not pos_y:
-            continue
+    `sorted_boxes` must be sorted by their start coordinate on `axis`. The covered ranges of the
+    projection are then the union of the box extents, which is found by merging those extents in
+    order, without building a histogram as long as the page is wide or tall.
+    """
+    starts, ends = sorted_boxes[:, axis], sorted_boxes[:, axis + 2]
+    # -- negative coordinates are indexed from the end by the projection, leave those to it --
+    if not len(starts) or starts[0] < 0 or (ends < 0).any():
+        return split_projection_profile(projection_by_bboxes(boxes=sorted_boxes, axis=axis), 0, 1)
+
+    non_empty = starts < ends
+    if not non_empty.all():
+        starts, ends = starts[non_empty], ends[non_empty]
+    if not len(starts):
+        return None
+
+    # -- a new range starts wherever a box starts beyond all the boxes before it; a box that starts
+    # -- right where the covered range ends leaves no gap, so it extends that range --
+    covered_to = np.maximum.accumulate(ends)
+    is_gap = starts[1:] > covered_to[:-1]
+    return (
+        starts[np.concatenate(([True], is_gap))],
+        covered_to[np.concatenate((is_gap, [True]))],
+    )
 
-        arr_y0, arr_y1 = pos_y
 
-        if len(arr_y0) == 1:
-            # If there's no splitting along the y-axis, add the indices to the result
-            res.extend(y_sorted_indices_chunk)
-            continue
+def _slice_sorted_boxes(
+    sorted_boxes: np.ndarray, sorted_indices: np.ndarray, axis: int, pos: tuple
+) -> List[tuple]:
+    """(boxes, indices) of `sorted_boxes` that start within each range of `pos` on `axis`.
 
-        # Recursive call for sub-boxes along the y-axis segments
-        for r0, r1 in zip(arr_y0, arr_y1):
-            _indices = (r0 <= y_sorted_boxes_chunk[:, 1]) & (y_sorted_boxes_chunk[:, 1] < r1)
-            recursive_xy_cut_swapped(
-                y_sorted_boxes_chunk[_indices],
-                y_sorted_indices_chunk[_indices],
-                res,
-            )
+    Because the boxes are sorted by that start coordinate, the boxes of each range are a
+    contiguous slice.
+    """
+    starts = sorted_boxes[:, axis]
+    lo = np.searchsorted(starts, pos[0], side="left")
+    hi = np.searchsorted(starts, pos[1], side="left")
+    return [(sorted_boxes[i:j], sorted_indices[i:j]) for i, j in zip(lo, hi)]
 
 
 def points_to_bbox(points):
@@ -0,0 +1,299 @@
+"""Columnar (Apache Arrow / Parquet) serialization of document elements.
+
+Unlike `convert_to_dataframe()`, which builds a dict per element, deep-copies its metadata and
+flattens it before constructing a DataFrame, the writer here builds Arrow record batches directly
+from `Element` and `ElementMetadata` attributes, one bounded batch at a time. Each batch becomes a
+Parquet row-group and the reader rehydrates elements lazily, one row-group at a time.
+
+Frequently-queried metadata fields get their own typed column. Structured and ad-hoc metadata
+fields that have no natural columnar form (`data_source`, `links`, `orig_elements`,
+`key_value_pairs`, `table_as_cells`, user-defined fields) are stored as a JSON object in the
+`metadata_json` column so they survive a round-trip.
+
+Embeddings are stored as float32 and always come back as float32 arrays, whatever form they had
+when written. An element whose embeddings were a `list[float]` therefore does not compare equal to
+its rehydrated counterpart, and its values come back rounded to float32 precision.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from typing import Any, Iterable, Iterator
+
+from unstructured.documents.elements import (
+    TYPE_TO_TEXT_ELEMENT_MAP,
+    CheckBox,
+    CoordinatesMetadata,
+    Element,
+    ElementMetadata,
+)
+from unstructured.utils import dependency_exists, requires_dependencies
+
+if dependency_exists("pyarrow"):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+DEFAULT_BATCH_SIZE = 10_000
+
+# -- metadata fields stored in their own typed column, by Arrow type --
+_STR_FIELDS = (
+    "attached_to_filename",
+    "email_message_id",
+    "file_directory",
+    "filename",
+    "filetype",
+    "header_footer_type",
+    "image_base64",
+    "image_mime_type",
+    "image_path",
+    "image_url",
+    "last_modified",
+    "page_name",
+    "parent_id",
+    "signature",
+    "subject",
+    "text_as_html",
+    "url",
+)
+_INT_FIELDS = ("category_depth", "page_number")
+_FLOAT_FIELDS = ("detection_class_prob",)
+_BOOL_FIELDS = ("is_continuation",)
+_STR_LIST_FIELDS = (
+    "bcc_recipient",
+    "cc_recipient",
+    "emphasized_text_contents",
+    "emphasized_text_tags",
+    "languages",
+    "link_texts",
+    "link_urls",
+    "sent_from",
+    "sent_to",
+)
+_INT_LIST_FIELDS = ("link_start_indexes",)
+_COORDINATES_COLUMNS = (
+    "coordinates_points",
+    "coordinates_system",
+    "coordinates_layout_width",
+    "coordinates_layout_height",
+)
+_COLUMNAR_SCALAR_FIELDS = _STR_FIELDS + _INT_FIELDS + _FLOAT_FIELDS + _BOOL_FIELDS
+_ALL_COLUMN_NAMES = (
+    ("type", "element_id", "text", "checked", "embeddings")
+    + _COLUMNAR_SCALAR_FIELDS
+    + _STR_LIST_FIELDS
+    + _INT_LIST_FIELDS
+    + _COORDINATES_COLUMNS
+    + ("metadata_json",)
+)
+# -- metadata fields that do *not* go in `metadata_json` --
+_COLUMNAR_FIELDS = frozenset(
+    _STR_FIELDS
+    + _INT_FIELDS
+    + _FLOAT_FIELDS
+    + _BOOL_FIELDS
+    + _STR_LIST_FIELDS
+    + _INT_LIST_FIELDS
+    + ("coordinates",)
+)
+
+
+@requires_dependencies(["pyarrow"], extras="parquet")
+def elements_arrow_schema() -> "pa.Schema":
+    """The Arrow schema shared by every record batch produced by this module."""
+    return pa.schema(
+        [
+            ("type", pa.string()),
+            ("element_id", pa.string()),
+            ("text", pa.string()),
+            ("checked", pa.bool_()),
+            ("embeddings", pa.list_(pa.float32())),
+            *((name, pa.string()) for name in _STR_FIELDS),
+            *((name, pa.int64()) for name in _INT_FIELDS),
+            *((name, pa.float64()) for name in _FLOAT_FIELDS),
+            *((name, pa.bool_()) for name in _BOOL_FIELDS),
+            *((name, pa.list_(pa.string())) for name in _STR_LIST_FIELDS),
+            *((name, pa.list_(pa.int64())) for name in _INT_LIST_FIELDS),
+            ("coordinates_points", pa.list_(pa.list_(pa.float64()))),
+            ("coordinates_system", pa.string()),
+            ("coordinates_layout_width", pa.float64()),
+            ("coordinates_layout_height", pa.float64()),
+            ("metadata_json", pa.string()),
+        ]
+    )
+
+
+# ================================================================================================
+# WRITERS
+# ================================================================================================
+
+
+@requires_dependencies(["pyarrow"], extras="parquet")
+def elements_to_arrow_batches(
+    elements: Iterable[Element], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator["pa.RecordBatch"]:
+    """Generate Arrow record-batches of at most `batch_size` rows from `elements`.
+
+    `elements` is consumed incrementally so only one batch of rows is materialized at a time.
+    """
+    schema = elements_arrow_schema()
+    element_iter = iter(elements)
+    while batch := list(itertools.islice(element_iter, batch_size)):
+        columns = _columns_from_elements(batch)
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(columns[field.name], type=field.type) for field in schema], schema=schema
+        )
+
+
+@requires_dependencies(["pyarrow"], extras="parquet")
+def elements_to_parquet(
+    elements: Iterable[Element], filename: str, batch_size: int = DEFAULT_BATCH_SIZE
+) -> None:
+    """Write `elements` to a Parquet file at `filename`.
+
+    Each batch of `batch_size` elements is written as its own row-group, which is the unit
+    `iter_elements_from_parquet()` reads back.
+    """
+    with pq.ParquetWriter(filename, elements_arrow_schema()) as writer:
+        for batch in elements_to_arrow_batches(elements, batch_size):
+            writer.write_batch(batch, row_group_size=batch_size)
+
+
+def _columns_from_elements(elements: list[Element]) -> dict[str, list[Any]]:
+    """Column-name to column-values mapping for `elements`, read directly from attributes."""
+    columns: dict[str, list[Any]] = {field_name: [] for field_name in _ALL_COLUMN_NAMES}
+
+    for element in elements:
+        is_checkbox = isinstance(element, CheckBox)
+        columns["type"].append("CheckBox" if is_checkbox else element.category)
+        columns["element_id"].append(element.id)
+        columns["text"].append(None if is_checkbox else element.text)
+        columns["checked"].append(element.checked if is_checkbox else None)
+        embeddings = getattr(element, "embeddings", None)
+        columns["embeddings"].append(
+            embeddings if embeddings is not None and len(embeddings) else None
+        )
+
+        fields = element.metadata.fields
+        for field_name in _COLUMNAR_SCALAR_FIELDS:
+            columns[field_name].append(fields.get(field_name))
+        for field_name in _STR_LIST_FIELDS + _INT_LIST_FIELDS:
+            # -- empty lists are not serialized, same as `ElementMetadata.to_dict()` --
+            columns[field_name].append(fields.get(field_name) or None)
+
+        coordinates = fields.get("coordinates")
+        system = None if coordinates is None else coordinates.system
+        columns["coordinates_points"].append(None if coordinates is None else coordinates.points)
+        columns["coordinates_system"].append(None if system is None else type(system).__name__)
+        columns["coordinates_layout_width"].append(None if system is None else system.width)
+        columns["coordinates_layout_height"].append(None if system is None else system.height)
+
+        columns["metadata_json"].append(_remainder_metadata_json(fields))
+
+    return columns
+
+
+def _remainder_metadata_json(fields: Any) -> str | None:
+    """JSON of the metadata fields that have no column of their own, None when there are none."""
+    remainder = {k: v for k, v in fields.items() if k not in _COLUMNAR_FIELDS}
+    if not remainder:
+        return None
+    # -- let `ElementMetadata` handle serializing its sub-objects, like `orig_elements` --
+    remainder_metadata = ElementMetadata()
+    for field_name, value in remainder.items():
+        setattr(remainder_metadata, field_name, value)
+    meta_dict = remainder_metadata.to_dict()
+    return json.dumps(meta_dict, sort_keys=True) if meta_dict else None
+
+
+# ================================================================================================
+# READERS
+# ================================================================================================
+
+
+@requires_dependencies(["pyarrow"], extras="parquet")
+def iter_elements_from_parquet(filename: str) -> Iterator[Element]:
+    """Generate elements from a Parquet file written by `elements_to_parquet()`.
+
+    Row-groups are read one at a time so memory use is bounded by the row-group size rather than
+    the size of the file.
+    """
+    parquet_file = pq.ParquetFile(filename)
+    for row_group_idx in range(parquet_file.num_row_groups):
+        for batch in parquet_file.read_row_group(row_group_idx).to_batches():
+            yield from elements_from_arrow_batch(batch)
+
+
+@requires_dependencies(["pyarrow"], extras="parquet")
+def elements_from_parquet(filename: str) -> list[Element]:
+    """Load all elements from a Parquet file written by `elements_to_parquet()`."""
+    return list(iter_elements_from_parquet(filename))
+
+
+@requires_dependencies(["pyarrow"], extras="parquet")
+def elements_from_arrow_batch(batch: "pa.RecordBatch") -> list[Element]:
+    """Rehydrate the elements in an Arrow record-batch produced by `elements_to_arrow_batches()`.
+
+    Metadata is built directly from the column values; only the `metadata_json` remainder goes
+    through `ElementMetadata.from_dict()`, for its sub-objects like `data_source`.
+    """
+    columns = {name: batch.column(name).to_pylist() for name in _ALL_COLUMN_NAMES[:-1]}
+    metadata_jsons = batch.column("metadata_json").to_pylist()
+    embeddings_by_row = _embeddings_from_column(batch.column("embeddings"))
+
+    elements: list[Element] = []
+    for row_idx, metadata_json in enumerate(metadata_jsons):
+        metadata = (
+            ElementMetadata()
+            if metadata_json is None
+            else ElementMetadata.from_dict(json.loads(metadata_json))
+        )
+        for field_name in _COLUMNAR_SCALAR_FIELDS + _STR_LIST_FIELDS + _INT_LIST_FIELDS:
+            value = columns[field_name][row_idx]
+            if value is not None:
+                setattr(metadata, field_name, value)
+        if (points := columns["coordinates_points"][row_idx]) is not None:
+            metadata.coordinates = CoordinatesMetadata.from_dict(
+                {
+                    "points": points,
+                    **{
+                        name[len("coordinates_") :]: columns[name][row_idx]
+                        for name in _COORDINATES_COLUMNS[1:]
+                    },
+                }
+            )
+
+        element_type = columns["type"][row_idx]
+        element_id = columns["element_id"][row_idx]
+        if element_type == "CheckBox":
+            elements.append(
+                CheckBox(
+                    checked=columns["checked"][row_idx], element_id=element_id, metadata=metadata
+                )
+            )
+        elif element_type in TYPE_TO_TEXT_ELEMENT_MAP:
+            elements.append(
+                TYPE_TO_TEXT_ELEMENT_MAP[element_type](
+                    text=columns["text"][row_idx],
+                    element_id=element_id,
+                    metadata=metadata,
+                    embeddings=embeddings_by_row[row_idx],
+                )
+            )
+
+    return elements
+
+
+def _embeddings_from_column(column: "pa.ListArray") -> list[Any]:
+    """A float32 array (or None) for each row of the `embeddings` column.
+
+    The arrays are views into the column's single values buffer rather than one list of boxed
+    Python floats per row.
+    """
+    values = column.values.to_numpy(zero_copy_only=False)
+    # -- `.offsets` accounts for any slice offset of `column` while `.values` does not --
+    offsets = column.offsets.to_numpy()
+    return [
+        None if is_null else values[offsets[row_idx] : offsets[row_idx + 1]]
+        for row_idx, is_null in enumerate(column.is_null().to_pylist())
+    ]
@@ -7,7 +7,9 @@ import json
 import zlib
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Iterable, Optional, Sequence, cast
+from typing import Any, Iterable, Literal, Optional, Sequence, cast
+
+from typing_extensions import TypeAlias
 
 from unstructured.documents.coordinates import PixelSpace
 from unstructured.documents.elements import (
@@ -15,6 +17,7 @@ from unstructured.documents.elements import (
     CheckBox,
     Element,
     ElementMetadata,
+    Embeddings,
 )
 from unstructured.file_utils.ndjson import dumps as ndjson_dumps
 from unstructured.partition.common.common import exactly_one
@@ -23,6 +26,11 @@ from unstructured.utils import Point, dependency_exists, requires_dependencies
 if dependency_exists("pandas"):
     import pandas as pd
 
+# -- "list" serializes an embedding vector as a JSON array of floats, "base64" as the Base64-encoded
+# -- bytes of a little-endian float32 array, which is about a quarter the size and much faster to
+# -- parse.
+EmbeddingsFormat: TypeAlias = Literal["list", "base64"]
+
 # ================================================================================================
 # SERIALIZATION/DESERIALIZATION (SERDE) RELATED FUNCTIONS
 # ================================================================================================
@@ -65,7 +73,14 @@ def elements_from_dicts(element_dicts: Iterable[dict[str, Any]]) -> list[Element
 
         if item.get("type") in TYPE_TO_TEXT_ELEMENT_MAP:
             ElementCls = TYPE_TO_TEXT_ELEMENT_MAP[item["type"]]
-            elements.append(ElementCls(text=item["text"], element_id=element_id, metadata=metadata))
+            elements.append(
+                ElementCls(
+                    text=item["text"],
+                    element_id=element_id,
+                    metadata=metadata,
+                    embeddings=_embeddings_from_serializable(item.get("embeddings")),
+                )
+            )
         elif item.get("type") == "CheckBox":
             elements.append(
                 CheckBox(checked=item["checked"], element_id=element_id, metadata=metadata)
@@ -94,6 +109,19 @@ def elements_from_json(
     return elements_from_dicts(element_dicts)
 
 
+def _embeddings_from_serializable(value: Optional[list[float] | str]) -> Optional[Embeddings]:
+    """Restore an embedding vector serialized in either `EmbeddingsFormat`.
+
+    A Base64 str is decoded to a float32 array holding exactly the values that were serialized.
+    """
+    if not isinstance(value, str):
+        return value
+
+    import numpy as np
+
+    return np.frombuffer(base64.b64decode(value), dtype="<f4").astype(np.float32)
+
+
 # == SERIALIZERS =================================
 
 
@@ -119,9 +147,27 @@ def elements_to_base64_gzipped_json(elements: Iterable[Element]) -> str:
     return b64_deflated_bytes.decode("utf-8")
 
 
-def elements_to_dicts(elements: Iterable[Element]) -> list[dict[str, Any]]:
-    """Convert document elements to element-dicts."""
-    return [e.to_dict() for e in elements]
+def elements_to_dicts(
+    elements: Iterable[Element], embeddings_format: EmbeddingsFormat = "list"
+) -> list[dict[str, Any]]:
+    """Convert document elements to element-dicts.
+
+    Embedding vectors are serialized as a list of floats by default. Use
+    `embeddings_format="base64"` for a compact str form; either form is restored by
+    `elements_from_dicts()`.
+    """
+    if embeddings_format == "list":
+        return [e.to_dict() for e in elements]
+    if embeddings_format != "base64":
+        raise ValueError(f"embeddings_format must be 'list' or 'base64', got {embeddings_format!r}")
+
+    element_dicts: list[dict[str, Any]] = []
+    for e in elements:
+        element_dict = e.to_dict()
+        if "embeddings" in element_dict:
+            element_dict["embeddings"] = _embeddings_to_base64(getattr(e, "embeddings"))
+        element_dicts.append(element_dict)
+    return element_dicts
 
 
 # -- legacy aliases for elements_to_dicts() --
@@ -129,11 +175,19 @@ convert_to_isd = elements_to_dicts
 convert_to_dict = elements_to_dicts
 
 
+def _embeddings_to_base64(embeddings: Embeddings) -> str:
+    """Base64-encode `embeddings` as the bytes of a little-endian float32 array."""
+    import numpy as np
+
+    return base64.b64encode(np.asarray(embeddings, dtype="<f4").tobytes()).decode("utf-8")
+
+
 def elements_to_json(
     elements: Iterable[Element],
     filename: Optional[str] = None,
     indent: int = 4,
     encoding: str = "utf-8",
+    embeddings_format: EmbeddingsFormat = "list",
 ) -> str:
     """Serialize `elements` to a JSON array.
 
@@ -143,7 +197,7 @@ def elements_to_json(
     """
     # -- serialize `elements` as a JSON array (str) --
     precision_adjusted_elements = _fix_metadata_field_precision(elements)
-    element_dicts = elements_to_dicts(precision_adjusted_elements)
+    element_dicts = elements_to_dicts(precision_adjusted_elements, embeddings_format)
     json_str = json.dumps(element_dicts, indent=indent, sort_keys=True)
 
     if filename is not None:
@@ -157,6 +211,7 @@ def elements_to_ndjson(
     elements: Iterable[Element],
     filename: Optional[str] = None,
     encoding: str = "utf-8",
+    embeddings_format: EmbeddingsFormat = "list",
 ) -> str:
     """Serialize `elements` to a JSON array.
 
@@ -166,7 +221,7 @@ def elements_to_ndjson(
     """
     # -- serialize `elements` as a JSON array (str) --
     precision_adjusted_elements = _fix_metadata_field_precision(elements)
-    element_dicts = elements_to_dicts(precision_adjusted_elements)
+    element_dicts = elements_to_dicts(precision_adjusted_elements, embeddings_format)
     ndjson_str = ndjson_dumps(element_dicts, sort_keys=True)
 
     if filename is not None:
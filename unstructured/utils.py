@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import functools
 import importlib
 import inspect
@@ -26,7 +27,6 @@ from typing import (
     cast,
 )
 
-import requests
 from typing_extensions import ParamSpec, TypeAlias
 
 from unstructured.__version__ import __version__
@@ -51,14 +51,30 @@ def get_call_args_applying_defaults(
     **kwargs: _P.kwargs,
 ) -> dict[str, Any]:
     """Map both explicit and default arguments of decorated func call by param name."""
-    sig = inspect.signature(func)
-    call_args: dict[str, Any] = dict(**dict(zip(sig.parameters, args)), **kwargs)
-    for arg in sig.parameters.values():
-        if arg.name not in call_args and arg.default is not arg.empty:
-            call_args[arg.name] = arg.default
+    param_names, param_defaults = _get_param_names_and_defaults(func)
+    call_args: dict[str, Any] = dict(**dict(zip(param_names, args)), **kwargs)
+    for name, default in param_defaults:
+        if name not in call_args:
+            call_args[name] = default
     return call_args
 
 
+@functools.lru_cache(maxsize=256)
+def _get_param_names_and_defaults(
+    func: Callable[..., Any],
+) -> tuple[tuple[str, ...], tuple[tuple[str, Any], ...]]:
+    """Parameter names of `func` and (name, default) pairs for those parameters having a default.
+
+    `inspect.signature()` is comparatively expensive and the partitioning decorators need this for
+    every call, so it is computed once per function. Callers must not mutate default values.
+    """
+    parameters = inspect.signature(func).parameters
+    return (
+        tuple(parameters),
+        tuple((p.name, p.default) for p in parameters.values() if p.default is not p.empty),
+    )
+
+
 def is_temp_file_path(file_path: str) -> bool:
     """True when file_path is in the Python-defined tempdir.
 
@@ -269,6 +285,16 @@ def only(it: Iterable[Any]) -> Any:
 
 
 def scarf_analytics():
+    """Report anonymous usage data unless opted out with `SCARF_NO_ANALYTICS` or `DO_NOT_TRACK`.
+
+    This probes for a GPU and makes an HTTP request so it can take several seconds. It is called
+    from a background thread when `unstructured.logger` is imported, so it never blocks import.
+    """
+    if os.getenv("SCARF_NO_ANALYTICS") == "true" or os.getenv("DO_NOT_TRACK") == "true":
+        return
+
+    import requests
+
     try:
         subprocess.check_output("nvidia-smi")
         gpu_present = True
@@ -277,40 +303,21 @@ def scarf_analytics():
 
     python_version = ".".join(platform.python_version().split(".")[:2])
 
-    try:
-        if os.getenv("SCARF_NO_ANALYTICS") != "true" and os.getenv("DO_NOT_TRACK") != "true":
-            if "dev" in __version__:
-                requests.get(
-                    "https://packages.unstructured.io/python-telemetry?version="
-                    + __version__
-                    + "&platform="
-                    + platform.system()
-                    + "&python"
-                    + python_version
-                    + "&arch="
-                    + platform.machine()
-                    + "&gpu="
-                    + str(gpu_present)
-                    + "&dev=true",
-                    timeout=10,
-                )
-            else:
-                requests.get(
-                    "https://packages.unstructured.io/python-telemetry?version="
-                    + __version__
-                    + "&platform="
-                    + platform.system()
-                    + "&python"
-                    + python_version
-                    + "&arch="
-                    + platform.machine()
-                    + "&gpu="
-                    + str(gpu_present)
-                    + "&dev=false",
-                    timeout=10,
-                )
-    except Exception:
-        pass
+    with contextlib.suppress(Exception):
+        requests.get(
+            "https://packages.unstructured.io/python-telemetry?version="
+            + __version__
+            + "&platform="
+            + platform.system()
+            + "&python"
+            + python_version
+            + "&arch="
+            + platform.machine()
+            + "&gpu="
+            + str(gpu_present)
+            + ("&dev=true" if "dev" in __version__ else "&dev=false"),
+            timeout=10,
+        )
 
 
 def ngrams(s: list[str], n: int) -> list[tuple[str, ...]]:
@@ -701,15 +708,26 @@ def catch_overlapping_and_nested_bboxes(
         zip(pages_of_bboxes, text_labels, text_content),
         start=1,
     ):
-        page_bboxes_combinations = list(combinations(page_bboxes, 2))
-        page_labels_combinations = list(combinations(page_labels, 2))
-        text_content_combinations = list(combinations(page_text, 2))
-
-        for box_pair, label_pair, text_pair in zip(
-            page_bboxes_combinations,
-            page_labels_combinations,
-            text_content_combinations,
-        ):
+        if len(page_bboxes) == len(page_labels):
+            # -- only boxes that intersect can overlap or nest, don't examine every pair --
+            pairs = _intersecting_bbox_pairs(page_bboxes)
+            page_pairs = (
+                (
+                    (page_bboxes[i], page_bboxes[j]),
+                    (page_labels[i], page_labels[j]),
+                    (page_text[i], page_text[j]),
+                )
+                for i, j in pairs
+            )
+        else:
+            # -- some elements on this page have no coordinates, pair them up as before --
+            page_pairs = zip(
+                combinations(page_bboxes, 2),
+                combinations(page_labels, 2),
+                combinations(page_text, 2),
+            )
+
+        for box_pair, label_pair, text_pair in page_pairs:
             (
                 overlapping_elements,
                 parent_element,
@@ -749,6 +767,44 @@ def catch_overlapping_and_nested_bboxes(
     return document_with_overlapping_flag, overlapping_cases
 
 
+def _intersecting_bbox_pairs(bboxes: list[Points]) -> list[tuple[int, int]]:
+    """Index pairs `(i, j)`, `i < j`, of `bboxes` whose extents intersect, in lexicographic order.
+
+    Two boxes can only overlap or nest when their extents intersect on both axes, so these are all
+    the pairs `identify_overlapping_or_nesting_case()` can report on (plus boxes that merely touch,
+    which it rejects). Boxes are swept in order of their top edge; the boxes that can intersect a
+    box on the vertical axis are those starting at or above its bottom edge, found by binary
+    search, and those are filtered on the horizontal axis. The cost is O(n log n) plus the number
+    of vertically intersecting pairs rather than O(n²).
+    """
+    import numpy as np
+
+    if len(bboxes) < 2:
+        return []
+
+    # -- corners as `identify_overlapping_or_nesting_case()` reads them, in either order --
+    corners = np.array([(*box[0], *box[2]) for box in bboxes], dtype=float)
+    x_min = np.minimum(corners[:, 0], corners[:, 2])
+    x_max = np.maximum(corners[:, 0], corners[:, 2])
+    y_min = np.minimum(corners[:, 1], corners[:, 3])
+    y_max = np.maximum(corners[:, 1], corners[:, 3])
+
+    order = np.argsort(y_min, kind="stable")
+    # -- position in `order` just past the last box that starts at or above each box's bottom --
+    sweep_ends = np.searchsorted(y_min[order], y_max[order], side="right")
+
+    pairs: list[tuple[int, int]] = []
+    for position, (i, sweep_end) in enumerate(zip(order.tolist(), sweep_ends.tolist())):
+        if sweep_end <= position + 1:
+            continue
+        candidates = order[position + 1 : sweep_end]
+        candidates = candidates[(x_min[candidates] <= x_max[i]) & (x_min[i] <= x_max[candidates])]
+        pairs.extend((i, j) if i < j else (j, i) for j in candidates.tolist())
+
+    pairs.sort()
+    return pairs
+
+
 class FileHandler:
     def __init__(self, file_path: str):
         self.file_path = file_path